@@ -14,21 +14,22 @@ code와 url만 남긴 정제된 데이터를 생성합니다.
 - url (대학 상세 페이지 URL)
 """
 
-import json
 from pathlib import Path
 
+from json_io import load_json, write_json
 
-def preprocess_university_data(input_path, output_path):
+
+def preprocess_university_data(input_path, output_path, output_format="pretty"):
     """
     대학 접속 정보에서 불필요한 항목 제거
     
     Args:
         input_path: 원본 JSON 파일 경로
         output_path: 전처리된 JSON 파일 저장 경로
+        output_format: 저장 형식 ("pretty" / "compact" / "zstd", json_io.py)
     """
     # 원본 데이터 로드
-    with open(input_path, 'r', encoding='utf-8') as f:
-        original_data = json.load(f)
+    original_data = load_json(input_path)
     
     # 전처리: status_code, accessible, response_time_ms 제거
     preprocessed_data = {}
@@ -42,9 +43,7 @@ def preprocess_university_data(input_path, output_path):
         }
     
     # 전처리된 데이터 저장
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(preprocessed_data, f, ensure_ascii=False, indent=2)
+    output_path = write_json(preprocessed_data, output_path, output_format, indent=2)
     
     # 통계 출력
     print("=" * 60)
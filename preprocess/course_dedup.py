@@ -0,0 +1,63 @@
+"""
+학기 간 과목 중복 제거
+
+학기별로 따로 크롤링한 파일(hanyang_syllabus_1_v2.json / _2_v2.json 등)을 이어 붙이면
+같은 과목이 학기마다 반복됩니다. 학과 / 과목명 / 과목 설명을 정규화한 키로 해시해서
+중복 과목을 하나로 합치고, 개설된 학년-학기 목록을 semesters에 모읍니다.
+- 과목 수에 대해 선형 시간 (dict 한 번 순회)
+- 처음 나온 과목의 필드와 순서를 유지
+"""
+
+import sys
+import unicodedata
+from typing import Dict, List, Tuple
+
+from course_record import Course
+
+
+def normalize_text(text: str) -> str:
+    """유니코드 정규화(NFC) + 연속 공백을 하나로"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def dedupe_key(department: str, course: Course) -> Tuple[str, str, str]:
+    """(학과, 과목명, 과목 설명) 정규화 키 (과목명은 공백 무시)"""
+    return (
+        normalize_text(department),
+        normalize_text(course.name).replace(" ", ""),
+        normalize_text(course.description),
+    )
+
+
+def dedupe_courses(department: str, courses: List[Course]) -> List[Course]:
+    """학과 하나의 과목 목록에서 중복 과목을 합칩니다. (학년-학기는 semesters로 모음)"""
+    merged: Dict[Tuple[str, str, str], Course] = {}
+    semesters: Dict[Tuple[str, str, str], set] = {}
+
+    for course in courses:
+        key = dedupe_key(department, course)
+        if key not in merged:
+            merged[key] = course
+            semesters[key] = set()
+        semesters[key].update(s for s in course.semesters or (course.grade_semester,) if s)
+
+    for key, course in merged.items():
+        course.semesters = tuple(sorted(sys.intern(s) for s in semesters[key]))
+    return list(merged.values())
+
+
+def dedupe_tree(tree: Dict) -> Tuple[int, int]:
+    """
+    {대학: {단과대학: {학과: [Course, ...]}}} 트리의 학과별 과목을 제자리에서 중복 제거합니다.
+
+    Returns:
+        (중복 제거 전 과목 수, 후 과목 수)
+    """
+    before = after = 0
+    for colleges in tree.values():
+        for departments in colleges.values():
+            for dept_name, courses in departments.items():
+                before += len(courses)
+                departments[dept_name] = dedupe_courses(dept_name, courses)
+                after += len(departments[dept_name])
+    return before, after
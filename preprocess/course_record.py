@@ -0,0 +1,168 @@
+"""
+과목 레코드
+
+파이프라인 전체(전처리 → 병합 → 내보내기)에서 과목 하나를 나타내는 공용 타입입니다.
+- __slots__ 클래스라 과목마다 dict와 키 문자열을 따로 들고 있지 않음
+- 반복이 많은 값(학년-학기, 이수구분, 추가 필드 키)과 단과대학/학과명은 sys.intern으로 공유
+- from_dict: 입력 dict를 검증하면서 변환 (스키마가 어긋나면 CourseSchemaError)
+- to_dict / encode_course: 표준 키 순서의 dict로 변환 (json.dump(default=encode_course)로 바로 저장 가능)
+
+표준 스키마: grade_semester, course_classification, name, description, 학수번호(있는 경우만),
+semesters(학기 간 중복을 합친 경우 개설 학년-학기 목록, course_dedup.py)
+그 외 필드(name_en 등)는 extra에 그대로 보존합니다.
+"""
+
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+# 과목 JSON 키 → 속성 이름
+FIELD_ATTRS = {
+    "grade_semester": "grade_semester",
+    "course_classification": "course_classification",
+    "name": "name",
+    "description": "description",
+    "학수번호": "course_code",
+}
+
+# 값 종류가 적어 intern 해 두는 필드
+INTERNED_FIELDS = ("grade_semester", "course_classification")
+
+
+class CourseSchemaError(ValueError):
+    """과목 dict가 표준 스키마와 맞지 않는 경우"""
+
+
+def _text(value: Any, key: str, where: str) -> str:
+    """None은 빈 문자열로, 숫자는 문자열로 바꾸고 그 외 타입은 오류"""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise CourseSchemaError(f"{where}: '{key}' 필드는 문자열이어야 합니다. ({type(value).__name__})")
+
+
+class Course:
+    __slots__ = ("grade_semester", "course_classification", "name", "description", "course_code", "semesters", "extra")
+
+    def __init__(
+        self,
+        name: str,
+        grade_semester: str = "",
+        course_classification: str = "",
+        description: str = "",
+        course_code: Optional[str] = None,
+        semesters: Optional[Tuple[str, ...]] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.grade_semester = sys.intern(grade_semester)
+        self.course_classification = sys.intern(course_classification)
+        self.description = description
+        self.course_code = course_code
+        self.semesters = semesters
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, raw: Dict, where: str = "") -> "Course":
+        """
+        과목 dict를 검증하고 Course로 변환합니다.
+
+        Args:
+            raw: 과목 dict (필드 정규화가 끝난 상태)
+            where: 오류 메시지에 붙일 위치 (예: "파일명 - 학과명 #3")
+        """
+        if not isinstance(raw, dict):
+            raise CourseSchemaError(f"{where}: 과목은 객체여야 합니다. ({type(raw).__name__})")
+        if "name" not in raw:
+            raise CourseSchemaError(f"{where}: 'name' 필드가 없습니다. (키: {', '.join(raw)})")
+
+        values = {}
+        extra = None
+        for key, value in raw.items():
+            attr = FIELD_ATTRS.get(key)
+            if attr is not None:
+                values[attr] = _text(value, key, where)
+                continue
+            if key == "semesters":
+                if not isinstance(value, list):
+                    raise CourseSchemaError(f"{where}: 'semesters' 필드는 배열이어야 합니다. ({type(value).__name__})")
+                values["semesters"] = tuple(sys.intern(_text(v, key, where)) for v in value)
+                continue
+            if isinstance(value, (dict, list)):
+                raise CourseSchemaError(f"{where}: '{key}' 필드에 중첩 값이 있습니다.")
+            if extra is None:
+                extra = {}
+            extra[sys.intern(key)] = value
+
+        return cls(extra=extra, **values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """표준 키 순서의 dict (학수번호는 있는 경우만, 추가 필드는 마지막)"""
+        data = {
+            "grade_semester": self.grade_semester,
+            "course_classification": self.course_classification,
+            "name": self.name,
+            "description": self.description,
+        }
+        if self.course_code is not None:
+            data["학수번호"] = self.course_code
+        if self.semesters is not None:
+            data["semesters"] = list(self.semesters)
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict처럼 JSON 키로 값을 읽습니다. (기존 dict 기반 코드와 호환)"""
+        attr = FIELD_ATTRS.get(key)
+        if attr is not None:
+            value = getattr(self, attr)
+            return default if value is None else value
+        if key == "semesters":
+            return default if self.semesters is None else list(self.semesters)
+        if self.extra:
+            return self.extra.get(key, default)
+        return default
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Course):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"Course({self.grade_semester!r}, {self.course_classification!r}, {self.name!r})"
+
+
+def encode_course(obj: Any) -> Dict[str, Any]:
+    """json.dump(default=encode_course) 용 인코더"""
+    if isinstance(obj, Course):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def decode_courses(courses: List, where: str = "") -> List[Course]:
+    """과목 dict 리스트를 Course 리스트로 변환합니다. (이미 Course인 항목은 그대로)"""
+    if not isinstance(courses, list):
+        raise CourseSchemaError(f"{where}: 과목 목록은 배열이어야 합니다. ({type(courses).__name__})")
+    return [
+        course if isinstance(course, Course) else Course.from_dict(course, f"{where} #{i}")
+        for i, course in enumerate(courses)
+    ]
+
+
+def decode_tree(tree: Dict, source: str = "") -> Dict:
+    """
+    {대학: {단과대학: {학과: [과목 dict, ...]}}} 트리의 과목을 Course로 바꾸고
+    단과대학/학과명을 intern 한 새 트리를 반환합니다.
+    """
+    decoded = {}
+    for univ_name, colleges in tree.items():
+        decoded_colleges = decoded.setdefault(sys.intern(univ_name), {})
+        for college_name, departments in colleges.items():
+            decoded_departments = decoded_colleges.setdefault(sys.intern(college_name), {})
+            for dept_name, courses in departments.items():
+                where = f"{source} {univ_name} - {college_name} - {dept_name}".strip()
+                decoded_departments[sys.intern(dept_name)] = decode_courses(courses, where)
+    return decoded
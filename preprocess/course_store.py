@@ -0,0 +1,244 @@
+"""
+과목 SQLite 저장소
+
+data/preprocessed/*_syllabus*.json 파일들을 정규화된 SQLite DB로 적재하고,
+학과 조회 / 과목 조회 / 전문 검색(FTS5) API를 제공합니다.
+- universities / colleges / departments / courses 테이블 + 조회용 인덱스
+- courses_fts: 과목명 + 과목 설명 전문 검색 (한글 부분 문자열 검색을 위해 trigram 토크나이저 사용)
+- 전체 데이터를 메모리에 올리지 않고 필요한 행만 조회
+
+사용 예:
+    store = CourseStore(project_root / "data/courses.db")
+    store.find_departments("컴퓨터공학과")
+    store.search("머신러닝", limit=10)
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from course_stream import iter_departments
+from json_io import find_json_files
+
+SCHEMA = """
+CREATE TABLE universities (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE colleges (
+    id INTEGER PRIMARY KEY,
+    university_id INTEGER NOT NULL REFERENCES universities(id),
+    name TEXT NOT NULL,
+    UNIQUE (university_id, name)
+);
+CREATE TABLE departments (
+    id INTEGER PRIMARY KEY,
+    college_id INTEGER NOT NULL REFERENCES colleges(id),
+    name TEXT NOT NULL,
+    UNIQUE (college_id, name)
+);
+CREATE TABLE courses (
+    id INTEGER PRIMARY KEY,
+    department_id INTEGER NOT NULL REFERENCES departments(id),
+    grade_semester TEXT NOT NULL DEFAULT '',
+    course_classification TEXT NOT NULL DEFAULT '',
+    name TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    course_code TEXT NOT NULL DEFAULT '',
+    source_file TEXT NOT NULL
+);
+CREATE INDEX idx_departments_name ON departments(name);
+CREATE INDEX idx_courses_department ON courses(department_id);
+CREATE INDEX idx_courses_name ON courses(name);
+"""
+
+# 과목 + 소속 정보 조회용 SELECT
+COURSE_SELECT = """
+SELECT u.name AS university, c.name AS college, d.name AS department,
+       co.grade_semester, co.course_classification, co.name, co.description, co.course_code
+FROM courses co
+JOIN departments d ON d.id = co.department_id
+JOIN colleges c ON c.id = d.college_id
+JOIN universities u ON u.id = c.university_id
+"""
+
+
+def create_fts_table(conn: sqlite3.Connection) -> str:
+    """과목명/설명 전문 검색 테이블을 만듭니다. trigram을 지원하지 않는 SQLite면 unicode61 사용"""
+    for tokenizer in ("trigram", "unicode61"):
+        try:
+            conn.execute(
+                "CREATE VIRTUAL TABLE courses_fts USING fts5("
+                "name, description, content='courses', content_rowid='id', "
+                f"tokenize='{tokenizer}')"
+            )
+            return tokenizer
+        except sqlite3.OperationalError:
+            continue
+    raise RuntimeError("이 SQLite 빌드는 FTS5를 지원하지 않습니다.")
+
+
+def build_course_store(preprocessed_dir: Path, db_path: Path, pattern: str = "*_syllabus*.json*") -> Path:
+    """
+    전처리된 과목 JSON 파일들을 SQLite DB로 적재합니다. (기존 DB는 새로 만듦)
+
+    Args:
+        preprocessed_dir: data/preprocessed 디렉토리
+        db_path: 생성할 DB 파일 경로
+        pattern: 적재할 파일 패턴 (.json.zst 압축 파일 포함, 같은 이름의 .json과 함께 있으면 하나만 적재)
+    """
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = db_path.with_name(db_path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    start = time.perf_counter()
+    conn = sqlite3.connect(tmp_path)
+    conn.executescript(SCHEMA)
+    tokenizer = create_fts_table(conn)
+
+    university_ids: Dict[str, int] = {}
+    college_ids: Dict[tuple, int] = {}
+    department_ids: Dict[tuple, int] = {}
+
+    def get_id(cache, key, sql, params):
+        if key not in cache:
+            cache[key] = conn.execute(sql, params).lastrowid
+        return cache[key]
+
+    total = 0
+    with conn:
+        for json_file in find_json_files(preprocessed_dir, pattern):
+            # 파일 전체를 읽지 않고 학과 단위로 스트리밍하며 적재
+            file_total = 0
+            for univ_name, college_name, dept_name, courses in iter_departments(json_file):
+                univ_id = get_id(university_ids, univ_name,
+                                 "INSERT INTO universities(name) VALUES (?)", (univ_name,))
+                college_id = get_id(college_ids, (univ_id, college_name),
+                                    "INSERT INTO colleges(university_id, name) VALUES (?, ?)",
+                                    (univ_id, college_name))
+                dept_id = get_id(department_ids, (college_id, dept_name),
+                                 "INSERT INTO departments(college_id, name) VALUES (?, ?)",
+                                 (college_id, dept_name))
+
+                conn.executemany(
+                    "INSERT INTO courses(department_id, grade_semester, course_classification, "
+                    "name, description, course_code, source_file) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(
+                        dept_id,
+                        course.get("grade_semester") or "",
+                        course.get("course_classification") or "",
+                        course.get("name") or "",
+                        course.get("description") or "",
+                        course.get("학수번호") or "",
+                        json_file.name,
+                    ) for course in courses],
+                )
+                file_total += len(courses)
+
+            total += file_total
+            print(f"[OK] {json_file.name}: {file_total}개 과목")
+
+        conn.execute("INSERT INTO courses_fts(courses_fts) VALUES ('rebuild')")
+
+    conn.execute("ANALYZE")
+    conn.close()
+    tmp_path.replace(db_path)
+
+    print(f"[OK] DB 생성 완료: {db_path}")
+    print(f"  대학 {len(university_ids)}개, 학과 {len(department_ids)}개, 과목 {total}개 "
+          f"(FTS 토크나이저: {tokenizer}, {time.perf_counter() - start:.1f}s)")
+    return db_path
+
+
+class CourseStore:
+    """과목 DB 조회 API"""
+
+    def __init__(self, db_path: Path):
+        self.conn = sqlite3.connect(f"file:{Path(db_path).as_posix()}?mode=ro", uri=True, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+
+    def find_departments(self, name: str, partial: bool = False) -> List[Dict]:
+        """
+        학과명으로 개설 대학/단과대학을 찾습니다.
+
+        Args:
+            name: 학과명
+            partial: True면 학과명에 name이 포함된 학과까지 조회
+        """
+        condition = "d.name LIKE ?" if partial else "d.name = ?"
+        value = f"%{name}%" if partial else name
+        rows = self.conn.execute(
+            "SELECT u.name AS university, c.name AS college, d.name AS department, "
+            "(SELECT COUNT(*) FROM courses co WHERE co.department_id = d.id) AS course_count "
+            "FROM departments d "
+            "JOIN colleges c ON c.id = d.college_id "
+            "JOIN universities u ON u.id = c.university_id "
+            f"WHERE {condition} ORDER BY u.name, c.name",
+            (value,),
+        )
+        return [dict(row) for row in rows]
+
+    def get_courses(self, university: str, department: str, college: Optional[str] = None) -> List[Dict]:
+        """대학 / 학과(필요 시 단과대학)의 과목 목록"""
+        sql = COURSE_SELECT + " WHERE u.name = ? AND d.name = ?"
+        params = [university, department]
+        if college is not None:
+            sql += " AND c.name = ?"
+            params.append(college)
+        sql += " ORDER BY co.id"
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def search(self, query: str, limit: int = 20, university: Optional[str] = None) -> List[Dict]:
+        """
+        과목명 / 과목 설명 전문 검색 (관련도 순)
+        trigram 토크나이저는 3글자 이상만 색인하므로, 더 짧은 검색어는 LIKE로 찾습니다.
+        """
+        params: List = []
+        if len(query.strip()) >= 3:
+            # 검색어를 하나의 구(phrase)로 취급
+            phrase = '"' + query.replace('"', '""') + '"'
+            sql = (COURSE_SELECT + " JOIN courses_fts ON courses_fts.rowid = co.id"
+                   " WHERE courses_fts MATCH ?")
+            params.append(phrase)
+            order = " ORDER BY bm25(courses_fts)"
+        else:
+            sql = COURSE_SELECT + " WHERE (co.name LIKE ? OR co.description LIKE ?)"
+            params += [f"%{query}%", f"%{query}%"]
+            order = " ORDER BY co.id"
+
+        if university is not None:
+            sql += " AND u.name = ?"
+            params.append(university)
+
+        sql += order + " LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def main():
+    """메인 함수"""
+    # 프로젝트 루트 디렉터리 (preprocess 폴더의 부모)
+    project_root = Path(__file__).parent.parent
+    preprocessed_dir = project_root / "data" / "preprocessed"
+    db_path = project_root / "data" / "courses.db"
+
+    if not preprocessed_dir.exists():
+        print(f"오류: {preprocessed_dir} 폴더를 찾을 수 없습니다.")
+        return
+
+    build_course_store(preprocessed_dir, db_path)
+
+
+if __name__ == "__main__":
+    main()
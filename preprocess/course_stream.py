@@ -0,0 +1,138 @@
+"""
+스트리밍 JSON 읽기
+
+{대학: {단과대학: {학과: [과목, ...]}}} 같은 중첩 JSON 파일을 통째로 json.load 하지 않고,
+정해진 깊이까지는 객체/배열을 한 항목씩 따라 내려가며 그 아래 값만 디코딩해서 yield 합니다.
+- 파일은 일정 크기씩 읽고, 처리한 앞부분은 버퍼에서 버림
+- 메모리에는 현재 읽고 있는 값(예: 학과 하나의 과목 배열)만 올라옴
+- 표준 라이브러리 json.JSONDecoder.raw_decode 사용 (추가 패키지 없음)
+- zstd로 압축된 파일도 압축을 풀면서 그대로 읽음 (json_io.py)
+
+사용 예:
+    for univ, college, dept, course in iter_courses(path):
+        ...
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Iterator, List, Tuple
+
+from json_io import open_json_text
+
+CHUNK_SIZE = 1 << 16
+WHITESPACE = " \t\n\r"
+
+_decoder = json.JSONDecoder()
+
+
+class JsonStreamReader:
+    """파일 버퍼 위에서 JSON 토큰을 앞에서부터 하나씩 읽습니다."""
+
+    def __init__(self, f, chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """버퍼에 더 읽어 붙입니다. (큰 값을 읽는 중이면 읽는 양을 늘려 재시도 횟수를 줄임)"""
+        if self.eof:
+            return False
+        pending = len(self.buf) - self.pos
+        more = self.f.read(max(self.chunk_size, pending))
+        if not more:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + more
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """공백을 건너뛰고 다음 문자를 반환합니다. (파일 끝이면 "")"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise json.JSONDecodeError(f"'{chars}' 가 필요합니다", self.buf, self.pos)
+        self.pos += 1
+        return ch
+
+    def value(self) -> Any:
+        """다음 JSON 값 하나를 디코딩합니다."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # 버퍼 끝에서 끝난 숫자는 잘렸을 수 있음
+            if end == len(self.buf) and not self.eof:
+                self._fill()
+                continue
+            self.pos = end
+            return obj
+
+    def items(self, depth: int, arrays: bool = False, path: Tuple = ()) -> Iterator[Tuple[Tuple, Any]]:
+        """
+        depth 깊이까지 객체(키)를 따라 내려가며 (경로, 값)을 yield 합니다.
+        arrays=True면 배열도 (인덱스)로 따라 내려갑니다.
+        depth보다 얕은 곳에 내려갈 수 없는 값이나 빈 객체/배열이 있으면 그 경로에서 그대로 yield 합니다.
+        """
+        ch = self.peek()
+        if len(path) >= depth or ch not in ("{[" if arrays else "{"):
+            yield path, self.value()
+            return
+
+        close = "}" if ch == "{" else "]"
+        self.pos += 1
+        if self.peek() == close:
+            self.pos += 1
+            yield path, {} if ch == "{" else []
+            return
+
+        index = 0
+        while True:
+            if ch == "{":
+                key = self.value()
+                self.expect(":")
+            else:
+                key = index
+                index += 1
+            yield from self.items(depth, arrays, path + (key,))
+            if self.expect("," + close) == close:
+                return
+
+
+def iter_json_items(path: Path, depth: int, arrays: bool = False) -> Iterator[Tuple[Tuple, Any]]:
+    """JSON 파일을 depth 깊이까지 스트리밍하며 (경로, 값)을 yield 합니다."""
+    with open_json_text(path) as f:
+        yield from JsonStreamReader(f).items(depth, arrays)
+
+
+def iter_departments(path: Path) -> Iterator[Tuple[str, str, str, List]]:
+    """
+    {대학: {단과대학: {학과: [과목, ...]}}} 파일에서 학과 하나씩 (대학, 단과대학, 학과, 과목 목록)을 yield 합니다.
+    단과대학 값이 바로 과목 리스트이면 단과대학명을 학과명으로 사용하고, 빈 대학/단과대학은 건너뜁니다.
+    """
+    for keys, value in iter_json_items(path, 3):
+        if len(keys) == 3:
+            yield keys[0], keys[1], keys[2], value
+        elif len(keys) == 2 and isinstance(value, list):
+            yield keys[0], keys[1], keys[1], value
+
+
+def iter_courses(path: Path) -> Iterator[Tuple[str, str, str, Any]]:
+    """과목 하나씩 (대학, 단과대학, 학과, 과목)을 yield 합니다."""
+    for univ_name, college_name, dept_name, courses in iter_departments(path):
+        for course in courses:
+            yield univ_name, college_name, dept_name, course
@@ -0,0 +1,133 @@
+"""
+과목 평면 테이블 내보내기
+
+{대학: {단과대학: {학과: [과목, ...]}}} 형태의 중첩 JSON을
+과목 한 건 = 한 행인 평면 테이블로 변환해서 Parquet 또는 Arrow IPC 파일로 저장합니다.
+- 컬럼: university, college, department, grade_semester, course_classification, name, description, 학수번호,
+  semesters(학기 간 중복을 합친 과목의 개설 학년-학기 목록, 문자열 리스트 / 없으면 null)
+- 반복이 많은 문자열 컬럼(대학/단과대학/학과/학년-학기/이수구분)은 dictionary 인코딩
+- 필요한 컬럼만 읽거나(Parquet) 메모리 매핑으로 바로 읽을 수 있음(Arrow IPC)
+
+pyarrow가 필요합니다. (pip install pyarrow)
+"""
+
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+COLUMNS = [
+    "university",
+    "college",
+    "department",
+    "grade_semester",
+    "course_classification",
+    "name",
+    "description",
+    "학수번호",
+    "semesters",
+]
+
+# 값 종류가 적고 반복이 많은 컬럼
+DICTIONARY_COLUMNS = ["university", "college", "department", "grade_semester", "course_classification"]
+
+# 과목 dict에서 읽을 필드 (university/college/department는 트리 경로에서 채움)
+COURSE_FIELDS = ["grade_semester", "course_classification", "name", "description", "학수번호"]
+
+# 문자열 리스트 컬럼
+LIST_COLUMNS = ["semesters"]
+
+
+def iter_course_rows(all_data: Dict) -> Iterator[Tuple]:
+    """중첩 JSON을 순회하며 COLUMNS 순서의 행 튜플을 yield 합니다."""
+    for univ_name, colleges in all_data.items():
+        for college_name, departments in colleges.items():
+            for dept_name, courses in departments.items():
+                for course in courses:
+                    semesters = course.get("semesters")
+                    yield (univ_name, college_name, dept_name) + tuple(
+                        "" if course.get(field) is None else str(course.get(field))
+                        for field in COURSE_FIELDS
+                    ) + (None if semesters is None else [str(s) for s in semesters],)
+
+
+def build_course_table(all_data: Dict):
+    """중첩 JSON을 pyarrow Table로 변환합니다."""
+    import pyarrow as pa
+
+    columns: List[List] = [[] for _ in COLUMNS]
+    for row in iter_course_rows(all_data):
+        for values, value in zip(columns, row):
+            values.append(value)
+
+    arrays = []
+    for name, values in zip(COLUMNS, columns):
+        if name in LIST_COLUMNS:
+            arrays.append(pa.array(values, type=pa.list_(pa.string())))
+            continue
+        array = pa.array(values, type=pa.string())
+        if name in DICTIONARY_COLUMNS:
+            array = array.dictionary_encode()
+        arrays.append(array)
+
+    return pa.Table.from_arrays(arrays, names=COLUMNS)
+
+
+def export_course_table(all_data: Dict, output_path: Path, table_format: str = "parquet") -> Optional[Path]:
+    """
+    과목 평면 테이블을 저장합니다.
+
+    Args:
+        all_data: 병합된 중첩 JSON
+        output_path: 저장 경로 (확장자는 table_format에 맞게 .parquet / .arrow 로 바뀜)
+        table_format: "parquet" 또는 "arrow" (Arrow IPC 파일)
+
+    Returns:
+        저장한 경로 (pyarrow가 없으면 None)
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("경고: pyarrow가 설치되어 있지 않아 테이블 내보내기를 건너뜁니다. (pip install pyarrow)")
+        return None
+
+    table = build_course_table(all_data)
+
+    if table_format == "parquet":
+        output_path = Path(output_path).with_suffix(".parquet")
+        pq.write_table(
+            table,
+            output_path,
+            use_dictionary=DICTIONARY_COLUMNS,
+            compression="zstd",
+        )
+    elif table_format == "arrow":
+        output_path = Path(output_path).with_suffix(".arrow")
+        # 압축하지 않아야 메모리 매핑으로 복사 없이 읽을 수 있음
+        with pa.OSFile(str(output_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    else:
+        raise ValueError(f"지원하지 않는 테이블 형식: {table_format}")
+
+    print(f"[OK] 과목 테이블 저장 완료: {output_path} ({table.num_rows}행)")
+    return output_path
+
+
+def read_course_table(path: Path, columns: Optional[List[str]] = None):
+    """
+    저장된 과목 테이블을 읽습니다. 확장자로 형식을 판단합니다.
+
+    Args:
+        path: .parquet 또는 .arrow 파일
+        columns: 읽을 컬럼 목록 (None이면 전체)
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return pq.read_table(path, columns=columns)
+
+    with pa.memory_map(str(path), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.select(columns) if columns else table
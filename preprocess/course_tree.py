@@ -0,0 +1,97 @@
+"""
+과목 트리 병합
+
+{대학: {단과대학: {학과: [과목, ...]}}} 트리들을 하나의 누적 트리에 제자리(in-place)로 합칩니다.
+- 새 대학 / 단과대학 / 학과는 복사 없이 하위 트리를 그대로 붙임
+- 같은 학과가 이미 있으면 충돌 정책에 따라 처리하고 충돌 내역을 기록
+  - replace: 나중에 들어온 과목 목록으로 교체
+  - extend: 기존 과목 목록 뒤에 이어 붙임
+  - error: MergeConflictError 발생
+
+주의: 넘겨준 트리는 누적 트리의 일부가 되므로 병합 후 따로 수정하지 않아야 합니다.
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+POLICIES = ("replace", "extend", "error")
+
+
+class MergeConflictError(ValueError):
+    """error 정책에서 같은 학과가 두 번 들어온 경우"""
+
+
+class MergeConflict(NamedTuple):
+    university: str
+    college: str
+    department: str
+    policy: str
+    existing: int
+    incoming: int
+    source: Optional[str]
+
+
+class CourseTreeBuilder:
+    def __init__(self, policy: str = "replace"):
+        if policy not in POLICIES:
+            raise ValueError(f"지원하지 않는 충돌 정책: {policy}")
+        self.policy = policy
+        self.tree: Dict[str, Dict[str, Dict[str, List]]] = {}
+        self.conflicts: List[MergeConflict] = []
+
+    def add_department(
+        self,
+        university: str,
+        college: str,
+        department: str,
+        courses: List,
+        source: Optional[str] = None,
+        policy: Optional[str] = None,
+    ):
+        """학과 하나의 과목 목록을 추가합니다."""
+        departments = self.tree.setdefault(university, {}).setdefault(college, {})
+        if department not in departments:
+            departments[department] = courses
+            return
+
+        policy = policy or self.policy
+        existing = departments[department]
+        self.conflicts.append(
+            MergeConflict(university, college, department, policy, len(existing), len(courses), source)
+        )
+
+        if policy == "error":
+            raise MergeConflictError(f"학과 중복: {university} - {college} - {department} (source={source})")
+        if policy == "extend":
+            existing.extend(courses)
+        else:
+            departments[department] = courses
+
+    def merge(self, data: Dict, source: Optional[str] = None, policy: Optional[str] = None):
+        """
+        대학 트리 하나를 누적 트리에 합칩니다.
+        처음 보는 대학 / 단과대학은 하위 트리를 통째로 붙이고, 이미 있으면 학과 단위로 내려가 합칩니다.
+        """
+        for univ_name, colleges in data.items():
+            if univ_name not in self.tree:
+                self.tree[univ_name] = colleges
+                continue
+
+            target_colleges = self.tree[univ_name]
+            for college_name, departments in colleges.items():
+                if college_name not in target_colleges:
+                    target_colleges[college_name] = departments
+                    continue
+
+                for dept_name, courses in departments.items():
+                    self.add_department(univ_name, college_name, dept_name, courses, source, policy)
+
+    def report(self):
+        """충돌 내역을 출력합니다."""
+        if not self.conflicts:
+            print("학과 충돌 없음")
+            return
+
+        print(f"학과 충돌 {len(self.conflicts)}건:")
+        for c in self.conflicts:
+            print(f"  - {c.university} - {c.college} - {c.department}: "
+                  f"{c.policy} (기존 {c.existing}개, 추가 {c.incoming}개, source={c.source})")
@@ -6,443 +6,347 @@ data/ 디렉토리 이하의 모든 대학 JSON 파일들을 하나로 병합합
 - 홍익대(hongik): 각 학과별 JSON 파일들을 병합 (category → course_classification 변환)
 - 성균관대(sungkyunkwan): grade_year → grade_semester 변환, course_classification 필드 추가
 - 한양대(hanyang), 서울대(seoul), 이화여대(ewha): 표준 포맷 JSON 파일들 병합
+  (한양대, 서울대는 학기별 파일에 반복된 과목을 하나로 합치고 개설 학기를 semesters에 기록)
 - 기타 대학들(부산대, 충북대, 강원대, 경북대, 경상대, 제주대, 전북대): 표준 포맷 JSON 파일들 병합
 - 고려대(korea): year_term → grade_semester 변환, course_code → 학수번호 변환
 - 서강대(seogang): grade → grade_semester 변환 (course_classification에서 학기 추정)
-"""
-
-import json
-from pathlib import Path
-from typing import Dict, List, Any
-
-
-def load_json_file(file_path: Path) -> Any:
-    """JSON 파일을 로드합니다."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def merge_hongik_data(data_dir: Path) -> Dict:
-    """
-    홍익대 JSON 파일들을 병합합니다.
-
-    홍익대는 각 파일이 배열 형태로 되어 있고, 파일명에 학과명이 포함되어 있습니다.
-    예: hongik_컴퓨터공학.json -> "컴퓨터공학"
-    배열 포맷을 표준 포맷으로 변환하며, category를 course_classification으로 변환합니다.
-    """
-    hongik_dir = data_dir / "hongik"
-    if not hongik_dir.exists():
-        print(f"경고: {hongik_dir} 폴더를 찾을 수 없습니다.")
-        return {}
-
-    hongik_data = {"홍익대학교": {"공과대학": {}}}
-
-    for json_file in sorted(hongik_dir.glob("hongik_*.json")):
-        # 파일명에서 학과명 추출: hongik_컴퓨터공학.json -> 컴퓨터공학
-        dept_name = json_file.stem.replace("hongik_", "")
-
-        courses = load_json_file(json_file)
-
-        # category를 course_classification으로 변환
-        for course in courses:
-            if "category" in course:
-                course["course_classification"] = course.pop("category")
-
-        hongik_data["홍익대학교"]["공과대학"][dept_name] = courses
-        print(f"[OK] 홍익대 - {dept_name}: {len(courses)}개 과목")
-
-    return hongik_data
-
-
-def merge_konkuk_data(data_dir: Path) -> Dict:
-    """
-    건국대 JSON 파일들을 병합합니다.
-
-    건국대는 각 학과별로 별도 JSON 파일이 있으며, 모두 표준 포맷을 따릅니다.
-    예: konkuk_컴퓨터공학부.json -> {"건국대": {"공과대학": {"컴퓨터공학부": [...]}}}
-    """
-    konkuk_dir = data_dir / "konkuk"
-    if not konkuk_dir.exists():
-        print(f"경고: {konkuk_dir} 폴더를 찾을 수 없습니다.")
-        return {}
-
-    # 통합 파일이 있으면 제외
-    json_files = [f for f in konkuk_dir.glob("konkuk_*.json") if "all" not in f.stem.lower()]
-
-    if not json_files:
-        print(f"경고: {konkuk_dir}에 JSON 파일이 없습니다.")
-        return {}
-
-    merged_data = {}
-
-    for json_file in sorted(json_files):
-        file_data = load_json_file(json_file)
-
-        # 각 파일의 데이터를 병합
-        for univ_name, colleges in file_data.items():
-            if univ_name not in merged_data:
-                merged_data[univ_name] = {}
-
-            for college_name, departments in colleges.items():
-                if college_name not in merged_data[univ_name]:
-                    merged_data[univ_name][college_name] = {}
 
-                for dept_name, courses in departments.items():
-                    if dept_name in merged_data[univ_name][college_name]:
-                        # 중복된 학과가 있으면 과목을 추가
-                        merged_data[univ_name][college_name][dept_name].extend(courses)
-                        print(f"[OK] {univ_name} - {college_name} - {dept_name}: {len(courses)}개 과목 추가 (누적)")
-                    else:
-                        merged_data[univ_name][college_name][dept_name] = courses
-                        print(f"[OK] {univ_name} - {college_name} - {dept_name}: {len(courses)}개 과목")
+대학별 입력 형식과 필드 변환은 SOURCE_SPECS에 선언하고, 과목마다 한 번의 순회로 모든 규칙을 적용합니다.
+입력 파일은 통째로 읽지 않고 학과 단위로 스트리밍합니다. (course_stream.py)
+정규화된 과목은 Course 레코드로 검증/변환하므로 스키마가 어긋난 입력은 로드 시점에 CourseSchemaError로 드러납니다. (course_record.py)
 
-    return merged_data
-
-
-def merge_sungkyunkwan_data(data_dir: Path) -> Dict:
-    """
-    성균관대 JSON 파일을 병합합니다.
-
-    성균관대는 표준 스키마를 따르지만, 필드명이 다릅니다:
-    - grade_year -> grade_semester로 변환
-    - course_classification 필드가 없으므로 빈 문자열로 추가
-
-    주의: 일부 단과대학은 dict 형태, 일부는 list 형태로 되어있음
-    """
-    skku_dir = data_dir / "sungkyunkwan"
-    if not skku_dir.exists():
-        print(f"경고: {skku_dir} 폴더를 찾을 수 없습니다.")
-        return {}
+입력 파일이 바뀌지 않은 대학은 이전 실행의 정규화 결과(shard)를 재사용하고,
+다시 정규화할 대학들은 프로세스 풀에서 병렬로 처리합니다. (JSON 파싱이 CPU 작업이라 스레드로는 빨라지지 않음)
+모든 입력과 저장 설정이 이전 실행과 같고 출력 파일도 그대로면 shard를 읽지 않고 이전 출력을 그대로 사용합니다.
+과목 평면 테이블(Parquet / Arrow IPC)은 필요할 때만 함께 저장합니다. (course_table.py)
+- MERGE_TABLE_FORMAT=parquet 또는 arrow 로 실행하면 저장 (기본값: 저장하지 않음)
+"""
 
-    merged_data = {}
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import course_dedup
+import course_record
+import course_table
+import course_tree
+import field_normalizer
+import json_io
+from course_dedup import dedupe_tree
+from course_record import decode_courses, decode_tree
+from course_stream import iter_json_items
+from course_table import export_course_table
+from course_tree import CourseTreeBuilder
+from field_normalizer import Convert, Default, FieldNormalizer, Rename, korea_year_term, sogang_grade_semester
+from json_io import department_samples, find_json_files, json_stem, save_dictionary, train_dictionary, write_json
+from merge_cache import MergeManifest
+
+
+# 병합 순서대로 (폴더명, 대학명)
+UNIVERSITIES = [
+    ("konkuk", "건국대학교"),
+    ("hongik", "홍익대학교"),
+    ("sungkyunkwan", "성균관대학교"),
+    ("hanyang", "한양대학교"),
+    ("seoul", "서울대학교"),
+    ("ewha", "이화여자대학교"),
+    ("busan", "부산대학교"),
+    ("chungbook", "충북대학교"),
+    ("gangwon", "강원대학교"),
+    ("gyungbook", "경북대학교"),
+    ("gyungsang", "경상대학교"),
+    ("jeju", "제주대학교"),
+    ("junbook", "전북대학교"),
+    ("korea", "고려대학교"),
+    ("seogang", "서강대학교"),
+]
+
+# 대학 폴더별 입력 형식과 필드 정규화 규칙 (없는 폴더는 표준 포맷)
+#   pattern: 읽을 파일 패턴 (기본값: *.json, 같은 이름의 .json.zst 압축 파일도 읽음)
+#   exclude: 파일명에 이 문자열이 있으면 제외 (통합 파일 등)
+#   layout: "tree" = {"대학명": {"단과대학": {"학과명": [...]}}}
+#           "dept_files" = 파일 하나가 학과 하나의 과목 배열 (파일명에서 학과명 추출)
+#   rules: 과목마다 적용할 정규화 규칙 (field_normalizer.py)
+#   dedupe: True면 학기별 파일에 반복된 과목을 하나로 합침 (course_dedup.py)
+SOURCE_SPECS = {
+    # 건국대: 학과별 파일, 표준 포맷 (통합 파일 konkuk_all_*.json 제외)
+    "konkuk": {
+        "pattern": "konkuk_*.json",
+        "exclude": "all",
+    },
+    # 홍익대: hongik_컴퓨터공학.json → "컴퓨터공학", category → course_classification
+    "hongik": {
+        "pattern": "hongik_*.json",
+        "layout": "dept_files",
+        "university": "홍익대학교",
+        "college": "공과대학",
+        "prefix": "hongik_",
+        "rules": [Rename("category", "course_classification")],
+    },
+    # 한양대 / 서울대: 학기별 파일(_1_v2 / _2_v2)에 같은 과목이 반복됨
+    "hanyang": {"dedupe": True},
+    "seoul": {"dedupe": True},
+    # 성균관대: grade_year → grade_semester, course_classification 없음
+    # (일부 단과대학은 학과 없이 과목 리스트 → 단과대학명을 학과명으로 사용)
+    "sungkyunkwan": {
+        "rules": [
+            # 전자전기공학부(enc) 출력은 과목명을 subject 키로 저장 (skku_cr_engine SOURCES["enc"])
+            Rename("subject", "name"),
+            Rename("grade_year", "grade_semester"),
+            Default("course_classification", ""),
+        ],
+    },
+    # 고려대: year_term → grade_semester ("2025 - 1학기" → "1-1"), course_code → 학수번호
+    "korea": {
+        "rules": [
+            Convert("year_term", "grade_semester", korea_year_term),
+            Rename("course_code", "학수번호"),
+            Default("course_classification", ""),
+        ],
+    },
+    # 서강대: grade → grade_semester (course_classification의 전기/후기로 학기 추정), 학수번호 없음
+    "seogang": {
+        "rules": [
+            Convert("grade", "grade_semester", sogang_grade_semester),
+            Default("학수번호", ""),
+        ],
+    },
+}
+
+# 병합 코드나 정규화 규칙이 바뀌면 캐시된 정규화 결과를 모두 다시 만듦
+CODE_FILES = [
+    Path(__file__),
+    Path(field_normalizer.__file__),
+    Path(course_tree.__file__),
+    Path(course_record.__file__),
+    Path(course_dedup.__file__),
+]
+CODE_VERSION = hashlib.sha256(b"".join(p.read_bytes() for p in CODE_FILES)).hexdigest()[:16]
+
+# 저장 코드가 바뀌면 이전 출력 파일을 재사용하지 않음
+OUTPUT_CODE_FILES = [Path(json_io.__file__), Path(course_table.__file__)]
+OUTPUT_CODE_VERSION = hashlib.sha256(b"".join(p.read_bytes() for p in OUTPUT_CODE_FILES)).hexdigest()[:16]
+
+
+def source_files(data_dir: Path, folder: str) -> List[Path]:
+    """대학 폴더에서 병합할 입력 파일 목록 (json_io.find_json_files, 캐시 fingerprint도 같은 목록 사용)"""
+    univ_dir = data_dir / folder
+    if not univ_dir.exists():
+        return []
+    spec = SOURCE_SPECS.get(folder, {})
+    exclude = spec.get("exclude")
+    return [
+        f for f in find_json_files(univ_dir, spec.get("pattern", "*.json"))
+        if not (exclude and exclude in json_stem(f).lower())
+    ]
 
-    json_files = list(skku_dir.glob("*.json"))
-    if not json_files:
-        print(f"경고: {skku_dir}에 JSON 파일이 없습니다.")
-        return {}
-
-    for json_file in sorted(json_files):
-        file_data = load_json_file(json_file)
-
-        # 각 파일의 데이터를 병합
-        for univ_name, colleges in file_data.items():
-            if univ_name not in merged_data:
-                merged_data[univ_name] = {}
-
-            for college_name, departments in colleges.items():
-                if college_name not in merged_data[univ_name]:
-                    merged_data[univ_name][college_name] = {}
-
-                # departments가 list인 경우 (단과대학 자체가 과목 리스트)
-                if isinstance(departments, list):
-                    # 필드명 변환
-                    for course in departments:
-                        if "grade_year" in course:
-                            course["grade_semester"] = course.pop("grade_year")
-                        if "course_classification" not in course:
-                            course["course_classification"] = ""
-
-                    # 단과대학명을 학과명으로 사용
-                    merged_data[univ_name][college_name][college_name] = departments
-                    print(f"[OK] {univ_name} - {college_name} - {college_name}: {len(departments)}개 과목")
-
-                # departments가 dict인 경우 (정상적인 학과별 구조)
-                elif isinstance(departments, dict):
-                    for dept_name, courses in departments.items():
-                        # 필드명 변환
-                        for course in courses:
-                            if "grade_year" in course:
-                                course["grade_semester"] = course.pop("grade_year")
-                            if "course_classification" not in course:
-                                course["course_classification"] = ""
-
-                        if dept_name in merged_data[univ_name][college_name]:
-                            # 중복된 학과가 있으면 과목을 추가
-                            merged_data[univ_name][college_name][dept_name].extend(courses)
-                            print(f"[OK] {univ_name} - {college_name} - {dept_name}: {len(courses)}개 과목 추가 (누적)")
-                        else:
-                            merged_data[univ_name][college_name][dept_name] = courses
-                            print(f"[OK] {univ_name} - {college_name} - {dept_name}: {len(courses)}개 과목")
-
-    return merged_data
-
-
-def merge_korea_data(data_dir: Path) -> Dict:
-    """
-    고려대 JSON 파일을 병합합니다.
 
-    고려대는 표준 스키마를 따르지만, 필드명이 다릅니다:
-    - year_term → grade_semester로 변환 (예: "2025 - 1학기" → "1-1")
-    - course_code → 학수번호로 변환
-    - course_classification 필드가 없으므로 빈 문자열로 추가
+def iter_source_departments(json_file: Path, spec: Dict) -> Iterator[Tuple[str, str, Optional[str], List]]:
     """
-    korea_dir = data_dir / "korea"
-    if not korea_dir.exists():
-        print(f"경고: {korea_dir} 폴더를 찾을 수 없습니다.")
-        return {}
-
-    merged_data = {}
-
-    json_files = list(korea_dir.glob("*.json"))
-    if not json_files:
-        print(f"경고: {korea_dir}에 JSON 파일이 없습니다.")
-        return {}
-
-    for json_file in sorted(json_files):
-        file_data = load_json_file(json_file)
-
-        # 각 파일의 데이터를 병합
-        for univ_name, colleges in file_data.items():
-            if univ_name not in merged_data:
-                merged_data[univ_name] = {}
-
-            for college_name, departments in colleges.items():
-                if college_name not in merged_data[univ_name]:
-                    merged_data[univ_name][college_name] = {}
-
-                for dept_name, courses in departments.items():
-                    # 필드명 변환
-                    for course in courses:
-                        # year_term을 grade_semester로 변환 (예: "2025 - 1학기" → "1-1")
-                        if "year_term" in course:
-                            year_term = course.pop("year_term")
-                            # "2025 - 1학기" 형식에서 학기 정보 추출
-                            if "1학기" in year_term:
-                                course["grade_semester"] = "1-1"
-                            elif "2학기" in year_term:
-                                course["grade_semester"] = "1-2"
-                            else:
-                                course["grade_semester"] = ""
-
-                        # course_code를 학수번호로 변환
-                        if "course_code" in course:
-                            course["학수번호"] = course.pop("course_code")
-
-                        # course_classification 필드 추가
-                        if "course_classification" not in course:
-                            course["course_classification"] = ""
-
-                    if dept_name in merged_data[univ_name][college_name]:
-                        # 중복된 학과가 있으면 과목을 추가
-                        merged_data[univ_name][college_name][dept_name].extend(courses)
-                        print(f"[OK] {univ_name} - {college_name} - {dept_name}: {len(courses)}개 과목 추가 (누적)")
-                    else:
-                        merged_data[univ_name][college_name][dept_name] = courses
-                        print(f"[OK] {univ_name} - {college_name} - {dept_name}: {len(courses)}개 과목")
-
-    return merged_data
-
-
-def merge_seogang_data(data_dir: Path) -> Dict:
+    입력 파일 하나를 스트리밍하며 학과 하나씩 (대학명, 단과대학, 학과명, 과목 목록)을 yield 합니다.
+    파일 전체를 메모리에 올리지 않고 학과 단위로만 디코딩합니다. (course_stream.py)
+    학과가 없는 빈 단과대학은 (대학명, 단과대학, None, [])으로 yield 합니다.
     """
-    서강대 JSON 파일을 병합합니다.
+    if spec.get("layout") == "dept_files":
+        dept_name = json_stem(json_file).replace(spec["prefix"], "")
+        _, courses = next(iter_json_items(json_file, 0))
+        yield spec["university"], spec["college"], dept_name, courses
+        return
 
-    서강대는 표준 스키마를 따르지만, 필드가 다릅니다:
-    - grade → grade_semester로 변환 (예: 2 → "2-1" 또는 "2-2", course_classification에서 추정)
-    - 학수번호 필드가 없으므로 빈 문자열로 추가
-    """
-    seogang_dir = data_dir / "seogang"
-    if not seogang_dir.exists():
-        print(f"경고: {seogang_dir} 폴더를 찾을 수 없습니다.")
-        return {}
+    for keys, value in iter_json_items(json_file, 3):
+        if len(keys) == 3:
+            yield keys[0], keys[1], keys[2], value
+        elif len(keys) == 2 and isinstance(value, list):
+            # 단과대학 자체가 과목 리스트인 경우 단과대학명을 학과명으로 사용
+            yield keys[0], keys[1], keys[1], value
+        elif len(keys) == 2:
+            yield keys[0], keys[1], None, []
 
-    merged_data = {}
 
-    json_files = list(seogang_dir.glob("*.json"))
-    if not json_files:
-        print(f"경고: {seogang_dir}에 JSON 파일이 없습니다.")
-        return {}
-
-    for json_file in sorted(json_files):
-        file_data = load_json_file(json_file)
-
-        # 각 파일의 데이터를 병합
-        for univ_name, colleges in file_data.items():
-            if univ_name not in merged_data:
-                merged_data[univ_name] = {}
-
-            for college_name, departments in colleges.items():
-                if college_name not in merged_data[univ_name]:
-                    merged_data[univ_name][college_name] = {}
-
-                for dept_name, courses in departments.items():
-                    # 필드명 변환
-                    for course in courses:
-                        # grade를 grade_semester로 변환
-                        if "grade" in course:
-                            grade = course.pop("grade")
-                            # course_classification에서 학기 정보 추정 ("전기" = 1학기, "후기" = 2학기)
-                            classification = course.get("course_classification", "")
-                            semester = "1" if "전기" in classification else "2" if "후기" in classification else "1"
-                            course["grade_semester"] = f"{grade}-{semester}"
-
-                        # 학수번호 필드 추가
-                        if "학수번호" not in course:
-                            course["학수번호"] = ""
-
-                    if dept_name in merged_data[univ_name][college_name]:
-                        # 중복된 학과가 있으면 과목을 추가
-                        merged_data[univ_name][college_name][dept_name].extend(courses)
-                        print(f"[OK] {univ_name} - {college_name} - {dept_name}: {len(courses)}개 과목 추가 (누적)")
-                    else:
-                        merged_data[univ_name][college_name][dept_name] = courses
-                        print(f"[OK] {univ_name} - {college_name} - {dept_name}: {len(courses)}개 과목")
-
-    return merged_data
-
-
-def merge_standard_format_data(data_dir: Path, univ_folder: str) -> Dict:
+def merge_university(data_dir: Path, folder: str) -> Tuple[Dict, Dict[str, int]]:
     """
-    표준 포맷을 따르는 대학 데이터를 병합합니다.
+    대학 폴더 하나를 읽어 표준 포맷으로 정규화합니다.
+    모든 과목에 정규화 규칙을 한 번에 적용한 뒤 Course로 검증/변환하며,
+    같은 학과가 여러 파일에 있으면 과목을 이어 붙입니다.
 
-    한양대, 서울대, 이화여대는 이미 표준 스키마를 따릅니다:
-    {"대학명": {"단과대학": {"학과명": [...]}}}
+    Returns:
+        (정규화된 대학 트리, 규칙별 적용 횟수)
     """
-    univ_dir = data_dir / univ_folder
+    spec = SOURCE_SPECS.get(folder, {})
+    univ_dir = data_dir / folder
     if not univ_dir.exists():
         print(f"경고: {univ_dir} 폴더를 찾을 수 없습니다.")
-        return {}
+        return {}, {}
+
+    json_files = source_files(data_dir, folder)
 
-    merged_data = {}
+    builder = CourseTreeBuilder("extend")
+    if spec.get("layout") == "dept_files":
+        builder.tree = {spec["university"]: {spec["college"]: {}}}
 
-    json_files = list(univ_dir.glob("*.json"))
     if not json_files:
         print(f"경고: {univ_dir}에 JSON 파일이 없습니다.")
-        return {}
+        return builder.tree, {}
 
-    for json_file in sorted(json_files):
-        file_data = load_json_file(json_file)
+    normalizer = FieldNormalizer(spec.get("rules", ()))
 
-        # 각 파일의 데이터를 병합
-        for univ_name, colleges in file_data.items():
-            if univ_name not in merged_data:
-                merged_data[univ_name] = {}
+    for json_file in json_files:
+        for univ_name, college_name, dept_name, courses in iter_source_departments(json_file, spec):
+            college_name = sys.intern(college_name)
+            college_group = builder.tree.setdefault(univ_name, {}).setdefault(college_name, {})
+            if dept_name is None:
+                continue
 
-            for college_name, departments in colleges.items():
-                if college_name not in merged_data[univ_name]:
-                    merged_data[univ_name][college_name] = {}
+            dept_name = sys.intern(dept_name)
+            normalizer.normalize_all(courses)
+            courses = decode_courses(courses, f"{json_file.name} {univ_name} - {college_name} - {dept_name}")
 
-                for dept_name, courses in departments.items():
-                    if dept_name in merged_data[univ_name][college_name]:
-                        # 중복된 학과가 있으면 과목을 추가
-                        merged_data[univ_name][college_name][dept_name].extend(courses)
-                        print(f"[OK] {univ_name} - {college_name} - {dept_name}: {len(courses)}개 과목 추가 (누적)")
-                    else:
-                        merged_data[univ_name][college_name][dept_name] = courses
-                        print(f"[OK] {univ_name} - {college_name} - {dept_name}: {len(courses)}개 과목")
+            accumulated = dept_name in college_group
+            builder.add_department(univ_name, college_name, dept_name, courses, source=json_file.name)
+            suffix = " 추가 (누적)" if accumulated else ""
+            print(f"[OK] {univ_name} - {college_name} - {dept_name}: {len(courses)}개 과목{suffix}")
 
-    return merged_data
+    if spec.get("dedupe"):
+        before, after = dedupe_tree(builder.tree)
+        print(f"[OK] {folder} 학기 간 중복 제거: {before}개 → {after}개 과목")
 
+    return builder.tree, dict(normalizer.hits)
 
-def deep_merge_dicts(dict1: Dict, dict2: Dict) -> Dict:
+
+def merge_universities_parallel(data_dir: Path, folders: List[str], workers: Optional[int] = None) -> List[Tuple[Dict, Dict]]:
     """
-    두 딕셔너리를 깊게 병합합니다.
-    dict2의 내용을 dict1에 병합하되, 중복된 키는 dict2의 값을 사용합니다.
+    대학 폴더들을 프로세스 풀에서 동시에 정규화하고 folders 순서대로 결과를 반환합니다.
+    workers가 1 이하이거나 대학이 하나뿐이면 현재 프로세스에서 순차 처리합니다.
     """
-    result = dict1.copy()
-
-    for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge_dicts(result[key], value)
-        else:
-            result[key] = value
-
-    return result
-
-
-def merge_all_universities(data_dir: Path, output_path: Path):
+    workers = min(workers or os.cpu_count() or 1, len(folders))
+    if workers <= 1:
+        return [merge_university(data_dir, folder) for folder in folders]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(merge_university, [data_dir] * len(folders), folders))
+
+
+def merge_all_universities(
+    data_dir: Path,
+    output_path: Path,
+    table_format: Optional[str] = None,
+    incremental: bool = True,
+    workers: Optional[int] = None,
+    conflict_policy: str = "replace",
+    output_format: str = "compact",
+):
     """
     모든 대학의 데이터를 병합하여 하나의 JSON 파일로 저장합니다.
+
+    Args:
+        table_format: 과목 평면 테이블 형식 ("parquet" / "arrow", 기본값 None이면 저장하지 않음)
+        incremental: True면 입력 파일이 바뀌지 않은 대학은 data/cache/merge 의 정규화 결과를 재사용
+        workers: 정규화 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 처리)
+        conflict_policy: 서로 다른 대학 폴더에 같은 학과가 있을 때 처리 방식 ("replace" / "extend" / "error")
+        output_format: 통합 JSON 저장 형식 ("pretty" / "compact" / "zstd", json_io.py)
+            zstd면 학과별 과목 JSON으로 사전을 학습해 출력 파일 옆에 저장합니다.
     """
     print("=" * 60)
     print("데이터셋 병합 시작")
     print("=" * 60)
 
-    all_data = {}
-
-    # 1. 건국대 데이터 병합
-    print("\n[1] 건국대학교 데이터 처리 중...")
-    konkuk_data = merge_konkuk_data(data_dir)
-    all_data = deep_merge_dicts(all_data, konkuk_data)
-
-    # 2. 홍익대 데이터 병합
-    print("\n[2] 홍익대학교 데이터 처리 중...")
-    hongik_data = merge_hongik_data(data_dir)
-    all_data = deep_merge_dicts(all_data, hongik_data)
-
-    # 3. 성균관대 데이터 병합
-    print("\n[3] 성균관대학교 데이터 처리 중...")
-    skku_data = merge_sungkyunkwan_data(data_dir)
-    all_data = deep_merge_dicts(all_data, skku_data)
-
-    # 4. 한양대 데이터 병합
-    print("\n[4] 한양대학교 데이터 처리 중...")
-    hanyang_data = merge_standard_format_data(data_dir, "hanyang")
-    all_data = deep_merge_dicts(all_data, hanyang_data)
-
-    # 5. 서울대 데이터 병합
-    print("\n[5] 서울대학교 데이터 처리 중...")
-    seoul_data = merge_standard_format_data(data_dir, "seoul")
-    all_data = deep_merge_dicts(all_data, seoul_data)
-
-    # 6. 이화여대 데이터 병합
-    print("\n[6] 이화여자대학교 데이터 처리 중...")
-    ewha_data = merge_standard_format_data(data_dir, "ewha")
-    all_data = deep_merge_dicts(all_data, ewha_data)
-
-    # 7. 부산대 데이터 병합
-    print("\n[7] 부산대학교 데이터 처리 중...")
-    busan_data = merge_standard_format_data(data_dir, "busan")
-    all_data = deep_merge_dicts(all_data, busan_data)
-
-    # 8. 충북대 데이터 병합
-    print("\n[8] 충북대학교 데이터 처리 중...")
-    chungbook_data = merge_standard_format_data(data_dir, "chungbook")
-    all_data = deep_merge_dicts(all_data, chungbook_data)
-
-    # 9. 강원대 데이터 병합
-    print("\n[9] 강원대학교 데이터 처리 중...")
-    gangwon_data = merge_standard_format_data(data_dir, "gangwon")
-    all_data = deep_merge_dicts(all_data, gangwon_data)
-
-    # 10. 경북대 데이터 병합
-    print("\n[10] 경북대학교 데이터 처리 중...")
-    gyungbook_data = merge_standard_format_data(data_dir, "gyungbook")
-    all_data = deep_merge_dicts(all_data, gyungbook_data)
-
-    # 11. 경상대 데이터 병합
-    print("\n[11] 경상대학교 데이터 처리 중...")
-    gyungsang_data = merge_standard_format_data(data_dir, "gyungsang")
-    all_data = deep_merge_dicts(all_data, gyungsang_data)
-
-    # 12. 제주대 데이터 병합
-    print("\n[12] 제주대학교 데이터 처리 중...")
-    jeju_data = merge_standard_format_data(data_dir, "jeju")
-    all_data = deep_merge_dicts(all_data, jeju_data)
-
-    # 13. 전북대 데이터 병합
-    print("\n[13] 전북대학교 데이터 처리 중...")
-    junbook_data = merge_standard_format_data(data_dir, "junbook")
-    all_data = deep_merge_dicts(all_data, junbook_data)
-
-    # 14. 고려대 데이터 병합
-    print("\n[14] 고려대학교 데이터 처리 중...")
-    korea_data = merge_korea_data(data_dir)
-    all_data = deep_merge_dicts(all_data, korea_data)
-
-    # 15. 서강대 데이터 병합
-    print("\n[15] 서강대학교 데이터 처리 중...")
-    seogang_data = merge_seogang_data(data_dir)
-    all_data = deep_merge_dicts(all_data, seogang_data)
+    manifest = MergeManifest(data_dir / "cache" / "merge", CODE_VERSION)
+    output_settings = {
+        "output_path": str(output_path),
+        "output_format": output_format,
+        "table_format": table_format,
+        "conflict_policy": conflict_policy,
+        "code_version": OUTPUT_CODE_VERSION,
+    }
+
+    fingerprints = {
+        folder: manifest.fingerprint(folder, source_files(data_dir, folder))
+        for folder, _ in UNIVERSITIES
+    }
+
+    # 0) 입력도 저장 설정도 그대로면 shard를 디코딩하거나 출력을 다시 만들지 않음
+    if (incremental
+            and all(manifest.is_current(folder, fingerprints[folder]) for folder, _ in UNIVERSITIES)
+            and manifest.output_reusable(output_settings)):
+        manifest.save()
+        print("입력 변경 없음 - 이전 병합 결과를 그대로 사용합니다.")
+        for path in manifest.output["files"]:
+            print(f"  {path}")
+        for folder, univ_label in UNIVERSITIES:
+            records = manifest.entries[folder]["records"]
+            print(f"{univ_label}: {records['departments']}개 학과, {records['courses']}개 과목")
+        print("=" * 60)
+        return
+
+    # 1) 캐시 확인: 입력이 바뀐 대학만 다시 정규화
+    results: Dict[str, Dict] = {}
+    for step, (folder, univ_label) in enumerate(UNIVERSITIES, start=1):
+        univ_data = manifest.load_shard(folder, fingerprints[folder]) if incremental else None
+
+        if univ_data is not None:
+            univ_data = decode_tree(univ_data, folder)
+            records = manifest.entries[folder]["records"]
+            print(f"[{step}] {univ_label}: 입력 변경 없음 - {records['departments']}개 학과, {records['courses']}개 과목 재사용")
+            results[folder] = univ_data
+
+    stale = [folder for folder, _ in UNIVERSITIES if folder not in results]
+
+    # 2) 바뀐 대학들을 병렬로 정규화
+    if stale:
+        labels = dict(UNIVERSITIES)
+        print(f"\n정규화 대상 {len(stale)}개 대학: {', '.join(labels[f] for f in stale)}")
+        for folder, (univ_data, rule_hits) in zip(stale, merge_universities_parallel(data_dir, stale, workers)):
+            manifest.store_shard(folder, fingerprints[folder], univ_data, rule_hits)
+            results[folder] = univ_data
+
+    manifest.save()
+
+    # 정규화 규칙별 적용 횟수 (캐시를 재사용한 대학은 저장된 값)
+    print("\n정규화 규칙 적용 횟수:")
+    for folder, _ in UNIVERSITIES:
+        for rule_name, count in manifest.entries[folder].get("rule_hits", {}).items():
+            print(f"  {folder} {rule_name}: {count}")
+
+    # 3) 병합 순서대로 하나의 트리에 합치기 (복사 없이 제자리 병합)
+    builder = CourseTreeBuilder(conflict_policy)
+    for folder, _ in UNIVERSITIES:
+        builder.merge(results.pop(folder), source=folder)
+    all_data = builder.tree
+
+    if builder.conflicts:
+        print()
+        builder.report()
 
     # 16. 통합 데이터 저장
     print("\n" + "=" * 60)
     print("통합 데이터 저장 중...")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(all_data, f, ensure_ascii=False, indent=2)
-
-    print(f"[OK] 저장 완료: {output_path}")
+    output_files = []
+    dictionary = None
+    if output_format == "zstd":
+        dictionary = train_dictionary(department_samples(all_data))
+        if dictionary is not None:
+            dictionary_path = save_dictionary(dictionary, output_path.parent)
+            output_files.append(dictionary_path)
+            print(f"[OK] zstd 사전 저장: {dictionary_path}")
+
+    saved_path = write_json(all_data, output_path, output_format, indent=2, dictionary=dictionary)
+    output_files.append(saved_path)
+    print(f"[OK] 저장 완료: {saved_path} ({saved_path.stat().st_size / 1e6:.1f}MB)")
+
+    # 과목 평면 테이블 저장 (요청한 경우만, merged_university_courses.parquet)
+    if table_format:
+        table_path = export_course_table(all_data, output_path, table_format)
+        if table_path is not None:
+            output_files.append(table_path)
+
+    # 다음 실행에서 입력이 그대로면 이 출력들을 재사용 (테이블을 만들지 못했으면 기록하지 않음)
+    if not table_format or table_path is not None:
+        manifest.record_output(output_settings, output_files)
+        manifest.save()
 
     # 17. 통계 출력
     print("\n" + "=" * 60)
@@ -476,7 +380,7 @@ def main():
         print(f"오류: {data_dir} 폴더를 찾을 수 없습니다.")
         return
 
-    merge_all_universities(data_dir, output_path)
+    merge_all_universities(data_dir, output_path, table_format=os.getenv("MERGE_TABLE_FORMAT") or None)
 
 
 if __name__ == "__main__":
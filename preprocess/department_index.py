@@ -0,0 +1,151 @@
+"""
+학과명 역색인
+
+"컴퓨터공학과를 개설한 대학은?" 같은 질의를 트리 전체 순회 없이 dict 조회 한 번으로 답하기 위한 색인입니다.
+정규화한 학과명 → [(대학, 단과대학, 학과명), ...] postings를 만들어 JSON으로 저장합니다.
+
+학과명 정규화 (normalize_department):
+- 괄호 안 내용 제거: "약학과(6년제)" → "약학과", "건축학과 (5)" → "건축학과"
+- 공백 제거, 유니코드 NFC 정규화
+- 학과/학부/전공/과 접미사를 뗀 뒤 끝의 "학"도 제거해 모든 변형을 하나의 키로 모음
+  "인공지능학과" / "인공지능학부" / "인공지능전공" → "인공지능"
+  "컴퓨터공학과" / "컴퓨터공학부" / "컴퓨터공학전공" → "컴퓨터공"
+  (키가 한 글자가 되면 떼지 않음: "수학과" → "수학")
+
+"전기전자공학부 전자공학전공", "화학공학부(나노화학공학)" 처럼 학부와 세부 전공이 함께 있는 이름은
+전체 이름과 함께 세부 전공("전자공학", "나노화학공학")으로도 색인합니다.
+
+사용 예:
+    index = DepartmentIndex.load(project_root / "data/cache/department_index.json")
+    index.universities("컴퓨터공학과")
+"""
+
+import re
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from course_stream import iter_departments
+from json_io import find_json_files, load_json, write_json
+
+INDEX_VERSION = 2
+
+# 괄호와 그 안의 내용
+PARENTHETICAL = re.compile(r"\([^)]*\)|（[^）]*）|\[[^\]]*\]")
+# 세부 전공을 나누는 구분자 (공백 / 괄호)
+PART_SEPARATOR = re.compile(r"[\s()（）\[\]]+")
+
+# 떼어낼 학과 접미사 (긴 접미사부터 검사)
+DEPARTMENT_SUFFIXES = ("학과", "학부", "전공", "과")
+# 접미사를 뗀 뒤 남아야 하는 최소 길이
+MIN_KEY_LENGTH = 2
+
+# 세부 이름으로 색인하지 않을 수식어 (캠퍼스 / 주야간 구분 등)
+QUALIFIERS = {"서울", "ERICA", "주간", "야간", "본"}
+
+Posting = Tuple[str, str, str]
+
+
+def normalize_department(name: str) -> str:
+    """학과명을 색인 키로 정규화합니다."""
+    text = unicodedata.normalize("NFC", name)
+    text = PARENTHETICAL.sub("", text)
+    text = "".join(text.split())
+    for suffix in DEPARTMENT_SUFFIXES:
+        if text.endswith(suffix) and len(text) - len(suffix) >= MIN_KEY_LENGTH:
+            text = text[:-len(suffix)]
+            break
+    if text.endswith("학") and len(text) - 1 >= MIN_KEY_LENGTH:
+        text = text[:-1]
+    return text
+
+
+def department_keys(name: str) -> List[str]:
+    """학과 하나를 색인할 키 목록 (전체 이름 + 세부 전공 이름)"""
+    keys = [normalize_department(name)]
+    for part in PART_SEPARATOR.split(unicodedata.normalize("NFC", name)):
+        if (not part or part in QUALIFIERS or part.endswith(("대학", "캠퍼스"))
+                or any(ch.isdigit() for ch in part)):
+            continue
+        key = normalize_department(part)
+        if len(key) >= MIN_KEY_LENGTH and key not in keys:
+            keys.append(key)
+    return [key for key in keys if key]
+
+
+class DepartmentIndex:
+    def __init__(self, postings: Dict[str, List[Posting]] = None):
+        self.postings: Dict[str, List[Posting]] = postings or {}
+
+    def add(self, university: str, college: str, department: str):
+        posting = (university, college, department)
+        for key in department_keys(department):
+            bucket = self.postings.setdefault(key, [])
+            if posting not in bucket:
+                bucket.append(posting)
+
+    def lookup(self, name: str) -> List[Posting]:
+        """학과명(자유 입력)에 해당하는 (대학, 단과대학, 학과명) 목록"""
+        return self.postings.get(normalize_department(name), [])
+
+    def universities(self, name: str) -> List[str]:
+        """학과명을 개설한 대학 목록 (중복 제거, 색인 순서 유지)"""
+        return list(dict.fromkeys(university for university, _, _ in self.lookup(name)))
+
+    @classmethod
+    def build(cls, departments: Iterable[Tuple[str, str, str]]) -> "DepartmentIndex":
+        index = cls()
+        for university, college, department in departments:
+            index.add(university, college, department)
+        return index
+
+    def save(self, path: Path, output_format: str = "compact") -> Path:
+        return write_json({"version": INDEX_VERSION, "postings": self.postings}, path, output_format)
+
+    @classmethod
+    def load(cls, path: Path) -> "DepartmentIndex":
+        data = load_json(path)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"색인 버전이 다릅니다: {data.get('version')} (다시 생성 필요)")
+        return cls({key: [tuple(p) for p in postings] for key, postings in data["postings"].items()})
+
+
+def build_department_index(preprocessed_dir: Path, index_path: Path, pattern: str = "*_syllabus*.json*") -> DepartmentIndex:
+    """
+    전처리된 과목 파일들의 학과명으로 색인을 만들어 저장합니다.
+
+    Args:
+        preprocessed_dir: data/preprocessed 디렉토리
+        index_path: 저장할 색인 파일 경로
+        pattern: 읽을 파일 패턴
+    """
+    start = time.perf_counter()
+    index = DepartmentIndex.build(
+        (univ_name, college_name, dept_name)
+        for json_file in find_json_files(preprocessed_dir, pattern)
+        for univ_name, college_name, dept_name, _ in iter_departments(json_file)
+    )
+    saved_path = index.save(index_path)
+
+    print(f"[OK] 학과 색인 저장: {saved_path}")
+    print(f"  키 {len(index.postings)}개 ({time.perf_counter() - start:.1f}s)")
+    return index
+
+
+def main():
+    """메인 함수"""
+    # 프로젝트 루트 디렉터리 (preprocess 폴더의 부모)
+    project_root = Path(__file__).parent.parent
+    preprocessed_dir = project_root / "data" / "preprocessed"
+    index_path = project_root / "data" / "cache" / "department_index.json"
+
+    if not preprocessed_dir.exists():
+        print(f"오류: {preprocessed_dir} 폴더를 찾을 수 없습니다.")
+        return
+
+    build_department_index(preprocessed_dir, index_path)
+
+
+if __name__ == "__main__":
+    main()
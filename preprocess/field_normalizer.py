@@ -0,0 +1,94 @@
+"""
+과목 필드 정규화 규칙
+
+대학마다 다른 과목 필드를 표준 스키마
+(grade_semester, course_classification, name, description, 학수번호)로 맞추는 규칙들입니다.
+- 규칙은 선언적으로 정의 (Rename / Default / Convert)
+- FieldNormalizer가 과목 하나에 모든 규칙을 한 번에 적용 (대학마다 트리를 따로 순회하지 않음)
+- 규칙별 적용 횟수(hits)를 집계
+"""
+
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List
+
+
+class Rename:
+    """src 필드를 dst로 이름 변경"""
+
+    def __init__(self, src: str, dst: str):
+        self.src = src
+        self.dst = dst
+        self.name = f"rename:{src}->{dst}"
+
+    def apply(self, course: Dict) -> bool:
+        if self.src not in course:
+            return False
+        course[self.dst] = course.pop(self.src)
+        return True
+
+
+class Default:
+    """field가 없으면 value로 추가"""
+
+    def __init__(self, field: str, value: Any = ""):
+        self.field = field
+        self.value = value
+        self.name = f"default:{field}"
+
+    def apply(self, course: Dict) -> bool:
+        if self.field in course:
+            return False
+        course[self.field] = self.value
+        return True
+
+
+class Convert:
+    """src 필드를 꺼내 func(값, 과목) 결과를 dst에 저장"""
+
+    def __init__(self, src: str, dst: str, func: Callable[[Any, Dict], Any], name: str = ""):
+        self.src = src
+        self.dst = dst
+        self.func = func
+        self.name = name or f"convert:{src}->{dst}"
+
+    def apply(self, course: Dict) -> bool:
+        if self.src not in course:
+            return False
+        value = course.pop(self.src)
+        course[self.dst] = self.func(value, course)
+        return True
+
+
+class FieldNormalizer:
+    def __init__(self, rules: Iterable = ()):
+        self.rules: List = list(rules)
+        self.hits: Counter = Counter()
+
+    def normalize(self, course: Dict) -> Dict:
+        """과목 하나에 규칙들을 순서대로 적용합니다. (제자리 수정)"""
+        for rule in self.rules:
+            if rule.apply(course):
+                self.hits[rule.name] += 1
+        return course
+
+    def normalize_all(self, courses: Iterable[Dict]) -> List[Dict]:
+        return [self.normalize(course) for course in courses]
+
+
+# ------------------------------
+# 대학별 변환 함수
+# ------------------------------
+def korea_year_term(year_term: str, course: Dict) -> str:
+    """고려대 "2025 - 1학기" → "1-1" (학년 정보가 없어 1학년으로 둠)"""
+    if "1학기" in year_term:
+        return "1-1"
+    if "2학기" in year_term:
+        return "1-2"
+    return ""
+
+
+def sogang_grade_semester(grade, course: Dict) -> str:
+    """서강대 grade + course_classification의 전기/후기로 학기 추정 (2 + "전기" → "2-1")"""
+    classification = course.get("course_classification", "")
+    semester = "1" if "전기" in classification else "2" if "후기" in classification else "1"
+    return f"{grade}-{semester}"
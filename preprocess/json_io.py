@@ -0,0 +1,190 @@
+"""
+JSON 입출력 백엔드
+
+파이프라인 출력 파일을 세 가지 형식 중 하나로 저장하고, 읽을 때는 파일 앞부분을 보고 형식을 자동으로 판단합니다.
+- pretty: 들여쓰기 JSON (사람이 직접 열어 보는 파일)
+- compact: 공백 없는 JSON (orjson이 있으면 orjson으로 인코딩/디코딩)
+- zstd: compact JSON을 zstd로 압축 (파일명 뒤에 .zst)
+  과목 설명처럼 비슷한 한국어 문장이 반복되므로 학과별 JSON 샘플로 사전(dictionary)을 학습해 함께 쓸 수 있음
+  사전은 출력 파일과 같은 폴더에 {이름}.zdict 로 저장(매 실행 덮어씀)하고, 읽을 때 프레임의 dict_id로 찾음
+
+orjson, zstandard는 선택 패키지입니다. (pip install orjson zstandard)
+"""
+
+import io
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+from course_record import encode_course
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+OUTPUT_FORMATS = ("pretty", "compact", "zstd")
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+ZSTD_SUFFIX = ".zst"
+ZSTD_LEVEL = 10
+DICT_SUFFIX = ".zdict"
+DICT_SIZE = 112640
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError("zstd 형식에는 zstandard 패키지가 필요합니다. (pip install zstandard)") from None
+    return zstandard
+
+
+def dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    """JSON 바이트로 인코딩합니다. indent가 없으면 공백 없는 JSON"""
+    if indent is None:
+        if orjson is not None:
+            return orjson.dumps(data, default=encode_course)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=encode_course).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=indent, default=encode_course).encode("utf-8")
+
+
+def output_path_for(path: Path, output_format: str) -> Path:
+    """형식에 맞는 저장 경로 (zstd면 .zst 추가)"""
+    path = Path(path)
+    if output_format == "zstd" and path.suffix != ZSTD_SUFFIX:
+        return path.with_name(path.name + ZSTD_SUFFIX)
+    return path
+
+
+def department_samples(tree: Dict) -> List[bytes]:
+    """{대학: {단과대학: {학과: [과목, ...]}}} 트리에서 학과별 JSON 샘플 (사전 학습용)"""
+    return [
+        dumps(courses)
+        for colleges in tree.values()
+        for departments in colleges.values()
+        for courses in departments.values()
+        if courses
+    ]
+
+
+def train_dictionary(samples: Iterable[bytes], dict_size: int = DICT_SIZE):
+    """샘플로 zstd 사전을 학습합니다. 샘플이 너무 적어 학습할 수 없으면 None"""
+    zstandard = _zstd()
+    samples = list(samples)
+    try:
+        return zstandard.train_dictionary(dict_size, samples)
+    except zstandard.ZstdError as e:
+        print(f"경고: zstd 사전 학습 실패, 사전 없이 압축합니다. ({len(samples)}개 샘플: {e})")
+        return None
+
+
+def save_dictionary(dictionary, directory: Path, name: str = "courses") -> Path:
+    """사전을 {name}.zdict 로 저장합니다. (이전 실행의 사전은 덮어써서 사전 파일이 쌓이지 않음)"""
+    path = Path(directory) / f"{name}{DICT_SUFFIX}"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(dictionary.as_bytes())
+    os.replace(tmp, path)
+    return path
+
+
+def find_dictionary(directory: Path, dict_id: int):
+    """폴더의 사전 파일 중 dict_id가 같은 사전을 찾아 로드합니다."""
+    zstandard = _zstd()
+    for path in sorted(Path(directory).glob(f"*{DICT_SUFFIX}")):
+        dictionary = zstandard.ZstdCompressionDict(path.read_bytes())
+        if dictionary.dict_id() == dict_id:
+            return dictionary
+    raise FileNotFoundError(f"{directory}에서 zstd 사전(dict_id={dict_id})을 찾을 수 없습니다.")
+
+
+def json_stem(path: Path) -> str:
+    """JSON 파일명에서 .json / .json.zst 확장자를 뗀 이름 ("hongik_컴퓨터공학.json.zst" → "hongik_컴퓨터공학")"""
+    name = Path(path).name
+    if name.endswith(ZSTD_SUFFIX):
+        name = name[:-len(ZSTD_SUFFIX)]
+    return name[:-len(".json")] if name.endswith(".json") else Path(name).stem
+
+
+def find_json_files(directory: Path, pattern: str = "*.json*") -> List[Path]:
+    """
+    폴더에서 pattern에 맞는 JSON 파일 목록 (이름순)을 찾습니다.
+    pattern이 .json으로 끝나면("*.json") 같은 이름의 .json.zst 압축 파일도 함께 찾습니다.
+    x.json과 x.json.zst가 함께 있으면 같은 데이터이므로 하나만 사용합니다. (더 최근 파일, 같으면 압축하지 않은 파일)
+    쓰는 중인 임시 파일(.tmp) 등 JSON이 아닌 파일은 제외합니다.
+    """
+    directory = Path(directory)
+    paths = set(directory.glob(pattern))
+    if pattern.endswith(".json"):
+        paths.update(directory.glob(pattern + ZSTD_SUFFIX))
+
+    chosen: Dict[str, tuple] = {}
+    for path in paths:
+        if path.name.endswith(".json"):
+            stem, compressed = path.name, False
+        elif path.name.endswith(".json" + ZSTD_SUFFIX):
+            stem, compressed = path.name[:-len(ZSTD_SUFFIX)], True
+        else:
+            continue
+        rank = (path.stat().st_mtime, not compressed)
+        if stem not in chosen or rank > chosen[stem][0]:
+            chosen[stem] = (rank, path)
+    return [path for _, (_, path) in sorted(chosen.items())]
+
+
+def write_json(
+    data: Any,
+    path: Path,
+    output_format: str = "pretty",
+    indent: int = 2,
+    dictionary=None,
+) -> Path:
+    """
+    JSON 데이터를 저장합니다. (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        output_format: "pretty" / "compact" / "zstd"
+        indent: pretty 형식의 들여쓰기
+        dictionary: zstd 압축에 쓸 사전 (train_dictionary 결과, 읽을 때 필요하므로 save_dictionary로 함께 저장)
+
+    Returns:
+        실제 저장한 경로 (zstd면 .zst가 붙음)
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"지원하지 않는 출력 형식: {output_format}")
+
+    path = output_path_for(path, output_format)
+    payload = dumps(data, indent if output_format == "pretty" else None)
+    if output_format == "zstd":
+        zstandard = _zstd()
+        payload = zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dictionary).compress(payload)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+    return path
+
+
+def open_json_text(path: Path) -> TextIO:
+    """형식을 판단해 JSON 텍스트 스트림으로 엽니다. (zstd면 압축을 풀면서 읽음)"""
+    path = Path(path)
+    raw = open(path, "rb")
+    header = raw.peek(18)[:18] if hasattr(raw, "peek") else b""
+    if not header.startswith(ZSTD_MAGIC):
+        return io.TextIOWrapper(raw, encoding="utf-8")
+
+    zstandard = _zstd()
+    dict_id = zstandard.get_frame_parameters(header).dict_id
+    dictionary = find_dictionary(path.parent, dict_id) if dict_id else None
+    reader = zstandard.ZstdDecompressor(dict_data=dictionary).stream_reader(raw, closefd=True)
+    return io.TextIOWrapper(reader, encoding="utf-8")
+
+
+def load_json(path: Path) -> Any:
+    """pretty / compact / zstd JSON 파일을 읽습니다."""
+    with open_json_text(path) as f:
+        if orjson is not None:
+            return orjson.loads(f.read())
+        return json.load(f)
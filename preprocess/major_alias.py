@@ -0,0 +1,185 @@
+"""
+학과명 → 커리어넷 표준 학과 별칭 맵
+
+data/raw/major_list_v2.json의 표준 학과(mClass)마다 facilName에 실제 대학 학과명들이 쉼표로 나열되어 있습니다.
+이를 미리 풀어서 정규화한 학과명 → 표준 학과(lClass / mClass / majorSeq) 별칭 테이블로 저장해 두고,
+사용자가 자유롭게 입력한 학과명을 표준 학과로 바로 변환합니다.
+- 정확히 일치: 정규화한 이름으로 dict 조회 (department_index.normalize_department와 같은 규칙)
+- 처음 보는 이름: 문자 2-gram 역색인으로 후보를 모아 Dice 유사도가 가장 높은 별칭으로 대체
+
+사용 예:
+    aliases = MajorAliasMap.load(project_root / "data/cache/major_aliases.json")
+    majors, score = aliases.resolve("컴퓨터소프트웨어공학부")
+"""
+
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from department_index import normalize_department
+from json_io import load_json, write_json
+
+ALIAS_VERSION = 2
+
+# 유사도 대체 결과로 인정할 최소 Dice 점수
+MIN_SCORE = 0.5
+
+
+class Major(NamedTuple):
+    l_class: str
+    m_class: str
+    major_seq: str
+
+
+def split_facil_names(facil_name: str) -> List[str]:
+    """facilName을 쉼표로 나눕니다. (괄호 안의 쉼표는 나누지 않음: "사회계열(법학과,행정학과)")"""
+    names = []
+    depth = 0
+    current = []
+    for ch in facil_name:
+        if ch in "([（":
+            depth += 1
+        elif ch in ")]）":
+            depth = max(depth - 1, 0)
+        elif ch == "," and depth == 0:
+            names.append("".join(current).strip())
+            current = []
+            continue
+        current.append(ch)
+    names.append("".join(current).strip())
+    return [name for name in names if name]
+
+
+def iter_major_entries(major_list_path: Path) -> Iterator[Dict]:
+    """major_list_v2.json의 계열별 content 항목들을 순서대로 yield 합니다."""
+    for group in load_json(major_list_path):
+        yield from group["dataSearch"]["content"]
+
+
+def bigrams(key: str) -> List[str]:
+    """문자 2-gram (한 글자 키는 그 글자 자체)"""
+    if len(key) < 2:
+        return [key] if key else []
+    return [key[i:i + 2] for i in range(len(key) - 1)]
+
+
+class MajorAliasMap:
+    def __init__(self, majors: List[Major] = None, aliases: Dict[str, List[int]] = None):
+        self.majors: List[Major] = majors or []
+        # 정규화한 학과명 → majors 인덱스 목록
+        self.aliases: Dict[str, List[int]] = aliases or {}
+        self._grams: Optional[Dict[str, List[str]]] = None
+        self._gram_counts: Dict[str, int] = {}
+
+    def add(self, name: str, major_index: int):
+        key = normalize_department(name)
+        if not key:
+            return
+        bucket = self.aliases.setdefault(key, [])
+        if major_index not in bucket:
+            bucket.append(major_index)
+
+    @classmethod
+    def build(cls, entries: Iterator[Dict]) -> "MajorAliasMap":
+        alias_map = cls()
+        for entry in entries:
+            alias_map.majors.append(Major(entry["lClass"], entry["mClass"], entry["majorSeq"]))
+            major_index = len(alias_map.majors) - 1
+            alias_map.add(entry["mClass"], major_index)
+            for name in split_facil_names(entry.get("facilName", "")):
+                alias_map.add(name, major_index)
+        return alias_map
+
+    def lookup(self, name: str) -> List[Major]:
+        """정확히 일치하는 별칭의 표준 학과 목록"""
+        return [self.majors[i] for i in self.aliases.get(normalize_department(name), ())]
+
+    def _gram_index(self) -> Dict[str, List[str]]:
+        """2-gram → 별칭 키 역색인 (처음 대체 검색할 때 한 번 만듦)"""
+        if self._grams is None:
+            self._grams = {}
+            for key in self.aliases:
+                key_grams = set(bigrams(key))
+                self._gram_counts[key] = len(key_grams)
+                for gram in key_grams:
+                    self._grams.setdefault(gram, []).append(key)
+        return self._grams
+
+    def closest_alias(self, name: str) -> Tuple[Optional[str], float]:
+        """2-gram Dice 유사도가 가장 높은 별칭 키와 점수"""
+        query = set(bigrams(normalize_department(name)))
+        if not query:
+            return None, 0.0
+
+        grams = self._gram_index()
+        overlap = Counter(key for gram in query for key in grams.get(gram, ()))
+
+        best_key, best_score = None, 0.0
+        for key, shared in overlap.items():
+            score = 2 * shared / (len(query) + self._gram_counts[key])
+            # 점수가 같으면 더 짧은(더 일반적인) 별칭
+            if score > best_score or (score == best_score and best_key is not None and len(key) < len(best_key)):
+                best_key, best_score = key, score
+        return best_key, best_score
+
+    def resolve(self, name: str, min_score: float = MIN_SCORE) -> Tuple[List[Major], float]:
+        """
+        자유 입력 학과명을 표준 학과로 변환합니다.
+
+        Returns:
+            (표준 학과 목록, 점수) - 정확히 일치하면 1.0, 유사도 대체면 Dice 점수, 찾지 못하면 ([], 0.0)
+        """
+        majors = self.lookup(name)
+        if majors:
+            return majors, 1.0
+
+        key, score = self.closest_alias(name)
+        if key is None or score < min_score:
+            return [], 0.0
+        return [self.majors[i] for i in self.aliases[key]], score
+
+    def save(self, path: Path, output_format: str = "compact") -> Path:
+        data = {
+            "version": ALIAS_VERSION,
+            "majors": [list(major) for major in self.majors],
+            "aliases": self.aliases,
+        }
+        return write_json(data, path, output_format)
+
+    @classmethod
+    def load(cls, path: Path) -> "MajorAliasMap":
+        data = load_json(path)
+        if data.get("version") != ALIAS_VERSION:
+            raise ValueError(f"별칭 맵 버전이 다릅니다: {data.get('version')} (다시 생성 필요)")
+        return cls([Major(*major) for major in data["majors"]], data["aliases"])
+
+
+def build_major_aliases(major_list_path: Path, alias_path: Path) -> MajorAliasMap:
+    """major_list_v2.json으로 별칭 맵을 만들어 저장합니다."""
+    start = time.perf_counter()
+    alias_map = MajorAliasMap.build(iter_major_entries(major_list_path))
+    saved_path = alias_map.save(alias_path)
+
+    print(f"[OK] 학과 별칭 맵 저장: {saved_path}")
+    print(f"  표준 학과 {len(alias_map.majors)}개, 별칭 {len(alias_map.aliases)}개 "
+          f"({time.perf_counter() - start:.1f}s)")
+    return alias_map
+
+
+def main():
+    """메인 함수"""
+    # 프로젝트 루트 디렉터리 (preprocess 폴더의 부모)
+    project_root = Path(__file__).parent.parent
+    major_list_path = project_root / "data" / "raw" / "major_list_v2.json"
+    alias_path = project_root / "data" / "cache" / "major_aliases.json"
+
+    if not major_list_path.exists():
+        print(f"오류: {major_list_path} 파일을 찾을 수 없습니다.")
+        return
+
+    build_major_aliases(major_list_path, alias_path)
+
+
+if __name__ == "__main__":
+    main()
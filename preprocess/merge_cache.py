@@ -0,0 +1,149 @@
+"""
+증분 병합 캐시
+
+대학 폴더별 입력 파일의 해시/크기와 정규화 결과 통계를 manifest.json에 기록하고,
+정규화가 끝난 대학별 결과(shard)를 저장해 둡니다.
+재실행 시 입력 파일이 바뀌지 않은 대학은 shard를 그대로 읽고, 바뀐 대학만 다시 정규화합니다.
+- 파일 크기와 수정 시각이 같으면 해시를 다시 계산하지 않음
+- 병합 코드가 바뀌면(code_version) 모든 shard를 무효화
+- 통합 출력 파일(JSON / 사전 / 테이블)의 저장 설정과 입력 상태도 기록해서,
+  입력도 설정도 그대로면 shard를 읽지 않고 이전 출력을 그대로 사용
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from json_io import load_json, write_json
+
+MANIFEST_NAME = "manifest.json"
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def count_records(data: Dict) -> Dict[str, int]:
+    """대학별 결과의 학과 수 / 과목 수"""
+    departments = 0
+    courses = 0
+    for colleges in data.values():
+        for depts in colleges.values():
+            departments += len(depts)
+            courses += sum(len(items) for items in depts.values())
+    return {"departments": departments, "courses": courses}
+
+
+class MergeManifest:
+    def __init__(self, cache_dir: Path, code_version: str):
+        self.cache_dir = Path(cache_dir)
+        self.shard_dir = self.cache_dir / "shards"
+        self.path = self.cache_dir / MANIFEST_NAME
+        self.code_version = code_version
+        self.entries: Dict[str, Dict] = {}
+        self.output: Dict = {}
+
+        if self.path.exists():
+            try:
+                manifest = json.loads(self.path.read_text(encoding="utf-8"))
+            except ValueError:
+                manifest = {}
+            if manifest.get("code_version") == code_version:
+                self.entries = manifest.get("sources", {})
+                self.output = manifest.get("output", {})
+
+    def fingerprint(self, source: str, paths: List[Path]) -> Dict[str, Dict]:
+        """
+        입력 파일별 {sha256, size, mtime_ns} (이전 기록과 크기/시각이 같으면 해시 재사용)
+
+        Args:
+            source: 대학 폴더명 (manifest 항목 이름)
+            paths: 병합이 실제로 읽는 입력 파일 목록 (dataset_merge.source_files)
+        """
+        previous = self.entries.get(source, {}).get("files", {})
+        files = {}
+        for path in paths:
+            stat = path.stat()
+            old = previous.get(path.name)
+            if old and old["size"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns:
+                digest = old["sha256"]
+            else:
+                digest = file_sha256(path)
+            files[path.name] = {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        return files
+
+    @staticmethod
+    def _same_content(a: Dict[str, Dict], b: Dict[str, Dict]) -> bool:
+        return {k: v["sha256"] for k, v in a.items()} == {k: v["sha256"] for k, v in b.items()}
+
+    def _shard_path(self, source: str) -> Path:
+        return self.shard_dir / f"{source}.json"
+
+    def is_current(self, source: str, files: Dict[str, Dict]) -> bool:
+        """입력 파일 내용이 저장된 shard를 만들 때와 같은지 (shard는 읽지 않음)"""
+        entry = self.entries.get(source)
+        if not entry or not self._shard_path(source).exists() or not self._same_content(entry["files"], files):
+            return False
+        # 내용은 같고 수정 시각만 바뀐 경우 다음 실행에서 해시를 다시 계산하지 않도록 갱신
+        entry["files"] = files
+        return True
+
+    def load_shard(self, source: str, files: Dict[str, Dict]) -> Optional[Dict]:
+        """입력 파일이 그대로면 저장된 정규화 결과를, 아니면 None을 반환합니다."""
+        if not self.is_current(source, files):
+            return None
+        try:
+            return load_json(self._shard_path(source))
+        except ValueError:
+            return None
+
+    def inputs_digest(self) -> str:
+        """모든 대학 입력 파일 해시를 하나로 요약한 값 (통합 출력이 어떤 입력으로 만들어졌는지 기록용)"""
+        inputs = {
+            source: {name: info["sha256"] for name, info in entry["files"].items()}
+            for source, entry in self.entries.items()
+        }
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def record_output(self, settings: Dict, paths: List[Path]):
+        """통합 출력의 저장 설정, 입력 상태, 출력 파일들의 크기/수정 시각을 기록합니다."""
+        self.output = {
+            "settings": settings,
+            "inputs": self.inputs_digest(),
+            "files": {
+                str(path): {"size": path.stat().st_size, "mtime_ns": path.stat().st_mtime_ns}
+                for path in paths
+            },
+        }
+
+    def output_reusable(self, settings: Dict) -> bool:
+        """같은 설정 / 같은 입력으로 만든 출력 파일들이 그대로 남아 있는지"""
+        if not self.output or self.output.get("settings") != settings or self.output.get("inputs") != self.inputs_digest():
+            return False
+        for path, info in self.output["files"].items():
+            try:
+                stat = Path(path).stat()
+            except OSError:
+                return False
+            if stat.st_size != info["size"] or stat.st_mtime_ns != info["mtime_ns"]:
+                return False
+        return True
+
+    def store_shard(self, source: str, files: Dict[str, Dict], data: Dict, rule_hits: Optional[Dict[str, int]] = None):
+        """정규화 결과를 저장하고 manifest 항목을 갱신합니다. (규칙별 적용 횟수도 함께 기록)"""
+        write_json(data, self._shard_path(source), "compact")
+
+        self.entries[source] = {"files": files, "records": count_records(data), "rule_hits": rule_hits or {}}
+
+    def save(self):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        manifest = {"code_version": self.code_version, "sources": self.entries, "output": self.output}
+        tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
@@ -5,6 +5,7 @@
 - https://www.adiga.kr/ucp/uvt/uni/univDetail.do?menuId=PCUVTINF2000&unvCd={**univCd**}&searchSyr=2026
 """
 
+import asyncio
 import json
 from bs4 import BeautifulSoup
 from pathlib import Path
@@ -78,6 +79,7 @@ def check_university_accessibility(universities_dict, output_json_path, search_y
     """
     import requests
     from time import sleep
+    from http_client import get_client
     
     base_url = "https://www.adiga.kr/ucp/uvt/uni/univDetail.do"
     results = {}
@@ -91,8 +93,8 @@ def check_university_accessibility(universities_dict, output_json_path, search_y
         url = f"{base_url}?menuId=PCUVTINF2000&unvCd={univ_code}&searchSyr={search_year}"
         
         try:
-            # HTTP 요청
-            response = requests.get(url, timeout=10)
+            # HTTP 요청 (접속 점검이므로 캐시 없이 풀링된 세션만 사용)
+            response = get_client().get(url, timeout=10, cache=False)
             status_code = response.status_code
             accessible = status_code == 200
             
@@ -146,6 +148,128 @@ def check_university_accessibility(universities_dict, output_json_path, search_y
     return results
 
 
+def probe_once(client, url, method, timeout):
+    """HEAD 또는 GET 한 번으로 접속 여부를 확인합니다."""
+    if method == "HEAD":
+        return client.head(url, timeout=timeout, allow_redirects=True)
+    return client.get(url, timeout=timeout, cache=False)
+
+
+async def check_university_accessibility_async(
+    universities_dict,
+    output_json_path,
+    search_year=2026,
+    rate_per_sec=2.0,
+    concurrency=4,
+    timeout=10,
+):
+    """
+    각 대학의 univCd로 접속 가능 여부를 비동기로 점검
+
+    고정 sleep 대신 호스트별 토큰 버킷으로 초당 요청 수를 제한합니다.
+    (기본값 2회/초 = 기존 sleep(0.5)과 같은 최대 요청 빈도)
+    HEAD로 먼저 점검하고 200이 아니면 GET으로 한 번 더 확인하며,
+    결과는 완료되는 대로 저널에 기록한 뒤 입력 순서대로 JSON 파일을 만듭니다.
+
+    Args:
+        universities_dict: 대학명과 코드가 담긴 딕셔너리
+        output_json_path: 결과를 저장할 JSON 파일 경로
+        search_year: 검색 학년도 (기본값: 2026)
+        rate_per_sec: 호스트당 초당 최대 요청 수
+        concurrency: 동시에 진행 중인 요청 수 상한
+        timeout: 요청 타임아웃(초)
+    """
+    import requests
+    from concurrent.futures import ThreadPoolExecutor
+    from http_client import HostRateLimiter, get_client
+    from crawl_journal import CrawlJournal, journal_path_for
+
+    base_url = "https://www.adiga.kr/ucp/uvt/uni/univDetail.do"
+    client = get_client()
+    limiter = HostRateLimiter(rate_per_sec)
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    total = len(universities_dict)
+    print(f"\n총 {total}개 대학의 접속 가능 여부를 점검합니다... (호스트당 {rate_per_sec}회/초)")
+    print("=" * 60)
+
+    journal = CrawlJournal(journal_path_for(output_json_path))
+    done = len(journal)
+
+    async def check(executor, univ_name, univ_code):
+        nonlocal done
+        url = f"{base_url}?menuId=PCUVTINF2000&unvCd={univ_code}&searchSyr={search_year}"
+
+        async with semaphore:
+            try:
+                # HEAD로 먼저 점검 → 지원하지 않거나 200이 아니면 GET으로 재확인
+                await limiter.acquire(url)
+                response = await loop.run_in_executor(executor, probe_once, client, url, "HEAD", timeout)
+                if response.status_code != 200:
+                    await limiter.acquire(url)
+                    response = await loop.run_in_executor(executor, probe_once, client, url, "GET", timeout)
+
+                status_code = response.status_code
+                accessible = status_code == 200
+                result = {
+                    "code": univ_code,
+                    "url": url,
+                    "status_code": status_code,
+                    "accessible": accessible,
+                    "response_time_ms": int(response.elapsed.total_seconds() * 1000)
+                }
+                status_icon = "✓" if accessible else "✗"
+                message = f"{status_icon} {univ_name} (코드: {univ_code}) - {status_code}"
+
+            except requests.exceptions.Timeout:
+                result = {
+                    "code": univ_code,
+                    "url": url,
+                    "status_code": None,
+                    "accessible": False,
+                    "error": "Timeout"
+                }
+                message = f"✗ {univ_name} (코드: {univ_code}) - Timeout"
+
+            except requests.exceptions.RequestException as e:
+                result = {
+                    "code": univ_code,
+                    "url": url,
+                    "status_code": None,
+                    "accessible": False,
+                    "error": str(e)
+                }
+                message = f"✗ {univ_name} (코드: {univ_code}) - Error: {str(e)[:50]}"
+
+        journal.append(univ_name, result)
+        done += 1
+        print(f"[{done}/{total}] {message}")
+
+    pending = [(name, code) for name, code in universities_dict.items() if name not in journal]
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            await asyncio.gather(*(check(executor, name, code) for name, code in pending))
+
+        # 완료 순서와 관계없이 입력 순서대로 저장
+        results = dict(zip(universities_dict, journal.payloads(universities_dict)))
+        with open(output_json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        journal.discard()
+    finally:
+        journal.close()
+
+    # 통계 출력
+    print("\n" + "=" * 60)
+    accessible_count = sum(1 for r in results.values() if r.get('accessible', False))
+    print(f"\n✅ 접속 가능: {accessible_count}개")
+    print(f"❌ 접속 불가: {total - accessible_count}개")
+    print(f"\n결과가 {output_json_path}에 저장되었습니다.")
+
+    return results
+
+
 if __name__ == "__main__":
     # 파일 경로 설정
     script_dir = Path(__file__).parent
@@ -163,4 +287,6 @@ if __name__ == "__main__":
     print("\n" + "=" * 60)
     print("2단계: 각 대학 URL 접속 가능 여부 점검")
     print("=" * 60)
-    accessibility_results = check_university_accessibility(universities, accessibility_file)
\ No newline at end of file
+    accessibility_results = asyncio.run(
+        check_university_accessibility_async(universities, accessibility_file)
+    )
\ No newline at end of file
@@ -0,0 +1,196 @@
+"""
+브라우저 네트워크 응답 캡처 유틸리티
+
+페이지가 이미 호출하고 있는 XHR / fetch 요청과 응답을 페이지 안에서 기록해 두고,
+렌더링된 DOM 대신 응답 JSON에서 데이터를 읽을 수 있게 합니다.
+- install_response_capture: 요청/응답 기록 스크립트 주입
+- drain_responses: 기록된 요청/응답을 꺼내고 비움
+- iter_json_records: 응답 JSON 안에서 특정 키를 가진 dict 찾기
+- replay_requests: 캡처한 요청을 파라미터만 바꿔 페이지 세션(쿠키)으로 동시에 재요청
+"""
+
+import json
+from typing import Dict, Iterable, Iterator, List, Optional
+from urllib.parse import parse_qsl, urlencode
+
+from selenium.common.exceptions import WebDriverException
+
+# 최근 응답만 보관 (메모리 보호)
+MAX_CAPTURED = 300
+
+CAPTURE_JS = """
+(function () {
+    if (window.__netCapture) { return; }
+    var store = window.__netCapture = [];
+    var limit = %d;
+    function push(entry) {
+        store.push(entry);
+        if (store.length > limit) { store.shift(); }
+    }
+
+    var open = XMLHttpRequest.prototype.open;
+    var setHeader = XMLHttpRequest.prototype.setRequestHeader;
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__cap = {method: String(method).toUpperCase(), url: String(url), headers: {}};
+        return open.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.setRequestHeader = function (name, value) {
+        if (this.__cap) { this.__cap.headers[name] = value; }
+        return setHeader.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function (body) {
+        var xhr = this, cap = this.__cap;
+        if (cap) {
+            cap.body = typeof body === 'string' ? body : null;
+            xhr.addEventListener('loadend', function () {
+                var text = null;
+                try { text = (xhr.responseType === '' || xhr.responseType === 'text') ? xhr.responseText : null; } catch (e) {}
+                cap.status = xhr.status;
+                cap.responseURL = xhr.responseURL;
+                cap.text = text;
+                push(cap);
+            });
+        }
+        return send.apply(this, arguments);
+    };
+
+    if (window.fetch) {
+        var origFetch = window.fetch;
+        window.fetch = function (input, init) {
+            init = init || {};
+            // replay_requests의 재요청은 기록하지 않음 (페이지 요청이 보관 한도에서 밀려나지 않도록)
+            if (init.__replay) { return origFetch.apply(this, arguments); }
+            var cap = {
+                method: String(init.method || 'GET').toUpperCase(),
+                url: typeof input === 'string' ? input : input.url,
+                headers: init.headers || {},
+                body: typeof init.body === 'string' ? init.body : null
+            };
+            return origFetch.apply(this, arguments).then(function (res) {
+                res.clone().text().then(function (text) {
+                    cap.status = res.status;
+                    cap.responseURL = res.url;
+                    cap.text = text;
+                    push(cap);
+                }, function () {});
+                return res;
+            });
+        };
+    }
+})();
+""" % MAX_CAPTURED
+
+REPLAY_JS = """
+var reqs = arguments[0], limit = arguments[1], done = arguments[arguments.length - 1];
+var out = new Array(reqs.length), cursor = 0;
+function next() {
+    if (cursor >= reqs.length) { return Promise.resolve(); }
+    var k = cursor++, r = reqs[k];
+    var init = {method: r.method, headers: r.headers || {}, credentials: 'include', __replay: true};
+    if (r.method !== 'GET' && r.body !== null) { init.body = r.body; }
+    return fetch(r.url, init)
+        .then(function (res) { return res.text(); })
+        .then(function (text) { out[k] = text; }, function () { out[k] = null; })
+        .then(next);
+}
+var workers = [];
+for (var w = 0; w < limit; w++) { workers.push(next()); }
+Promise.all(workers).then(function () { done(out); });
+"""
+
+
+def install_response_capture(driver):
+    """
+    요청/응답 기록 스크립트를 주입합니다.
+    Chrome이면 CDP로 등록해서 이후 새로 열리는 문서와 iframe에도 자동으로 설치됩니다.
+    """
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": CAPTURE_JS})
+    except (AttributeError, WebDriverException):
+        pass
+    driver.execute_script(CAPTURE_JS)
+
+
+def drain_responses(driver) -> List[Dict]:
+    """지금까지 기록된 요청/응답을 꺼내고 기록을 비웁니다."""
+    entries = driver.execute_script(
+        "var s = window.__netCapture || []; return s.splice(0, s.length);"
+    )
+    return entries or []
+
+
+def parse_json(text: Optional[str]):
+    """JSON 응답이면 파싱 결과를, 아니면 None을 반환합니다."""
+    if not text:
+        return None
+    text = text.strip()
+    if not text or text[0] not in "[{":
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def iter_json_records(payload, keys: Iterable[str]) -> Iterator[Dict]:
+    """응답 JSON을 재귀적으로 훑어 keys 중 하나라도 가진 dict를 yield 합니다."""
+    keys = set(keys)
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if keys & node.keys():
+                yield node
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def iter_record_lists(payload) -> Iterator[List[Dict]]:
+    """응답 JSON 안의 dict 리스트(검색 결과 목록 후보)를 yield 합니다."""
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            if node and all(isinstance(item, dict) for item in node):
+                yield node
+            stack.extend(node)
+
+
+def request_params(entry: Dict) -> Dict[str, str]:
+    """캡처한 요청의 form body 파라미터 (GET이면 쿼리스트링)"""
+    if entry.get("method") == "GET" or not entry.get("body"):
+        query = entry["url"].split("?", 1)[1] if "?" in entry["url"] else ""
+        return dict(parse_qsl(query, keep_blank_values=True))
+    return dict(parse_qsl(entry["body"], keep_blank_values=True))
+
+
+def with_params(entry: Dict, params: Dict[str, str]) -> Dict:
+    """캡처한 요청에서 파라미터만 바꾼 재요청 정보를 만듭니다."""
+    request = {
+        "method": entry.get("method", "GET"),
+        "url": entry["url"],
+        "headers": entry.get("headers") or {},
+        "body": entry.get("body"),
+    }
+    if request["method"] == "GET" or not request["body"]:
+        base_url = entry["url"].split("?", 1)[0]
+        request["url"] = f"{base_url}?{urlencode(params)}"
+    else:
+        request["body"] = urlencode(params)
+    return request
+
+
+def replay_requests(driver, requests: List[Dict], concurrency: int = 8, timeout: float = 120) -> List[Optional[str]]:
+    """
+    재요청 목록을 페이지 안에서 fetch로 동시에 실행하고 응답 텍스트 목록을 반환합니다.
+    브라우저 세션 쿠키를 그대로 사용하므로 별도 로그인/세션 처리가 필요 없습니다.
+    재요청은 캡처 기록에 남지 않습니다. (init.__replay 표시)
+    """
+    if not requests:
+        return []
+    driver.set_script_timeout(timeout)
+    return driver.execute_async_script(REPLAY_JS, requests, concurrency)
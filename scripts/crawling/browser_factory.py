@@ -0,0 +1,189 @@
+"""
+브라우저 크롤러 공용 브라우저 생성 유틸리티
+
+크롤러는 텍스트와 속성만 읽으므로 화면에 필요 없는 요청을 막은 가벼운 브라우저를 띄웁니다.
+- 기본 headless 실행
+- 이미지 / 미디어 / 폰트 요청과 광고·분석용 외부 호스트 요청 차단
+  (스타일시트는 요소 표시 여부 대기와 .text 결과에 영향을 주므로 기본값은 허용)
+- 확장 프로그램, 백그라운드 네트워크, 동기화 등 크롤링에 필요 없는 기능 비활성화
+- chromedriver 경로를 캐시해서 매 실행마다 ChromeDriverManager().install()을 호출하지 않음
+- Playwright(건국대)도 같은 기준으로 차단
+
+환경변수
+- BROWSER_HEADLESS: 0이면 창을 띄움 (디버깅용, 기본값: 1)
+- CHROMEDRIVER_PATH: chromedriver 경로를 직접 지정
+- CHROMEDRIVER_CACHE: 설치된 chromedriver 경로를 기록해 둘 파일 (기본값: data/cache/chromedriver_path.txt)
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+
+HEADLESS = os.getenv("BROWSER_HEADLESS", "1") != "0"
+DRIVER_CACHE_FILE = Path(os.getenv("CHROMEDRIVER_CACHE", "data/cache/chromedriver_path.txt"))
+WINDOW_SIZE = "1500,1200"
+
+# 크롤링에 필요 없는 파일 확장자
+BLOCKED_EXTENSIONS = [
+    "png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "bmp",
+    "woff", "woff2", "ttf", "otf", "eot",
+    "mp4", "webm", "mp3",
+]
+STYLE_EXTENSIONS = ["css"]
+
+# 광고 / 분석용 외부 호스트
+BLOCKED_HOSTS = [
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googlesyndication.com",
+    "facebook.net", "facebook.com", "wcs.naver.net", "wcs.naver.com", "analytics.naver.com",
+    "hotjar.com", "clarity.ms", "youtube.com", "ytimg.com",
+]
+
+# Playwright route 에서 차단할 resource type
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+CHROME_ARGS = [
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-notifications",
+    "--disable-features=Translate,OptimizationHints,MediaRouter",
+    "--no-first-run",
+    "--mute-audio",
+    "--blink-settings=imagesEnabled=false",
+]
+
+_driver_path: Optional[str] = None
+_driver_path_lock = threading.Lock()
+
+
+def blocked_url_patterns(block_styles: bool = False):
+    """Chrome CDP Network.setBlockedURLs 패턴 (확장자는 쿼리스트링 유무 모두)"""
+    extensions = BLOCKED_EXTENSIONS + (STYLE_EXTENSIONS if block_styles else [])
+    patterns = [p for ext in extensions for p in (f"*.{ext}", f"*.{ext}?*")]
+    patterns += [p for host in BLOCKED_HOSTS for p in (f"*://{host}/*", f"*://*.{host}/*")]
+    return patterns
+
+
+def chromedriver_path() -> str:
+    """
+    chromedriver 경로를 반환합니다.
+    CHROMEDRIVER_PATH → 캐시 파일에 기록된 경로 → ChromeDriverManager().install() 순서로 찾고,
+    설치한 경우 경로를 캐시 파일에 기록합니다. (풀 모드처럼 여러 브라우저를 띄워도 한 번만 확인)
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path and Path(_driver_path).exists():
+            return _driver_path
+
+        env_path = os.getenv("CHROMEDRIVER_PATH")
+        if env_path and Path(env_path).exists():
+            _driver_path = env_path
+            return _driver_path
+
+        if DRIVER_CACHE_FILE.exists():
+            cached = DRIVER_CACHE_FILE.read_text(encoding="utf-8").strip()
+            if cached and Path(cached).exists():
+                _driver_path = cached
+                return _driver_path
+
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        _driver_path = ChromeDriverManager().install()
+        DRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        DRIVER_CACHE_FILE.write_text(_driver_path, encoding="utf-8")
+        return _driver_path
+
+
+def create_chrome(
+    headless: Optional[bool] = None,
+    block_resources: bool = True,
+    block_styles: bool = False,
+    driver_path: Optional[str] = None,
+    window_size: str = WINDOW_SIZE,
+    extra_args: Iterable[str] = (),
+):
+    """
+    크롤링용 Chrome을 생성합니다.
+
+    Args:
+        headless: None이면 BROWSER_HEADLESS 환경변수를 따름
+        block_resources: 이미지 / 폰트 / 미디어 / 광고·분석 호스트 차단
+        block_styles: 스타일시트까지 차단 (요소 표시 여부를 보지 않는 크롤러만 사용)
+        driver_path: chromedriver 경로 (없으면 chromedriver_path())
+        extra_args: 크롤러별 추가 Chrome 인자 (예: --disable-popup-blocking)
+    """
+    headless = HEADLESS if headless is None else headless
+
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument(f"--window-size={window_size}")
+    for arg in CHROME_ARGS:
+        options.add_argument(arg)
+    for arg in extra_args:
+        options.add_argument(arg)
+
+    if block_resources:
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+
+    driver = webdriver.Chrome(service=Service(driver_path or chromedriver_path()), options=options)
+
+    if block_resources:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_url_patterns(block_styles)})
+        except WebDriverException:
+            pass
+
+    return driver
+
+
+# ------------------------------
+# Playwright
+# ------------------------------
+def site_domain(url: str) -> str:
+    """www.konkuk.ac.kr → konkuk.ac.kr (같은 사이트의 하위 도메인은 허용하기 위함)"""
+    host = urlsplit(url).hostname or ""
+    parts = host.split(".")
+    # ac.kr, co.kr 같은 2단계 국가 도메인 고려
+    keep = 3 if len(parts) >= 3 and len(parts[-1]) == 2 and len(parts[-2]) <= 3 else 2
+    return ".".join(parts[-keep:])
+
+
+def launch_chromium(playwright, headless: Optional[bool] = None):
+    """Playwright Chromium을 크롤링용 인자로 실행합니다."""
+    headless = HEADLESS if headless is None else headless
+    return playwright.chromium.launch(headless=headless, args=CHROME_ARGS)
+
+
+def new_lean_page(browser, site_url: str, block_styles: bool = False):
+    """
+    site_url과 같은 사이트 요청만 허용하고, 이미지 / 폰트 / 미디어를 차단한 페이지를 엽니다.
+    """
+    domain = site_domain(site_url)
+    blocked_types = BLOCKED_RESOURCE_TYPES | ({"stylesheet"} if block_styles else set())
+
+    def handle(route):
+        request = route.request
+        host = urlsplit(request.url).hostname or ""
+        same_site = host == domain or host.endswith("." + domain)
+        if request.resource_type in blocked_types or not same_site:
+            return route.abort()
+        return route.continue_()
+
+    context = browser.new_context(service_workers="block")
+    context.route("**/*", handle)
+    return context.new_page()
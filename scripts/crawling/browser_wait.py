@@ -0,0 +1,229 @@
+"""
+브라우저 크롤러 공용 대기 유틸리티
+
+클릭/선택 뒤에 고정 time.sleep 을 두는 대신, 실제 페이지 상태를 기다립니다.
+- 요소 상태 (존재 / 표시 / 클릭 가능 / stale / 텍스트 변경 / 모달 내용 갱신)
+- XHR / fetch 요청 완료 (페이지에 요청 카운터를 주입해서 확인)
+- 새 창 열림
+
+모든 대기는 단계(step) 이름과 함께 호출하며, 단계별 타임아웃을 줄 수 있고
+단계별 소요 시간은 report()로 확인할 수 있습니다.
+"""
+
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# XHR / fetch 요청 수를 세는 스크립트 (여러 번 주입해도 한 번만 설치됨)
+NETWORK_TRACKER_JS = """
+(function () {
+    if (window.__netTracker) { return; }
+    var t = window.__netTracker = {pending: 0, started: 0, last: Date.now()};
+    function begin() { t.pending += 1; t.started += 1; t.last = Date.now(); }
+    function end() { t.pending = Math.max(0, t.pending - 1); t.last = Date.now(); }
+
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        begin();
+        this.addEventListener('loadend', end);
+        return send.apply(this, arguments);
+    };
+
+    if (window.fetch) {
+        var origFetch = window.fetch;
+        window.fetch = function () {
+            begin();
+            return origFetch.apply(this, arguments).finally(end);
+        };
+    }
+})();
+"""
+
+NETWORK_STATE_JS = """
+var t = window.__netTracker;
+if (!t) { return null; }
+return {pending: t.pending, started: t.started, idle_ms: Date.now() - t.last,
+        ready: document.readyState === 'complete'};
+"""
+
+
+def install_network_tracker(driver):
+    """
+    요청 카운터를 현재 페이지에 주입합니다.
+    Chrome이면 CDP로 등록해서 이후 새로 열리는 문서와 iframe에도 자동으로 설치됩니다.
+    """
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_TRACKER_JS})
+    except (AttributeError, WebDriverException):
+        pass
+    driver.execute_script(NETWORK_TRACKER_JS)
+
+
+class PageWaiter:
+    """단계별 타임아웃과 소요 시간 기록을 지원하는 조건 대기"""
+
+    def __init__(self, driver, timeout: float = 10, poll: float = 0.05):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll = poll
+        # step -> [횟수, 누적 시간, 최대 시간, 타임아웃 횟수]
+        self.timings = defaultdict(lambda: [0, 0.0, 0.0, 0])
+
+    # ------------------------------
+    # 단계 시간 기록
+    # ------------------------------
+    @contextmanager
+    def step(self, name: str):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            yield
+        except TimeoutException:
+            timed_out = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            record = self.timings[name]
+            record[0] += 1
+            record[1] += elapsed
+            record[2] = max(record[2], elapsed)
+            record[3] += int(timed_out)
+
+    def report(self):
+        """단계별 대기 시간 요약을 출력합니다."""
+        print("\n[대기 시간 요약]")
+        print(f"{'단계':<24}{'횟수':>6}{'합계(s)':>10}{'평균(ms)':>10}{'최대(ms)':>10}{'타임아웃':>8}")
+        for name, (count, total, longest, timeouts) in sorted(self.timings.items(), key=lambda x: -x[1][1]):
+            print(f"{name:<24}{count:>6}{total:>10.2f}{total / count * 1000:>10.0f}{longest * 1000:>10.0f}{timeouts:>8}")
+
+    # ------------------------------
+    # 기본 대기
+    # ------------------------------
+    def until(self, condition: Callable, step: str, timeout: Optional[float] = None, required: bool = True):
+        """
+        condition(driver)이 참 값을 돌려줄 때까지 기다립니다.
+
+        Args:
+            condition: WebDriverWait 조건 함수
+            step: 시간 기록용 단계 이름
+            timeout: 이 단계의 타임아웃 (기본값: 생성 시 timeout)
+            required: False면 타임아웃 시 예외 대신 None 반환
+        """
+        wait = WebDriverWait(self.driver, self.timeout if timeout is None else timeout, poll_frequency=self.poll)
+        try:
+            with self.step(step):
+                return wait.until(condition)
+        except TimeoutException:
+            if required:
+                raise
+            return None
+
+    def present(self, locator, step: str, **kwargs):
+        return self.until(EC.presence_of_element_located(locator), step, **kwargs)
+
+    def visible(self, locator, step: str, **kwargs):
+        return self.until(EC.visibility_of_element_located(locator), step, **kwargs)
+
+    def clickable(self, locator, step: str, **kwargs):
+        return self.until(EC.element_to_be_clickable(locator), step, **kwargs)
+
+    def stale(self, element, step: str, **kwargs):
+        """기존 요소가 DOM에서 교체될 때까지 기다립니다."""
+        return self.until(EC.staleness_of(element), step, **kwargs)
+
+    def text_changes(self, locator, old_text: str, step: str, **kwargs):
+        """요소의 텍스트가 old_text와 달라질 때까지 기다리고 새 텍스트를 반환합니다."""
+        def changed(driver):
+            try:
+                text = driver.find_element(*locator).text.strip()
+            except WebDriverException:
+                return False
+            return text if text != old_text else False
+
+        return self.until(changed, step, **kwargs)
+
+    def snapshot(self, locators):
+        """locators 요소와 내용(textContent)을 읽어 둡니다. (refreshed()의 기준값, 없는 요소는 None)"""
+        snapshots = []
+        for locator in locators:
+            try:
+                element = self.driver.find_element(*locator)
+                snapshots.append((element, element.get_attribute("textContent")))
+            except WebDriverException:
+                snapshots.append(None)
+        return snapshots
+
+    def refreshed(self, locators, before, step: str, timeout: float = 2, **kwargs):
+        """
+        동작 뒤 locators 요소가 모두 있고, 그중 하나라도 교체(stale)되거나 내용이 바뀔 때까지 기다립니다.
+        같은 모달/팝업을 다시 열 때 이전 과목의 내용을 읽지 않도록 사용합니다.
+
+        Args:
+            before: 동작 전에 snapshot(locators)으로 읽어 둔 값 (처음 여는 경우 요소가 나타나기만 하면 됨)
+            timeout: 내용이 우연히 이전과 같을 수도 있으므로 짧게 기다리고, 시간이 지나면 False 반환
+        """
+        def changed(driver):
+            current = self.snapshot(locators)
+            if any(snap is None for snap in current):
+                return False
+            return any(old is None or old[0] != new[0] or old[1] != new[1] for old, new in zip(before, current))
+
+        kwargs.setdefault("required", False)
+        return bool(self.until(changed, step, timeout=timeout, **kwargs))
+
+    def new_window(self, before_handles, step: str, **kwargs):
+        """새 창이 열릴 때까지 기다리고 새 창 핸들을 반환합니다."""
+        def opened(driver):
+            new_handles = [h for h in driver.window_handles if h not in before_handles]
+            return new_handles[0] if new_handles else False
+
+        return self.until(opened, step, **kwargs)
+
+    # ------------------------------
+    # 네트워크 대기
+    # ------------------------------
+    def _network_state(self):
+        state = self.driver.execute_script(NETWORK_STATE_JS)
+        if state is None:
+            install_network_tracker(self.driver)
+            state = self.driver.execute_script(NETWORK_STATE_JS)
+        return state
+
+    def network_idle(self, step: str, started_before: Optional[int] = None, grace: float = 0.3, quiet: float = 0.1, **kwargs):
+        """
+        진행 중인 XHR / fetch 요청이 모두 끝날 때까지 기다립니다.
+
+        Args:
+            started_before: 동작 직전의 요청 시작 수. 주어지면 동작 이후 요청이 시작되어 끝날 때까지 기다리고,
+                            grace초 안에 아무 요청도 시작되지 않으면 네트워크 없는 동작으로 보고 바로 반환
+            quiet: 마지막 요청이 끝난 뒤 추가 요청이 없는지 확인하는 시간(초)
+        """
+        start = time.monotonic()
+
+        def settled(driver):
+            state = self._network_state()
+            if not state["ready"] or state["pending"] > 0:
+                return False
+            if started_before is not None and state["started"] <= started_before:
+                return time.monotonic() - start >= grace
+            return state["idle_ms"] >= quiet * 1000
+
+        return self.until(settled, step, **kwargs)
+
+    def perform(self, action: Callable, step: str, **kwargs):
+        """
+        클릭 / 선택 같은 동작을 실행하고, 그 동작이 일으킨 네트워크 요청이 끝날 때까지 기다립니다.
+        """
+        started_before = self._network_state()["started"]
+        result = action()
+        self.network_idle(step, started_before=started_before, **kwargs)
+        return result
+
+    def click(self, element, step: str, **kwargs):
+        """JS 클릭 후 네트워크 요청 완료까지 대기"""
+        return self.perform(lambda: self.driver.execute_script("arguments[0].click();", element), step, **kwargs)
@@ -1,17 +1,25 @@
-import requests
 import os
 import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
+from http_client import get_client
+from career_net_list import is_valid_response
+from crawl_journal import CrawlJournal, journal_path_for
+
 load_dotenv()
 
 career_net_api_key = os.getenv('CAREER_NET_API_KEY')
 career_net_api_url = os.getenv('CAREER_NET_API_URL')
 
+# 동시 요청 수 상한 (1 이하이면 기존 순차 방식으로 수집)
+CONCURRENCY = int(os.getenv('CAREER_NET_CONCURRENCY', '8'))
+
 total_data = []
 
-def fetch_major_detail():
-    with open('data/raw/major_list.json', 'r', encoding='utf-8') as f:
+def load_major_seq_list(filename="data/raw/major_list.json"):
+    with open(filename, 'r', encoding='utf-8') as f:
         data = json.load(f)
 
     majorSeq_list = []
@@ -44,36 +52,103 @@ def fetch_major_detail():
                 "subject": subject
             })
 
-    for item  in majorSeq_list:
-        subject = item["subject"]
-        seq = item["majorSeq"]
-        
-        params = {
-            "apiKey": career_net_api_key,
-            "svcType": "api",
-            "svcCode": "MAJOR_VIEW",
-            "contentType": "json",
-            "gubun": "univ_list",
-            "univSe": "univ",
-            "subject": subject,
-            "majorSeq": seq,
-        }
-
-        response = requests.get(career_net_api_url, params=params)
-        response.raise_for_status()
-
-        data = response.json()
-        total_data.append(data)
+    return majorSeq_list
+
+
+def fetch_one(item):
+    """majorSeq 하나의 MAJOR_VIEW 응답을 가져옵니다."""
+    params = {
+        "apiKey": career_net_api_key,
+        "svcType": "api",
+        "svcCode": "MAJOR_VIEW",
+        "contentType": "json",
+        "gubun": "univ_list",
+        "univSe": "univ",
+        "subject": item["subject"],
+        "majorSeq": item["majorSeq"],
+    }
+
+    response = get_client().get(career_net_api_url, params=params, validate=is_valid_response)
+    response.raise_for_status()
+    if not is_valid_response(response):
+        raise RuntimeError(f"커리어넷 API 오류 (majorSeq={item['majorSeq']}): {response.text[:200]}")
+
+    return response.json()
+
+
+def item_key(item):
+    """저널에 기록할 요청 key"""
+    return f"{item['subject']}:{item['majorSeq']}"
 
+
+def fetch_major_detail(journal):
+    majorSeq_list = load_major_seq_list()
+
+    for item in majorSeq_list:
+        key = item_key(item)
+        if key in journal:
+            continue
+
+        data = fetch_one(item)
+        journal.append(key, data)
+
+    total_data.extend(journal.payloads(item_key(item) for item in majorSeq_list))
     return total_data
 
 
-def save_json(filename="data/raw/major_detail.json"):
-        major_data = fetch_major_detail()
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(major_data, f, ensure_ascii=False, indent=4)
+async def iter_major_detail_async(majorSeq_list, concurrency=CONCURRENCY):
+    """
+    majorSeq 목록을 최대 concurrency개씩 동시에 요청하고,
+    완료되는 순서대로 (원래 인덱스, 응답 데이터)를 yield 합니다.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        async def worker(idx, item):
+            async with semaphore:
+                data = await loop.run_in_executor(executor, fetch_one, item)
+            return idx, data
+
+        tasks = [asyncio.create_task(worker(idx, item)) for idx, item in enumerate(majorSeq_list)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            # 중간에 실패하면 남은 요청은 취소
+            for task in tasks:
+                task.cancel()
+
+
+async def fetch_major_detail_async(journal, concurrency=CONCURRENCY):
+    majorSeq_list = load_major_seq_list()
+
+    # 이전 실행에서 완료된 majorSeq는 건너뜀
+    pending = [item for item in majorSeq_list if item_key(item) not in journal]
+    print(f"전체 {len(majorSeq_list)}개 중 {len(majorSeq_list) - len(pending)}개 완료됨, {len(pending)}개 수집 시작")
+
+    done = 0
+    async for idx, data in iter_major_detail_async(pending, concurrency):
+        journal.append(item_key(pending[idx]), data)
+        done += 1
+        print(f"[{done}/{len(pending)}] majorSeq={pending[idx]['majorSeq']} 완료")
+
+    # 완료 순서와 관계없이 기존과 같은 majorSeq 순서로 저장
+    total_data.extend(journal.payloads(item_key(item) for item in majorSeq_list))
+    return total_data
+
+
+def save_json(filename="data/raw/major_detail.json", concurrency=CONCURRENCY):
+        with CrawlJournal(journal_path_for(filename)) as journal:
+            if concurrency > 1:
+                major_data = asyncio.run(fetch_major_detail_async(journal, concurrency))
+            else:
+                major_data = fetch_major_detail(journal)
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(major_data, f, ensure_ascii=False, indent=4)
+            journal.discard()
         print(f"JSON 저장 완료: {filename}")
 
 
 if __name__ == "__main__":
-    save_json()
\ No newline at end of file
+    save_json()
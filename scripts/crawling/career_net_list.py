@@ -1,8 +1,10 @@
-import requests
 import os
 import json
 from dotenv import load_dotenv
 
+from http_client import get_client
+from crawl_journal import CrawlJournal, journal_path_for
+
 load_dotenv()
 
 career_net_api_key = os.getenv('CAREER_NET_API_KEY')
@@ -10,7 +12,14 @@ career_net_api_url = os.getenv('CAREER_NET_API_URL')
 
 total_data = []
 
-def fetch_major_list():
+def is_valid_response(response):
+    """커리어넷은 인증키 오류도 200으로 응답하므로 dataSearch가 있는 정상 응답인지 확인 (오류 응답은 캐시하지 않음)"""
+    try:
+        return "dataSearch" in response.json()
+    except ValueError:
+        return False
+
+def fetch_major_list(journal):
     subject = [
         100391,     # 인문계열
         100392,     # 사회계열
@@ -22,6 +31,10 @@ def fetch_major_list():
     ]
 
     for i in range(len(subject)):
+        # 이전 실행에서 완료된 계열은 건너뜀
+        if subject[i] in journal:
+            continue
+
         params = {
             "apiKey": career_net_api_key,
             "svcType": "api",
@@ -34,18 +47,24 @@ def fetch_major_list():
             "perPage": 1000
         }
 
-        response = requests.get(career_net_api_url, params=params)
+        response = get_client().get(career_net_api_url, params=params, validate=is_valid_response)
         response.raise_for_status()
+        if not is_valid_response(response):
+            raise RuntimeError(f"커리어넷 API 오류 (subject={subject[i]}): {response.text[:200]}")
 
         data = response.json()
-        total_data.append(data)
+        journal.append(subject[i], data)
+
+    total_data.extend(journal.payloads(subject))
     return total_data
 
 
 def save_json(filename="data/raw/major_list.json"):
-        major_data = fetch_major_list()
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(major_data, f, ensure_ascii=False, indent=4)
+        with CrawlJournal(journal_path_for(filename)) as journal:
+            major_data = fetch_major_list(journal)
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(major_data, f, ensure_ascii=False, indent=4)
+            journal.discard()
         print(f"JSON 저장 완료: {filename}")
 
 
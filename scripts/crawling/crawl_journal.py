@@ -0,0 +1,85 @@
+"""
+크롤링 체크포인트 저널
+
+완료된 요청 하나당 {"key": ..., "payload": ...} 한 줄을 JSONL 파일에 append 합니다.
+- 재실행 시 저널에 있는 key는 건너뛰고 남은 요청만 수집
+- 모든 수집이 끝나면 저널에서 최종 JSON을 재구성한 뒤 저널 파일 삭제
+- 기록 도중 프로세스가 죽어 마지막 줄이 잘린 경우 해당 줄만 무시
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+
+def journal_path_for(output_path) -> Path:
+    """최종 출력 파일 옆에 둘 저널 경로 (예: major_detail.json → major_detail.journal.jsonl)"""
+    return Path(output_path).with_suffix(".journal.jsonl")
+
+
+class CrawlJournal:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.entries: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+        self._load()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _load(self):
+        if not self.path.exists():
+            return
+
+        skipped = 0
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    skipped += 1
+                    continue
+                self.entries[str(record["key"])] = record["payload"]
+
+        print(f"[저널] {self.path}: 완료된 요청 {len(self.entries)}개 복원" + (f" (손상된 줄 {skipped}개 무시)" if skipped else ""))
+
+    def __contains__(self, key) -> bool:
+        return str(key) in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        return self.entries.get(str(key), default)
+
+    def append(self, key, payload):
+        """완료된 요청 하나를 저널에 기록합니다."""
+        line = json.dumps({"key": str(key), "payload": payload}, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            self.entries[str(key)] = payload
+
+    def payloads(self, keys: Iterable) -> List[Any]:
+        """주어진 key 순서대로 payload 목록을 반환합니다."""
+        return [self.entries[str(key)] for key in keys]
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def discard(self):
+        """최종 결과 저장이 끝난 뒤 저널 파일을 삭제합니다."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,37 +1,35 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select, WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import time
-import json
+from selenium.webdriver.support.ui import Select
+from browser_factory import create_chrome
+from browser_wait import PageWaiter
+from record_sink import RecordSink
 
 url = "https://eureka.ewha.ac.kr/eureka/my/public.do?pgId=P531005523"
 university_name = "이화여자대학교"
 college = "인공지능대학"
 JSON_FILE = f"data/raw/seoul_syllabus_grade.json"
 
+# 상세 모달의 학과명 / 학년 / 과목 분류 / 교과목개요
+DETAIL_LOCATORS = [(By.ID, field) for field in ("deptKorNm", "openShyr", "submattFgNm", "sbjtSmryCtnt")]
+
 def run():
     # 1. Chrome 실행
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service)
+    driver = create_chrome()
 
     driver.get(url)
-    wait = WebDriverWait(driver, 10)
+    waiter = PageWaiter(driver, 10)
 
     # 2. 검색 조건 설정
-    data = {university_name: {}}
+    sink = RecordSink(JSON_FILE, resume=False)
 
     # 단과대학 선택
     college_select = Select(driver.find_element(By.ID, "hSrchOpenUpDeptCd"))
-    college_select.select_by_visible_text(college)
-    time.sleep(1)
+    waiter.perform(lambda: college_select.select_by_visible_text(college), "단과대학 선택")
     
     # 출력 버튼 클릭
     search_btn = driver.find_element(By.CSS_SELECTOR, ".filter-submit-btn")
-    driver.execute_script("arguments[0].click();", search_btn)
-    time.sleep(1)
+    waiter.click(search_btn, "검색")
+    waiter.present((By.CSS_SELECTOR, ".course-info-item"), "검색 결과 표시")
     
 
 
@@ -46,11 +44,13 @@ def run():
                 # 과목 리스트 클릭
 
                 detail_btn = course.find_element(By.CSS_SELECTOR, "a.course-info-detail")
-                driver.execute_script("arguments[0].click();", detail_btn)
-                time.sleep(1)
+                before = waiter.snapshot(DETAIL_LOCATORS)
+                waiter.click(detail_btn, "상세 모달 열기")
+                # 모달을 다시 열 때는 이전 과목 내용이 바뀔 때까지 대기
+                waiter.refreshed(DETAIL_LOCATORS, before, "상세 모달 갱신")
 
                 # 학과명
-                dept_name = driver.find_element(By.ID, "deptKorNm").text.strip()
+                dept_name = waiter.visible((By.ID, "deptKorNm"), "상세 모달 표시").text.strip()
 
                 try:
                     # 학년
@@ -61,19 +61,14 @@ def run():
                     course_classification = driver.find_element(By.ID, "submattFgNm").text.strip()
                     
                     # 교과목개요 버튼 클릭 -> 교과목개요(국문)
-                    tab_outline = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#tab2 button")))
-                    driver.execute_script("arguments[0].click();", tab_outline)
-                    description = wait.until(EC.presence_of_element_located((By.ID, "sbjtSmryCtnt"))).text.strip()
+                    tab_outline = waiter.clickable((By.CSS_SELECTOR, "#tab2 button"), "교과목개요 탭 대기")
+                    waiter.click(tab_outline, "교과목개요 탭")
+                    description = waiter.present((By.ID, "sbjtSmryCtnt"), "교과목개요 표시").text.strip()
                 except:
                     description = ""
 
-                # JSON 구조
-                if college not in data[university_name]:
-                    data[university_name][college] = {}
-                if dept_name not in data[university_name][college]:
-                    data[university_name][college][dept_name] = []
-
-                data[university_name][college][dept_name].append({
+                # JSON 구조 (대학 / 단과대학 / 학과)
+                sink.add((university_name, college, dept_name), {
                     "grade_semester": f'{grade}-{semester}',
                     "course_classification": course_classification,
                     "name": course_name,
@@ -84,10 +79,9 @@ def run():
                 print(course_classification)
                     
         # 4. 학기별 JSON 저장
-        with open(JSON_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-            print('저장: ', JSON_FILE)
+        sink.finalize(indent=4)
 
+        waiter.report()
         driver.quit()
 
 if __name__ == "__main__":
@@ -1,11 +1,9 @@
-from selenium import webdriver
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from browser_factory import create_chrome
 import time
 import json
 # playwright
@@ -17,8 +15,7 @@ colleges = ["공과대학", "자연과학대학"]
 
 def run():
     # 1. Chrome 실행
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service)
+    driver = create_chrome()
 
     driver.get(url)
     wait = WebDriverWait(driver, 10)
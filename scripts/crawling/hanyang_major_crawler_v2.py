@@ -1,13 +1,11 @@
-from selenium import webdriver
-from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import time
-import json
+from browser_factory import create_chrome
+from browser_wait import PageWaiter
+from record_sink import RecordSink
+from concurrent.futures import ThreadPoolExecutor
+import os
+import queue
 # playwright
 
 url = "https://portal.hanyang.ac.kr/sugang/sulg.do"
@@ -15,147 +13,286 @@ university_name = "한양대학교"
 semesters = [1, 2]
 colleges = ["공과대학", "자연과학대학"]
 
-def run():
-    # 1. Chrome 실행
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service)
+# 풀 모드에서 띄울 브라우저 수 (기본값 1 = 브라우저 하나로 순차 수집, 2 이상이면 풀 모드)
+POOL_SIZE = int(os.getenv("HANYANG_POOL_SIZE", "1"))
+
+# 과목 팝업의 과목 설명
+POPUP_LOCATORS = [(By.ID, "gwamokGaeyo")]
+
 
+def create_driver():
+    return create_chrome()
+
+
+def open_syllabus_page(driver):
     driver.get(url)
-    wait = WebDriverWait(driver, 10)
+    waiter = PageWaiter(driver, 10)
+
+    # Syllabus 페이지 접속
+    syllabus_link = waiter.clickable((By.XPATH, '//a[@title="수강편람"]'), "수강편람 링크")
+    waiter.click(syllabus_link, "수강편람 이동")
+
+    return waiter
+
+
+def select_college(driver, waiter, semester, college):
+    # 학기 선택
+    term_select_element = waiter.visible((By.ID, "cbTerm"), "학기 선택 대기")
+    term_select = Select(term_select_element)
+    waiter.perform(lambda: term_select.select_by_visible_text(f"{semester}학기"), "학기 선택")
+
+    # 학과과목(전공) 오디오버튼 선택
+    major_radio = waiter.clickable((By.ID, "hak"), "전공 버튼 대기")
+    waiter.perform(major_radio.click, "전공 버튼 선택")
+
+    # 단과대학 선택
+    daehak_select = Select(driver.find_element(By.ID, "cbDaehak"))
+    waiter.perform(lambda: daehak_select.select_by_visible_text(college), "단과대학 선택")
+
+    # 학과 목록이 채워질 때까지 대기
+    waiter.until(lambda d: Select(d.find_element(By.ID, "cbHakgwajungong")).options, "학과 목록 로딩")
+
+
+def list_departments(driver):
+    hakgwa_select = Select(driver.find_element(By.ID, "cbHakgwajungong"))
+    return [option.text.strip() for option in hakgwa_select.options]
+
+
+def crawl_department(driver, waiter, semester, hakgwa_name):
+    """선택된 학기/단과대학에서 학과 하나의 전체 페이지 과목을 수집합니다."""
+    courses = []
+
+    # 학과 선택
+    hakgwa_select = Select(driver.find_element(By.ID, "cbHakgwajungong"))
+    waiter.perform(lambda: hakgwa_select.select_by_visible_text(hakgwa_name), "학과 선택")
+
+    # 조회 버튼 클릭
+    btn_find = driver.find_element(By.ID, "btn_Find")
+    waiter.perform(btn_find.click, "조회")
+    waiter.present((By.CSS_SELECTOR, ".numberLink span.strong"), "조회 결과 표시")
+
+    previous_page = None
+
+    while True:
+        # wait.until(lambda driver: driver.find_element(By.CSS_SELECTOR, ".numberLink span.strong").text.strip() != "")
+        paging = driver.find_element(By.CSS_SELECTOR, ".numberLink")
+        current_page = int(paging.find_element(By.CSS_SELECTOR, "span.strong").text.strip())
+        print("현재 페이지: ", current_page)
+
+        if previous_page == current_page:
+            break
+
+        rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
+        for row in rows:
+            grade = ""
+            course_classification = ""
+            subject_name = ""
+            description = ""
+
+            # 학년
+            try:
+                grade = row.find_elements(By.CSS_SELECTOR, "td#isuGrade")[0].text.strip()
+            except:
+                grade = ""
+
+            # 과목 분류
+            try:
+                course_classification = row.find_elements(By.CSS_SELECTOR, "td#isuGbNm")[0].text.strip()
+            except:
+                course_classification = ""
+
+            # 과목명
+            try:
+                subject_name = row.find_elements(By.CSS_SELECTOR, "td#gwamokNm")[0].text.strip()
+            except:
+                subject_name = ""
+
+            try:
+                # 4. 학수번호 클릭 (팝업 오픈)
+                subject_num = row.find_element(By.ID, "haksuNo")
+                before = waiter.snapshot(POPUP_LOCATORS)
+                waiter.click(subject_num, "과목 팝업 열기")
+                # 팝업은 과목마다 재사용되므로 과목 설명이 이전 과목 내용에서 바뀔 때까지 대기
+                waiter.refreshed(POPUP_LOCATORS, before, "과목 팝업 갱신")
+
+                # 과목 설명 크롤링
+                try:
+                    description = driver.find_element(By.ID, "gwamokGaeyo").text.strip()
+                except:
+                    description = ""
+            except Exception as e:
+                print("에러:", e)
+
+            if subject_name.strip() or description.strip():
+                courses.append({
+                    "grade_semester": f'{grade}-{semester}',
+                    "course_classification": course_classification,
+                    "name": subject_name,
+                    "description": description
+                })
+
+                print(f'{grade}-{semester}')
+                print(f'{course_classification}\n{subject_name}')
+            else:
+                print(f"빈 항목 건너뜀")
+
+        # 팝업 닫기
+        close_btn = driver.find_element(By.ID, "btn_Close")
+        driver.execute_script("arguments[0].click();", close_btn)
+
+        # 다음 페이지 클릭
+        next_page = driver.find_elements(By.CSS_SELECTOR,f'.cc-paging a[onclick="ServiceController.goPage({current_page + 1})"]')
+        if next_page:
+            waiter.click(next_page[0], "다음 페이지")
+        else:
+            next_arrow = driver.find_element(By.CSS_SELECTOR, '#pagingPanel img[alt="다음"]')
+            waiter.click(next_arrow, "다음 페이지")
+
+        previous_page = current_page
+
+    return courses
+
+
+def json_file_for(semester):
+    return f"data/raw/hanyang_syllabus_{semester}_v2.json"
+
+
+def unit_key(college, hakgwa_name):
+    return f"{college}/{hakgwa_name}"
+
+
+def add_courses(sink, college, hakgwa_name, courses):
+    """학과 과목을 한 줄씩 기록하고 학과 완료를 표시합니다. (과목이 없는 학과는 결과에 넣지 않음)"""
+    unit = unit_key(college, hakgwa_name)
+    sink.add_many((university_name, college, hakgwa_name), courses, unit=unit)
+    sink.mark_done(unit)
+
+
+def run():
+    # 1. Chrome 실행
+    driver = create_driver()
 
     # 2. Syllabus 페이지 접속
-    syllabus_link = wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@title="수강편람"]')))
-    driver.execute_script("arguments[0].click();", syllabus_link)
-    time.sleep(1)
+    waiter = open_syllabus_page(driver)
 
     # 3. 검색 조건 설정
     for semester in semesters:
-        data = {university_name: {}}
-        JSON_FILE = f"data/raw/hanyang_syllabus_{semester}_v2.json"
+        # 학과별 결과는 JSONL에 이어 쓰고, 재실행 시 완료된 학과는 건너뜀
+        sink = RecordSink(json_file_for(semester))
 
         for college in colleges:
-            # 학기 선택
-            term_select_element = wait.until(EC.visibility_of_element_located((By.ID, "cbTerm")))
-            term_select = Select(term_select_element)
-            term_select.select_by_visible_text(f"{semester}학기")
-            time.sleep(1)
-
-            # 학과과목(전공) 오디오버튼 선택
-            major_radio = wait.until(EC.element_to_be_clickable((By.ID, "hak")))
-            major_radio.click()
-            time.sleep(1)
-
-            # 단과대학 선택
-            daehak_select = Select(driver.find_element(By.ID, "cbDaehak"))
-            daehak_select.select_by_visible_text(college)
-            time.sleep(1)
-            
-            # 학과 선택
-            hakgwa_select = Select(driver.find_element(By.ID, "cbHakgwajungong"))
-
-            for hakgwa_option in hakgwa_select.options:
-                hakgwa_name = hakgwa_option.text.strip()
-                hakgwa_select.select_by_visible_text(hakgwa_name)
-                time.sleep(1)
-
-                # 조회 버튼 클릭
-                btn_find = driver.find_element(By.ID, "btn_Find")
-                btn_find.click()
-                time.sleep(1)
-
-                previous_page = None
-
-                while True:
-                    # wait.until(lambda driver: driver.find_element(By.CSS_SELECTOR, ".numberLink span.strong").text.strip() != "")
-                    paging = driver.find_element(By.CSS_SELECTOR, ".numberLink")
-                    current_page = int(paging.find_element(By.CSS_SELECTOR, "span.strong").text.strip())
-                    print("현재 페이지: ", current_page)
-
-                    if previous_page == current_page:
-                        break
-
-                    rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
-                    for row in rows:
-                        grade = ""
-                        course_classification = ""
-                        subject_name = ""
-                        description = ""
-
-                        # 학년
-                        try:
-                            grade = row.find_elements(By.CSS_SELECTOR, "td#isuGrade")[0].text.strip()
-                        except:
-                            grade = ""
-
-                        # 과목 분류
-                        try:
-                            course_classification = row.find_elements(By.CSS_SELECTOR, "td#isuGbNm")[0].text.strip()
-                        except:
-                            course_classification = ""
-
-                        # 과목명
-                        try:
-                            subject_name = row.find_elements(By.CSS_SELECTOR, "td#gwamokNm")[0].text.strip()
-                        except:
-                            subject_name = ""
-
-                        try:
-                            # 4. 학수번호 클릭 (팝업 오픈)
-                            subject_num = row.find_element(By.ID, "haksuNo")
-                            driver.execute_script("arguments[0].click();", subject_num)
-                            time.sleep(1)
-
-                            # 과목 설명 크롤링
-                            try:
-                                description = driver.find_element(By.ID, "gwamokGaeyo").text.strip()
-                            except:
-                                description = ""                        
-                        except Exception as e:
-                            print("에러:", e)
-
-                        if subject_name.strip() or description.strip():
-                            if college not in data[university_name]:
-                                data[university_name][college] = {}
-                            if hakgwa_name not in data[university_name][college]:
-                                data[university_name][college][hakgwa_name] = []
-                            data[university_name][college][hakgwa_name].append({
-                                "grade_semester": f'{grade}-{semester}',
-                                "course_classification": course_classification,
-                                "name": subject_name,
-                                "description": description
-                            })
-
-                            print(f'{grade}-{semester}')
-                            print(f'{course_classification}\n{subject_name}')
-                        else:
-                            print(f"빈 항목 건너뜀")
-
-                    # 팝업 닫기
-                    close_btn = driver.find_element(By.ID, "btn_Close")
-                    driver.execute_script("arguments[0].click();", close_btn)
-                    time.sleep(1)
-
-                    # 다음 페이지 클릭
-                    next_page = driver.find_elements(By.CSS_SELECTOR,f'.cc-paging a[onclick="ServiceController.goPage({current_page + 1})"]')
-                    if next_page:
-                        driver.execute_script("arguments[0].click();", next_page[0])
-                    else:
-                        next_arrow = driver.find_element(By.CSS_SELECTOR, '#pagingPanel img[alt="다음"]')
-                        driver.execute_script("arguments[0].click();", next_arrow)
-                            
-                    time.sleep(1)
-                    previous_page = current_page
-
-                with open(JSON_FILE, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-                    print(f"중간 저장 완료: {JSON_FILE}")
+            select_college(driver, waiter, semester, college)
+
+            for hakgwa_name in list_departments(driver):
+                if sink.is_done(unit_key(college, hakgwa_name)):
+                    print(f"완료된 학과 건너뜀: {hakgwa_name}")
+                    continue
+
+                courses = crawl_department(driver, waiter, semester, hakgwa_name)
+                add_courses(sink, college, hakgwa_name, courses)
 
         # 5. JSON 저장
-        with open(JSON_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-            print(f"JSON 저장 완료: {JSON_FILE}")
-    
+        sink.finalize(indent=2)
+
+    waiter.report()
     driver.quit()
 
+
+# ------------------------------
+# 브라우저 풀 모드
+# ------------------------------
+def list_work_items():
+    """(학기, 단과대학, 학과) 작업 목록을 브라우저 하나로 미리 수집합니다."""
+    driver = create_driver()
+    try:
+        waiter = open_syllabus_page(driver)
+        work_items = []
+        for semester in semesters:
+            for college in colleges:
+                select_college(driver, waiter, semester, college)
+                for hakgwa_name in list_departments(driver):
+                    work_items.append((semester, college, hakgwa_name))
+    finally:
+        driver.quit()
+
+    print(f"작업 수: {len(work_items)}개")
+    return work_items
+
+
+def pool_worker(worker_id, work_queue, sinks, results):
+    """독립된 브라우저 하나로 큐가 빌 때까지 작업을 처리합니다."""
+    driver = create_driver()
+    try:
+        waiter = open_syllabus_page(driver)
+        selected = None
+
+        while True:
+            try:
+                idx, (semester, college, hakgwa_name) = work_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            for attempt in range(2):
+                try:
+                    # 학기/단과대학이 바뀔 때만 다시 선택
+                    if selected != (semester, college):
+                        select_college(driver, waiter, semester, college)
+                        selected = (semester, college)
+
+                    courses = crawl_department(driver, waiter, semester, hakgwa_name)
+                    add_courses(sinks[semester], college, hakgwa_name, courses)
+                    results[idx] = len(courses)
+                    print(f"[worker {worker_id}] {semester}학기 {college} {hakgwa_name}: {len(courses)}개 과목")
+                    break
+                except Exception as e:
+                    print(f"[worker {worker_id}] 에러 ({semester}학기 {college} {hakgwa_name}): {e}")
+                    # 페이지를 새로 열고 한 번 더 시도
+                    waiter = open_syllabus_page(driver)
+                    selected = None
+        waiter.report()
+    finally:
+        driver.quit()
+
+
+def run_pool(pool_size=POOL_SIZE):
+    work_items = list_work_items()
+    sinks = {semester: RecordSink(json_file_for(semester)) for semester in semesters}
+
+    # 작업 목록 순서대로 넣어서 학기/단과대학 재선택은 경계에서만 일어나도록 함
+    # (이전 실행에서 완료된 학과는 제외)
+    work_queue = queue.Queue()
+    results = {}
+    for idx, (semester, college, hakgwa_name) in enumerate(work_items):
+        if sinks[semester].is_done(unit_key(college, hakgwa_name)):
+            results[idx] = None
+            continue
+        work_queue.put((idx, (semester, college, hakgwa_name)))
+
+    with ThreadPoolExecutor(max_workers=pool_size) as executor:
+        futures = [
+            executor.submit(pool_worker, worker_id, work_queue, sinks, results)
+            for worker_id in range(pool_size)
+        ]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                # 브라우저가 죽은 워커의 남은 작업은 다른 워커가 이어서 처리
+                print(f"워커 종료: {e}")
+
+    missing = [item for idx, item in enumerate(work_items) if idx not in results]
+    if missing:
+        print(f"수집 실패 작업 {len(missing)}개: {missing}")
+
+    # 워커들이 섞어 쓴 기록을 작업 목록 순서대로 학기별 JSON으로 조립
+    for semester in semesters:
+        unit_order = [unit_key(college, hakgwa_name) for s, college, hakgwa_name in work_items if s == semester]
+        # 실패한 작업이 있으면 재실행 시 이어서 수집할 수 있도록 JSONL을 남겨 둠
+        sinks[semester].finalize(indent=2, unit_order=unit_order, discard=not missing)
+
+
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    if POOL_SIZE > 1:
+        run_pool()
+    else:
+        run()
@@ -0,0 +1,268 @@
+"""
+API 크롤러 공용 HTTP 클라이언트
+
+- requests.Session 기반 keep-alive 커넥션 풀 (스크립트 전체에서 하나의 세션 재사용)
+- URL + params 기준 디스크 응답 캐시 (data/cache/http)
+  - TTL 이내의 캐시는 네트워크 요청 없이 그대로 재사용
+  - TTL이 지난 캐시는 ETag / Last-Modified 로 조건부 요청 후 304면 캐시 재사용
+  - apiKey, serviceKey 같은 인증키는 캐시 키와 메타데이터에서 제외
+  - 200이어도 본문이 오류(할당량 초과 / 잘못된 인증키 등)일 수 있으므로,
+    validate로 호출한 쪽이 확인한 응답만 캐시에 저장 (캐시에서 읽은 응답도 다시 확인)
+- 호스트별 토큰 버킷 (asyncio 크롤러의 서버 부하 방지용)
+
+환경변수
+- HTTP_CACHE_DIR: 캐시 디렉토리 (기본값: data/cache/http)
+- HTTP_CACHE_TTL: 캐시 유효 시간(초). 비워두면 만료 없이 항상 캐시 재사용, 0이면 매번 재검증
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_CACHE_DIR = Path(os.getenv("HTTP_CACHE_DIR", "data/cache/http"))
+DEFAULT_TTL = float(os.getenv("HTTP_CACHE_TTL")) if os.getenv("HTTP_CACHE_TTL") else None
+
+# 캐시 키 / 메타데이터에 남기지 않을 인증 파라미터
+SECRET_PARAMS = {"apiKey", "serviceKey", "ServiceKey"}
+
+
+def make_cache_key(method: str, url: str, params: Optional[Dict] = None) -> str:
+    """URL 쿼리스트링과 params를 합쳐 정렬한 뒤 해시한 캐시 키를 만듭니다."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    query += [(k, "" if v is None else str(v)) for k, v in (params or {}).items()]
+    query = sorted((k, v) for k, v in query if k not in SECRET_PARAMS)
+
+    base_url = urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+    raw = json.dumps([method.upper(), base_url, query], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def redact_url(url: str) -> str:
+    """메타데이터 기록용으로 인증키를 제거한 URL을 반환합니다."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in SECRET_PARAMS]
+    query_str = "&".join(f"{k}={v}" for k, v in query)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query_str, ""))
+
+
+class CachedHttpClient:
+    """커넥션 풀링 + 디스크 캐시를 제공하는 HTTP 클라이언트"""
+
+    def __init__(
+        self,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        ttl: Optional[float] = DEFAULT_TTL,
+        pool_maxsize: int = 32,
+        use_cache: bool = True,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.use_cache = use_cache
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.stats = {"network": 0, "cache_hit": 0, "revalidated": 0}
+        self._stats_lock = threading.Lock()
+
+    # ------------------------------
+    # 캐시 입출력
+    # ------------------------------
+    def _entry_paths(self, key: str):
+        entry_dir = self.cache_dir / key[:2]
+        return entry_dir / f"{key}.meta.json", entry_dir / f"{key}.body"
+
+    def _drop_entry(self, key: str):
+        for path in self._entry_paths(key):
+            path.unlink(missing_ok=True)
+
+    def _load_entry(self, key: str) -> Optional[Dict]:
+        meta_path, body_path = self._entry_paths(key)
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            meta["body"] = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        return meta
+
+    def _store_entry(self, key: str, response: requests.Response):
+        meta_path, body_path = self._entry_paths(key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+
+        meta = {
+            "url": redact_url(response.url),
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "encoding": response.encoding,
+            "fetched_at": time.time(),
+        }
+
+        # body를 먼저 쓰고 meta를 나중에 써서, meta가 있으면 항상 완전한 캐시가 되도록 함
+        tmp_suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        body_tmp = body_path.with_name(body_path.name + tmp_suffix)
+        meta_tmp = meta_path.with_name(meta_path.name + tmp_suffix)
+        body_tmp.write_bytes(response.content)
+        os.replace(body_tmp, body_path)
+        meta_tmp.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        os.replace(meta_tmp, meta_path)
+
+    def _touch_entry(self, key: str, entry: Dict):
+        meta_path, _ = self._entry_paths(key)
+        meta = {k: v for k, v in entry.items() if k != "body"}
+        meta["fetched_at"] = time.time()
+        tmp = meta_path.with_name(meta_path.name + f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, meta_path)
+
+    @staticmethod
+    def _build_response(entry: Dict, url: str) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+        response.encoding = entry.get("encoding")
+        response.url = url
+        response._content = entry["body"]
+        response.elapsed = timedelta(0)
+        response.from_cache = True
+        return response
+
+    def _is_fresh(self, entry: Dict) -> bool:
+        if self.ttl is None:
+            return True
+        return time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    def _count(self, name: str):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    # ------------------------------
+    # 요청
+    # ------------------------------
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        cache: bool = True,
+        validate: Optional[Callable[[requests.Response], bool]] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        GET 요청. 캐시가 유효하면 디스크에서 응답을 재구성해 반환합니다.
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            cache: False면 캐시를 읽거나 쓰지 않음 (접속 점검 등)
+            validate: 응답 본문이 정상인지 확인하는 함수. False인 응답은 캐시에 저장하지 않고,
+                      이미 저장된 캐시가 False면 지우고 다시 요청합니다.
+        """
+        if not (cache and self.use_cache):
+            self._count("network")
+            return self.session.get(url, params=params, **kwargs)
+
+        key = make_cache_key("GET", url, params)
+        entry = self._load_entry(key)
+        if entry and validate and not validate(self._build_response(entry, url)):
+            self._drop_entry(key)
+            entry = None
+
+        if entry and self._is_fresh(entry):
+            self._count("cache_hit")
+            return self._build_response(entry, url)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry:
+            cached_headers = CaseInsensitiveDict(entry.get("headers", {}))
+            if cached_headers.get("ETag"):
+                headers["If-None-Match"] = cached_headers["ETag"]
+            if cached_headers.get("Last-Modified"):
+                headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+
+        self._count("network")
+        response = self.session.get(url, params=params, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry:
+            self._count("revalidated")
+            self._touch_entry(key, entry)
+            return self._build_response(entry, url)
+
+        if response.status_code == 200 and (validate is None or validate(response)):
+            self._store_entry(key, response)
+        response.from_cache = False
+        return response
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        """HEAD 요청 (캐시하지 않음)"""
+        self._count("network")
+        return self.session.head(url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncTokenBucket:
+    """초당 rate개의 토큰을 채우는 토큰 버킷 (최대 capacity개까지 적립)"""
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class HostRateLimiter:
+    """URL의 호스트마다 별도의 토큰 버킷을 적용합니다."""
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.buckets: Dict[str, AsyncTokenBucket] = {}
+
+    async def acquire(self, url: str):
+        host = urlsplit(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = AsyncTokenBucket(self.rate, self.capacity)
+        await self.buckets[host].acquire()
+
+
+_client: Optional[CachedHttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> CachedHttpClient:
+    """프로세스 전체에서 공유하는 클라이언트를 반환합니다."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = CachedHttpClient()
+        return _client
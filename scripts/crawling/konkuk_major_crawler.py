@@ -1,13 +1,31 @@
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from playwright.sync_api import Page, sync_playwright
+import requests
+from bs4 import BeautifulSoup
+
+from browser_factory import launch_chromium, new_lean_page
+from http_client import get_client
 
 BASE_URL = "https://www.konkuk.ac.kr/bulletins25/{major_id}/subview.do"
 TARGET_UNIV_KEYWORD = "건국"
 
+# "http": fetch pages concurrently and parse the static HTML (browser only for failures)
+# "browser": visit every page with Playwright
+CRAWL_MODE = os.getenv("KONKUK_CRAWL_MODE", "http")
+CONCURRENCY = int(os.getenv("KONKUK_CONCURRENCY", "8"))
+
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 def slugify(value: str) -> str:
     """Create a filename-friendly slug from input text."""
     slug = re.sub(r"[^0-9a-zA-Z가-힣]+", "_", value)
@@ -74,7 +92,7 @@ def parse_korean_desc_from_onclick(onclick_attr: str) -> str:
     return ""
 
 
-def extract_courses_from_table(page: Page) -> List[Dict]:
+def extract_courses_from_table(page) -> List[Dict]:
     """
     Extract Korea course data from the standard list table.
     """
@@ -121,7 +139,73 @@ def extract_courses_from_table(page: Page) -> List[Dict]:
     return courses
 
 
-def fetch_major_courses(page: Page, major_id: str) -> List[Dict]:
+def cell_text(td) -> str:
+    """Approximate Playwright inner_text() for a static table cell."""
+    for br in td.find_all("br"):
+        br.replace_with("\n")
+    lines = (" ".join(line.split()) for line in td.get_text().split("\n"))
+    return "\n".join(line for line in lines if line).strip()
+
+
+def extract_courses_from_html(html) -> List[Dict]:
+    """
+    Static-HTML counterpart of extract_courses_from_table (same fields and filtering).
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    courses: List[Dict] = []
+
+    for row in soup.select("table tbody tr"):
+        tds = row.find_all("td")
+
+        if len(tds) < 5:
+            continue
+
+        name_cell = tds[3]
+        name_kor = cell_text(name_cell)
+
+        if not name_kor:
+            continue
+
+        description = ""
+        link = name_cell.find("a")
+        if link is not None:
+            description = parse_korean_desc_from_onclick(link.get("onclick") or "")
+
+        courses.append({
+            "grade_semester": cell_text(tds[0]),
+            "course_classification": cell_text(tds[1]),
+            "name": name_kor,
+            "name_en": cell_text(tds[4]),
+            "description": description,
+        })
+
+    return courses
+
+
+def fetch_major_courses_http(major_id: str) -> Optional[List[Dict]]:
+    """
+    Fetch the major page without a browser.
+    Returns None when the page cannot be fetched or has no course table,
+    so the caller can retry it in the browser.
+    """
+    url = BASE_URL.format(major_id=major_id)
+    try:
+        res = get_client().get(url, timeout=30)
+        res.raise_for_status()
+    except requests.RequestException as e:
+        print(f"[WARN] HTTP fetch failed for {url}: {e}")
+        return None
+
+    courses = extract_courses_from_html(res.content)
+    if not courses:
+        print(f"[WARN] No courses in static HTML: {url}")
+        return None
+
+    print(f"[INFO] Parsed {url} ({len(courses)} courses)")
+    return courses
+
+
+def fetch_major_courses(page, major_id: str) -> List[Dict]:
     """
     Navigate to the major page and extract courses.
     """
@@ -132,14 +216,20 @@ def fetch_major_courses(page: Page, major_id: str) -> List[Dict]:
     return extract_courses_from_table(page)
 
 
-def crawl_konkuk_majors(
-    univ_name: str, majors_by_college: Dict[str, List[Dict[str, str]]]
+def crawl_konkuk_majors_browser(
+    univ_name: str,
+    majors_by_college: Dict[str, List[Dict[str, str]]],
+    data: Optional[Dict[str, Dict[str, List[Dict]]]] = None,
 ) -> Dict[str, Dict[str, List[Dict]]]:
-    data: Dict[str, Dict[str, List[Dict]]] = {univ_name: {}}
+    """Visit every major page with Playwright and fill data in place."""
+    from playwright.sync_api import sync_playwright
+
+    if data is None:
+        data = {univ_name: {}}
 
     with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=False, slow_mo=100)
-        page = browser.new_page()
+        browser = launch_chromium(playwright)
+        page = new_lean_page(browser, BASE_URL)
         page.set_default_timeout(10_000)
 
         for college_name, entries in majors_by_college.items():
@@ -153,6 +243,42 @@ def crawl_konkuk_majors(
     return data
 
 
+def crawl_konkuk_majors(
+    univ_name: str,
+    majors_by_college: Dict[str, List[Dict[str, str]]],
+    mode: str = CRAWL_MODE,
+    concurrency: int = CONCURRENCY,
+) -> Dict[str, Dict[str, List[Dict]]]:
+    if mode == "browser":
+        return crawl_konkuk_majors_browser(univ_name, majors_by_college)
+
+    entries = [
+        (college_name, entry)
+        for college_name, college_entries in majors_by_college.items()
+        for entry in college_entries
+    ]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(
+            executor.map(lambda item: fetch_major_courses_http(item[1]["major_id"]), entries)
+        )
+
+    # Keep README order; departments that failed over HTTP are retried in the browser
+    data: Dict[str, Dict[str, List[Dict]]] = {univ_name: {}}
+    fallback: Dict[str, List[Dict[str, str]]] = {}
+    for (college_name, entry), courses in zip(entries, results):
+        college_group = data[univ_name].setdefault(college_name, {})
+        college_group[entry["dept_name"]] = courses or []
+        if courses is None:
+            fallback.setdefault(college_name, []).append(entry)
+
+    if fallback:
+        count = sum(len(v) for v in fallback.values())
+        print(f"[INFO] Falling back to the browser for {count} majors")
+        crawl_konkuk_majors_browser(univ_name, fallback, data)
+
+    return data
+
+
 def save_department_output(
     out_dir: Path,
     univ_name: str,
@@ -1,18 +1,31 @@
-import time, json
-from selenium import webdriver
-from selenium.webdriver.support.ui import Select, WebDriverWait
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from bs4 import BeautifulSoup
+from selenium.webdriver.support.ui import Select
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
+from browser_factory import create_chrome
+from browser_wait import PageWaiter
+from record_sink import RecordSink
 
 BASE_URL = "https://registrar.korea.ac.kr/eduinfo/info/registration_courses.do"
 CHROME_DRIVER_PATH = r"C:\SKN_19\SKN19-3RD_1TEAM\chromedriver.exe"
 
 UNIVERSITY = "고려대학교"
+OUTPUT_FILE = "korea_2025_courses.json"
 YEAR = "2025"
 TERMS = ["1R", "2R"]
 COLLEGES = ["이과대학", "공과대학", "정보대학"]
 
+# 수집 방식: "direct" = 강의계획서 페이지를 HTTP로 직접 요청, "popup" = 과목마다 팝업 창을 열어 수집
+MODE = os.getenv("KOREA_CRAWL_MODE", "direct")
+FETCH_CONCURRENCY = int(os.getenv("KOREA_FETCH_CONCURRENCY", "8"))
+
+PLAN_VIEW_SPAN = "//span[contains(@onclick,'fnPlanView')]"
+
 
 def switch_to_frame(driver):
     driver.switch_to.default_content()
@@ -28,12 +41,10 @@ def switch_to_frame(driver):
     return False
 
 
-def read_popup(driver, wait):
+def read_popup(driver, waiter):
     """팝업에서 과목명 / 강의요목 / 연도-학기 / 학수번호-분반 크롤링"""
 
-    time.sleep(1.0)
-
-    for _ in range(10):
+    def popup_filled(driver):
         try:
             # 과목명
             name = driver.find_element(
@@ -59,27 +70,259 @@ def read_popup(driver, wait):
             if name and desc and year_term and course_code:
                 return name, desc, year_term, course_code
 
-            time.sleep(0.5)
+        except:
+            pass
+
+        return False
+
+    # 값이 모두 채워지는 즉시 반환, 실패 시 빈 값 반환
+    return waiter.until(popup_filled, "팝업 내용", timeout=6, required=False) or ("", "", "", "")
+
 
+def close_popup(driver, main_handle):
+    # 팝업 닫기
+    try:
+        close_btn = driver.find_element(By.CLASS_NAME, "close")
+        driver.execute_script("arguments[0].click();", close_btn)
+    except:
+        try:
+            driver.close()
         except:
-            time.sleep(0.5)
+            pass
+
+    driver.switch_to.window(main_handle)
+    # 다시 iframe 복귀
+    switch_to_frame(driver)
+
+
+def open_popup_record(driver, waiter, main_handle, idx):
+    """
+    idx번째 과목의 강의계획서 팝업을 열어 읽습니다.
+    (과목 정보, 팝업 URL)을 반환하고, 팝업이 열리지 않으면 (None, None)을 반환합니다.
+    """
+    # iframe 재진입
+    if not switch_to_frame(driver):
+        return None, None
+
+    waiter.present((By.CSS_SELECTOR, "table tbody tr"), "결과 테이블")
+    spans = driver.find_elements(By.XPATH, PLAN_VIEW_SPAN)
+
+    if idx >= len(spans):
+        return None, None
+
+    # 팝업 열기
+    before = driver.window_handles[:]
+    driver.execute_script("arguments[0].click();", spans[idx])
+
+    popup = waiter.new_window(before, "팝업 열림", timeout=3, required=False)
+
+    if not popup:
+        print("    [ERROR] 팝업 없음 → skip")
+        switch_to_frame(driver)
+        return None, None
+
+    # 팝업 이동
+    driver.switch_to.window(popup)
+
+    name, desc, year_term, course_code = read_popup(driver, waiter)
+    popup_url = driver.current_url
+
+    print(f"    → {name}")
+
+    record = {
+        "name": name,
+        "description": desc,
+        "year_term": year_term,
+        "course_code": course_code
+    }
+
+    close_popup(driver, main_handle)
+    return record, popup_url
+
+
+def crawl_department_popup(driver, waiter, main_handle, start=0):
+    """조회 결과의 과목마다 팝업 창을 열어 수집합니다."""
+    records = []
+    total = len(driver.find_elements(By.XPATH, PLAN_VIEW_SPAN))
+
+    for idx in range(start, total):
+        record, _ = open_popup_record(driver, waiter, main_handle, idx)
+        if record is not None:
+            records.append(record)
+
+    return records
+
 
-    # 실패 시 빈 값 반환
-    return "", "", "", ""
+# ------------------------------
+# 강의계획서 직접 요청 모드
+# ------------------------------
+def parse_plan_view_args(onclick):
+    """onclick="fnPlanView('2025', '1R', 'COSE101', '00')" → ['2025', '1R', 'COSE101', '00']"""
+    match = re.search(r"fnPlanView\s*\((.*?)\)", onclick or "", re.S)
+    if not match:
+        return []
+    args = re.findall(r"'([^']*)'|\"([^\"]*)\"|([^,\s]+)", match.group(1))
+    return [single or double or bare for single, double, bare in args]
 
 
+def learn_plan_view_url(popup_url, args):
+    """
+    첫 과목 팝업의 URL과 fnPlanView 인자를 비교해서 요청 템플릿을 만듭니다.
+    쿼리 파라미터 중 인자와 값이 같은 것은 과목마다 바뀌는 파라미터로 보고 인자 위치를 기록합니다.
+    """
+    if not popup_url or not popup_url.startswith("http"):
+        return None
 
-def crawl():
-    data = {UNIVERSITY: {}}
+    parts = urlsplit(popup_url)
+    params = dict(parse_qsl(parts.query, keep_blank_values=True))
+    mapping = {}
+    for param, value in params.items():
+        if value and value in args:
+            mapping[param] = args.index(value)
 
-    options = webdriver.ChromeOptions()
-    options.add_argument("--window-size=1500,1200")
-    options.add_argument("--disable-popup-blocking")
+    if not mapping:
+        return None
 
-    driver = webdriver.Chrome(service=Service(CHROME_DRIVER_PATH), options=options)
-    wait = WebDriverWait(driver, 10)
+    base_url = f"{parts.scheme}://{parts.netloc}{parts.path}"
+    return {"base_url": base_url, "params": params, "mapping": mapping}
+
+
+def plan_view_url(template, args):
+    params = dict(template["params"])
+    for param, pos in template["mapping"].items():
+        if pos < len(args):
+            params[param] = args[pos]
+    return f"{template['base_url']}?{urlencode(params)}"
+
+
+def build_session(driver):
+    """브라우저 세션 쿠키와 User-Agent를 그대로 사용하는 requests 세션"""
+    session = requests.Session()
+    session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+    session.headers["Referer"] = BASE_URL
+    sync_cookies(driver, session)
+    return session
+
+
+def sync_cookies(driver, session):
+    try:
+        # iframe / 팝업 도메인 쿠키까지 모두 가져오기
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+    except Exception:
+        cookies = driver.get_cookies()
+
+    for cookie in cookies:
+        session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+
+
+def parse_plan_view(html):
+    """강의계획서 정적 HTML에서 과목명 / 강의요목 / 연도-학기 / 학수번호-분반을 읽습니다."""
+    soup = BeautifulSoup(html, "html.parser")
+    fields = {"name": "", "description": "", "year_term": "", "course_code": ""}
+
+    for th in soup.find_all("th"):
+        label = th.get_text(strip=True)
+        td = th.find_next_sibling("td")
+        if td is None:
+            continue
+        value = td.get_text("\n", strip=True)
+
+        if label == "과목명" and not fields["name"]:
+            fields["name"] = value
+        elif label == "강의요목" and not fields["description"]:
+            fields["description"] = value
+        elif "연도" in label and not fields["year_term"]:
+            fields["year_term"] = value
+        elif "학수번호" in label and not fields["course_code"]:
+            fields["course_code"] = value
+
+    return fields
+
+
+def fetch_plan_view(session, url):
+    try:
+        res = session.get(url, timeout=15)
+        res.raise_for_status()
+    except requests.RequestException as e:
+        print(f"    [ERROR] 강의계획서 요청 실패: {e}")
+        return None
+    # 인코딩은 HTML meta charset 기준으로 BeautifulSoup이 판단
+    return parse_plan_view(res.content)
+
+
+def crawl_department_direct(driver, waiter, main_handle, state):
+    """
+    조회 결과의 fnPlanView 인자를 한 번에 읽고 강의계획서 페이지를 HTTP로 동시에 요청합니다.
+    요청 URL 형식을 아직 모르면 첫 과목만 팝업으로 열어서 학습하고,
+    학습에 실패하면 이후 모든 학과를 팝업 방식으로 수집합니다.
+    """
+    spans = driver.find_elements(By.XPATH, PLAN_VIEW_SPAN)
+    args_list = [parse_plan_view_args(span.get_attribute("onclick")) for span in spans]
+    if not args_list:
+        return []
+
+    records = []
+    start = 0
+
+    if state.get("template") is None:
+        record, popup_url = open_popup_record(driver, waiter, main_handle, 0)
+        if record is not None:
+            records.append(record)
+        start = 1
+
+        template = learn_plan_view_url(popup_url, args_list[0])
+        session = build_session(driver) if template else None
+
+        # 첫 과목을 HTTP로 받아서 팝업 결과와 같은지 확인
+        if template:
+            check = fetch_plan_view(session, plan_view_url(template, args_list[0]))
+            if not check or record is None or check["name"] != record["name"]:
+                template = None
+
+        if not template:
+            print("  [WARN] 강의계획서 URL 학습 실패 → 팝업 방식으로 수집")
+            state["template"] = False
+            # 첫 과목 팝업도 실패했으면 첫 과목부터 다시 수집
+            return records + crawl_department_popup(driver, waiter, main_handle, start=0 if record is None else 1)
+
+        print(f"  [INFO] 강의계획서 URL 학습: {template['base_url']} ({', '.join(template['mapping'])})")
+        state["template"] = template
+        state["session"] = session
+
+    template = state["template"]
+    session = state["session"]
+    sync_cookies(driver, session)
+
+    urls = [plan_view_url(template, args) for args in args_list[start:]]
+    with waiter.step("강의계획서 HTTP 요청"):
+        with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as executor:
+            fetched = list(executor.map(lambda url: fetch_plan_view(session, url), urls))
+
+    for offset, fields in enumerate(fetched):
+        if not fields or not fields["name"]:
+            # 응답이 비정상인 과목만 팝업으로 수집
+            record, _ = open_popup_record(driver, waiter, main_handle, start + offset)
+        else:
+            record = fields
+            print(f"    → {record['name']}")
+        if record is not None:
+            records.append(record)
+
+    return records
+
+
+def crawl(mode=MODE):
+    # 과목은 JSONL에 이어 쓰고, 재실행 시 완료된 (학기, 학과)는 건너뜀
+    sink = RecordSink(OUTPUT_FILE)
+
+    driver = create_chrome(
+        driver_path=CHROME_DRIVER_PATH if os.path.exists(CHROME_DRIVER_PATH) else None,
+        extra_args=["--disable-popup-blocking"],
+    )
+    waiter = PageWaiter(driver, 10)
 
     main_handle = driver.current_window_handle
+    direct_state = {}
 
     for term in TERMS:
 
@@ -87,27 +330,26 @@ def crawl():
 
         # 매 학기마다 페이지 다시 로드 — 중요!!
         driver.get(BASE_URL)
-        time.sleep(2)
 
-        if not switch_to_frame(driver):
+        # 검색 폼이 있는 iframe이 준비될 때까지 대기
+        if not waiter.until(switch_to_frame, "iframe 진입", required=False):
             print("[ERROR] iframe 진입 실패")
             continue
 
         # 연도/학기 설정
-        try: Select(driver.find_element(By.ID, "pYear")).select_by_visible_text(YEAR)
+        try: waiter.perform(lambda: Select(driver.find_element(By.ID, "pYear")).select_by_visible_text(YEAR), "연도 선택")
         except: pass
 
-        try: Select(driver.find_element(By.ID, "pTerm")).select_by_value(term)
+        try: waiter.perform(lambda: Select(driver.find_element(By.ID, "pTerm")).select_by_value(term), "학기 선택")
         except: pass
 
         for college in COLLEGES:
             print(f"\n========== {college} ==========")
 
-            data[UNIVERSITY].setdefault(college, {})
+            sink.ensure((UNIVERSITY, college), "dict")
 
             # 단과대 선택
-            Select(driver.find_element(By.ID, "pCol")).select_by_visible_text(college)
-            time.sleep(1)
+            waiter.perform(lambda: Select(driver.find_element(By.ID, "pCol")).select_by_visible_text(college), "단과대 선택")
 
             # 학과 리스트를 매번 fresh하게 가져와야 한다
             dept_sel = Select(driver.find_element(By.ID, "pDept"))
@@ -124,7 +366,7 @@ def crawl():
                     continue
 
                 dept_sel = Select(driver.find_element(By.ID, "pDept"))
-                dept_sel.select_by_value(dept_val)
+                waiter.perform(lambda: dept_sel.select_by_value(dept_val), "학과 선택")
                 dept_name = dept_sel.first_selected_option.text.strip()
 
                 if dept_name == college:
@@ -133,87 +375,38 @@ def crawl():
 
                 print(f"\n--- {dept_name} ---")
 
-                data[UNIVERSITY][college].setdefault(dept_name, [])
+                sink.ensure((UNIVERSITY, college, dept_name))
+
+                unit = f"{term}/{college}/{dept_name}"
+                if sink.is_done(unit):
+                    print("  [INFO] 이전 실행에서 완료됨 → skip")
+                    continue
 
                 # 조회
-                driver.find_element(By.ID, "btnSearch").click()
+                waiter.perform(driver.find_element(By.ID, "btnSearch").click, "조회")
 
                 try:
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr")))
+                    waiter.present((By.CSS_SELECTOR, "table tbody tr"), "조회 결과 표시")
                 except:
                     print("  [WARN] 조회 실패")
                     continue
 
-                time.sleep(0.5)
-
-                # span 목록을 html 기반으로 다시 파싱해야 안정적
-                spans = driver.find_elements(By.XPATH, "//span[contains(@onclick,'fnPlanView')]")
-                total = len(spans)
+                total = len(driver.find_elements(By.XPATH, PLAN_VIEW_SPAN))
                 print(f"  [INFO] {total}개 과목")
 
-                for idx in range(total):
-
-                    # iframe 재진입
-                    if not switch_to_frame(driver):
-                        break
-
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr")))
-                    spans = driver.find_elements(By.XPATH, "//span[contains(@onclick,'fnPlanView')]")
-
-                    if idx >= len(spans):
-                        break
-
-                    span = spans[idx]
-
-                    # 팝업 열기
-                    before = driver.window_handles[:]
-                    driver.execute_script("arguments[0].click();", span)
-
-                    popup = None
-                    for _ in range(15):
-                        after = driver.window_handles
-                        if len(after) > len(before):
-                            popup = [h for h in after if h not in before][0]
-                            break
-                        time.sleep(0.2)
-
-                    if not popup:
-                        print("    [ERROR] 팝업 없음 → skip")
-                        continue
-
-                    # 팝업 이동
-                    driver.switch_to.window(popup)
-
-                    name, desc, year_term, course_code = read_popup(driver, wait)
-
-                    print(f"    → {name}")
-
-                    data[UNIVERSITY][college][dept_name].append({
-                        "name": name,
-                        "description": desc,
-                        "year_term": year_term,
-                        "course_code": course_code
-                    })
-
-                    # 팝업 닫기
-                    try:
-                        close_btn = driver.find_element(By.CLASS_NAME, "close")
-                        driver.execute_script("arguments[0].click();", close_btn)
-                    except:
-                        try:
-                            driver.close()
-                        except:
-                            pass
+                if mode == "direct" and direct_state.get("template") is not False:
+                    records = crawl_department_direct(driver, waiter, main_handle, direct_state)
+                else:
+                    records = crawl_department_popup(driver, waiter, main_handle)
 
-                    driver.switch_to.window(main_handle)
-                    # 다시 iframe 복귀
-                    switch_to_frame(driver)
+                sink.add_many((UNIVERSITY, college, dept_name), records, unit=unit)
+                sink.mark_done(unit)
 
     # 저장
-    with open("korea_2025_courses.json", "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    sink.finalize(indent=2)
 
     print("\n🎉 전체 크롤링 완료!")
+    waiter.report()
     driver.quit()
 
 
@@ -0,0 +1,176 @@
+"""
+크롤링 결과 스트리밍 저장
+
+과목 하나를 수집할 때마다 JSONL 파일에 한 줄씩 append 하고,
+수집이 끝나면 finalize()로 {대학: {단과대학: {학과: [과목, ...]}}} 형태의 최종 JSON을 만듭니다.
+- 전체 dict를 매번 다시 쓰지 않으므로 쓰기 양이 수집량에 비례
+- 도중에 프로세스가 죽어도 그때까지의 결과가 JSONL에 남음 (마지막 줄이 잘리면 해당 줄만 무시)
+- unit(예: 학과) 단위로 완료 표시를 남기면, 재실행 시 완료된 unit은 건너뛰고
+  완료되지 않은 unit의 일부 결과는 버린 뒤 다시 수집
+
+JSONL 한 줄 형식
+- {"path": [대학, 단과대학, 학과], "record": {...}}   과목 하나
+- {"path": [대학, 단과대학, 학과], "kind": "list"}    빈 학과 목록도 결과에 남길 때
+- {"path": [대학, 단과대학], "kind": "dict"}          빈 단과대학도 결과에 남길 때
+- {"done": unit}                                      unit 완료 표시
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+
+def records_path_for(output_path) -> Path:
+    """최종 출력 파일 옆에 둘 JSONL 경로 (예: hanyang_syllabus_1_v2.json → hanyang_syllabus_1_v2.records.jsonl)"""
+    return Path(output_path).with_suffix(".records.jsonl")
+
+
+def read_lines(path: Path) -> List[Dict]:
+    lines = []
+    if not path.exists():
+        return lines
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                lines.append(json.loads(line))
+            except ValueError:
+                continue
+    return lines
+
+
+class RecordSink:
+    def __init__(self, output_path, resume: bool = True):
+        """
+        Args:
+            output_path: finalize()로 만들 최종 JSON 경로
+            resume: True면 기존 JSONL에서 완료된 unit 결과를 이어서 사용,
+                    False면 기존 JSONL을 지우고 새로 시작
+        """
+        self.output_path = Path(output_path)
+        self.path = records_path_for(output_path)
+        self.done = set()
+        self.count = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self.path.exists():
+            self._compact()
+        else:
+            self.path.unlink(missing_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _compact(self):
+        """완료되지 않은 unit의 결과를 버리고 JSONL을 다시 씁니다. (재실행 시 한 번)"""
+        lines = read_lines(self.path)
+        self.done = {line["done"] for line in lines if "done" in line}
+        kept = [line for line in lines if line.get("unit") is None or line["unit"] in self.done]
+
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for line in kept:
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+        os.replace(tmp, self.path)
+
+        self.count = sum(1 for line in kept if "record" in line)
+        print(f"[sink] {self.path}: 과목 {self.count}개, 완료 unit {len(self.done)}개 복원")
+
+    def _write(self, line: Dict):
+        text = json.dumps(line, ensure_ascii=False)
+        with self._lock:
+            self._file.write(text + "\n")
+            self._file.flush()
+
+    # ------------------------------
+    # 기록
+    # ------------------------------
+    def add(self, path: Sequence[str], record: Dict, unit: Optional[str] = None):
+        """path 위치의 목록에 과목 하나를 추가합니다."""
+        line = {"path": list(path), "record": record}
+        if unit is not None:
+            line["unit"] = unit
+        self._write(line)
+        with self._lock:
+            self.count += 1
+
+    def add_many(self, path: Sequence[str], records: Iterable[Dict], unit: Optional[str] = None):
+        for record in records:
+            self.add(path, record, unit)
+
+    def ensure(self, path: Sequence[str], kind: str = "list"):
+        """과목이 없어도 결과에 남길 빈 목록(list) / 빈 그룹(dict)을 기록합니다."""
+        self._write({"path": list(path), "kind": kind})
+
+    def is_done(self, unit: str) -> bool:
+        return unit in self.done
+
+    def mark_done(self, unit: str):
+        """unit의 과목을 모두 기록했음을 표시합니다."""
+        self._write({"done": unit})
+        with self._lock:
+            self.done.add(unit)
+
+    # ------------------------------
+    # 최종 JSON
+    # ------------------------------
+    def build(self, unit_order: Optional[Sequence[str]] = None) -> Dict:
+        """
+        JSONL을 중첩 JSON으로 조립합니다.
+        unit_order가 주어지면 그 순서대로 unit 결과를 배치합니다. (병렬 수집처럼 기록 순서가 섞인 경우)
+        """
+        with self._lock:
+            self._file.flush()
+        lines = [line for line in read_lines(self.path) if "path" in line]
+
+        if unit_order is not None:
+            rank = {unit: i for i, unit in enumerate(unit_order)}
+            lines.sort(key=lambda line: rank.get(line.get("unit"), -1))
+
+        data: Dict = {}
+        for line in lines:
+            node = data
+            path = line["path"]
+            for key in path[:-1]:
+                node = node.setdefault(key, {})
+
+            if line.get("kind") == "dict":
+                node.setdefault(path[-1], {})
+            else:
+                target = node.setdefault(path[-1], [])
+                if "record" in line:
+                    target.append(line["record"])
+
+        return data
+
+    def finalize(self, indent: int = 2, unit_order: Optional[Sequence[str]] = None, discard: bool = True) -> Dict:
+        """
+        최종 JSON을 임시 파일에 쓴 뒤 교체합니다. (쓰는 도중 죽어도 기존 파일이 깨지지 않음)
+        discard=True면 JSONL 파일을 삭제합니다.
+        """
+        data = self.build(unit_order)
+
+        tmp = self.output_path.with_name(self.output_path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+        os.replace(tmp, self.output_path)
+        print(f"저장: {self.output_path} (과목 {self.count}개)")
+
+        if discard:
+            self.close()
+            self.path.unlink(missing_ok=True)
+        return data
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
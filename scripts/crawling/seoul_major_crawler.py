@@ -1,9 +1,7 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from browser_factory import create_chrome
 import time
 import json
 
@@ -14,8 +12,7 @@ colleges = ["공과대학", "자연과학대학"]
 
 def run():
     # 1. Chrome 실행
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service)
+    driver = create_chrome()
 
     driver.get(url)
     wait = WebDriverWait(driver, 10)
@@ -1,66 +1,345 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select, WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import time
-import json
+from selenium.webdriver.support.ui import Select
+from browser_factory import create_chrome
+from browser_wait import PageWaiter
+from browser_capture import (
+    drain_responses,
+    install_response_capture,
+    iter_json_records,
+    iter_record_lists,
+    parse_json,
+    replay_requests,
+    request_params,
+    with_params,
+)
+from record_sink import RecordSink
+import html
+import os
+import re
 
 url = "https://sugang.snu.ac.kr/sugang/co/co010.action"
 university_name = "서울대학교"
 semesters = [1, 2]
 colleges = ["공과대학", "자연과학대학"]
 
-def run():
+# 수집 방식: "capture" = 페이지의 XHR 응답 JSON에서 수집, "dom" = 과목마다 모달/탭을 열어 화면에서 수집
+MODE = os.getenv("SNU_CRAWL_MODE", "capture")
+
+# 상세 모달에 표시되는 항목 (화면의 요소 ID와 응답 JSON의 키가 같음)
+DETAIL_FIELDS = ("deptKorNm", "openShyr", "submattFgNm", "sbjtSmryCtnt")
+DETAIL_LOCATORS = [(By.ID, field) for field in DETAIL_FIELDS]
+
+
+def set_search_conditions(driver, waiter, semester, college, first):
+    # 검색 조건 설정 버튼 클릭
+    btn_detail = waiter.clickable((By.CSS_SELECTOR, "button.total-filter-btn"), "검색 조건 버튼")
+    waiter.click(btn_detail, "검색 조건 열기")
+    waiter.visible((By.ID, "hSrchOpenShtm"), "검색 조건 표시")
+
+    # 이전학기 검색조건 버튼 클릭
+    if first:
+        btn_prev = waiter.clickable((By.CSS_SELECTOR, "button.view-last-semester-btn"), "이전학기 버튼")
+        waiter.click(btn_prev, "이전학기 검색조건")
+
+        # 학사 선택
+        degree_select = Select(driver.find_element(By.ID, "hSrchCptnCorsFg"))
+        waiter.perform(lambda: degree_select.select_by_visible_text("학사"), "학사 선택")
+
+        # 교과 선택
+        driver.find_element(By.CSS_SELECTOR, "input[value='B']").click()  # 전필
+        driver.find_element(By.CSS_SELECTOR, "input[value='C']").click()  # 전선
+
+    # 학기 선택
+    semester_select = Select(driver.find_element(By.ID, "hSrchOpenShtm"))
+    waiter.perform(lambda: semester_select.select_by_visible_text(f"{semester}학기"), "학기 선택")
+
+    # 단과대학 선택
+    college_select = Select(driver.find_element(By.ID, "hSrchOpenUpDeptCd"))
+    waiter.perform(lambda: college_select.select_by_visible_text(college), "단과대학 선택")
+
+    # 검색 버튼 클릭
+    search_btn = driver.find_element(By.CSS_SELECTOR, ".filter-submit-btn")
+    waiter.click(search_btn, "검색")
+    waiter.present((By.CSS_SELECTOR, ".cc-paging a.num.on"), "검색 결과 표시")
+
+
+def go_next_page(driver, waiter, current_page):
+    """다음 페이지로 이동합니다. 마지막 페이지면 False를 반환합니다."""
+    next_page = driver.find_elements(By.CSS_SELECTOR, f'.cc-paging a.num[href*="fnGotoPage({current_page + 1})"]')
+    if next_page:
+        waiter.click(next_page[0], "다음 페이지")
+        return True
+
+    next_arrow = driver.find_element(By.CSS_SELECTOR, ".cc-paging a.arrow.next")
+    if "disabled" in next_arrow.get_attribute("class"):
+        return False
+
+    waiter.click(next_arrow, "다음 페이지")
+    return True
+
+
+def read_course_dom(driver, waiter, course, semester):
+    """과목 상세 모달과 교과목개요 탭을 열어 화면에서 (학과명, 과목 정보)를 읽습니다."""
+    grade = ""
+    course_classification = ""
+
+    # 과목명
+    course_name = course.find_element(By.CSS_SELECTOR, ".course-name strong").text.strip()
+
+    # 과목 리스트 클릭 (모달을 다시 열 때는 이전 과목 내용이 바뀔 때까지 대기)
+    detail_btn = course.find_element(By.CSS_SELECTOR, "a.course-info-detail")
+    before = waiter.snapshot(DETAIL_LOCATORS)
+    waiter.click(detail_btn, "상세 모달 열기")
+    waiter.refreshed(DETAIL_LOCATORS, before, "상세 모달 갱신")
+
+    # 학과명
+    dept_name = waiter.visible((By.ID, "deptKorNm"), "상세 모달 표시").text.strip()
+
+    try:
+        # 강의계획서 버튼 클릭 -> 수업 목표
+        # tab_lecture_plan = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#tab3 button")))
+        # driver.execute_script("arguments[0].click();", tab_lecture_plan)
+        # description = wait.until(EC.presence_of_element_located((By.ID, "ltPurp"))).text.strip()
+
+        # 학년
+        grade = driver.find_element(By.ID, "openShyr").text.strip()
+        grade = grade.replace("학년", "").strip()
+
+        # 과목 분류
+        course_classification = driver.find_element(By.ID, "submattFgNm").text.strip()
+
+        # 교과목개요 버튼 클릭 -> 교과목개요(국문)
+        tab_outline = waiter.clickable((By.CSS_SELECTOR, "#tab2 button"), "교과목개요 탭 대기")
+        waiter.click(tab_outline, "교과목개요 탭")
+        description = waiter.present((By.ID, "sbjtSmryCtnt"), "교과목개요 표시").text.strip()
+    except:
+        description = ""
+
+    return dept_name, {
+        "grade_semester": f'{grade}-{semester}',
+        "course_classification": course_classification,
+        "name": course_name,
+        "description": description
+    }
+
+
+def crawl_page_dom(driver, waiter, semester):
+    courses = driver.find_elements(By.CSS_SELECTOR, ".course-info-item")
+    return [read_course_dom(driver, waiter, course, semester) for course in courses]
+
+
+# ------------------------------
+# 네트워크 캡처 모드
+# ------------------------------
+def clean_text(value):
+    """응답 JSON 값에서 HTML 태그/엔티티를 걷어내 화면 텍스트와 같은 형태로 만듭니다."""
+    if value is None:
+        return ""
+    text = re.sub(r"<br\s*/?>", "\n", str(value), flags=re.IGNORECASE)
+    text = re.sub(r"<[^>]+>", "", text)
+    return html.unescape(text).strip()
+
+
+def same_text(value, text):
+    """응답 값과 화면 텍스트가 같은지 (HTML / 공백 차이 무시)"""
+    return "".join(clean_text(value).split()) == "".join(str(text).split())
+
+
+def row_name_key(records, names):
+    """목록의 각 행에서 화면 과목명과 순서대로 모두 일치하는 키를 찾습니다. (없으면 None)"""
+    if len(records) != len(names):
+        return None
+    for key in records[0]:
+        if all(same_text(row.get(key), name) for row, name in zip(records, names)):
+            return key
+    return None
+
+
+def find_result_rows(captured, names):
+    """
+    캡처된 응답 중 현재 페이지의 검색 결과 목록을 찾습니다.
+    길이만 같은 다른 목록을 잘못 고르지 않도록, 행의 과목명이 화면 과목명과 순서대로 일치하는 목록만 사용합니다.
+
+    Returns:
+        (검색 결과 행 목록, 과목명 키) - 찾지 못하면 (None, None)
+    """
+    rows, name_key = None, None
+    for entry in captured:
+        payload = parse_json(entry.get("text"))
+        for records in iter_record_lists(payload):
+            key = row_name_key(records, names)
+            if key is not None:
+                rows, name_key = records, key
+    return rows, name_key
+
+
+def learn_detail_templates(captured, row):
+    """
+    첫 과목을 화면으로 열 때 발생한 상세 요청들을 템플릿으로 저장합니다.
+    요청 파라미터 중 검색 결과 행의 값과 같은 것은 과목마다 바뀌는 파라미터로 봅니다.
+    """
+    templates = []
+    for entry in captured:
+        payload = parse_json(entry.get("text"))
+        if payload is None or next(iter_json_records(payload, DETAIL_FIELDS), None) is None:
+            continue
+
+        params = request_params(entry)
+        mapping = {}
+        for param, value in params.items():
+            if value == "":
+                continue
+            # 같은 이름의 키를 우선으로, 없으면 값이 같은 키를 사용
+            same_name = [k for k in row if k.lower() == param.lower() and str(row[k]) == value]
+            same_value = [k for k in row if str(row[k]) == value]
+            if same_name or same_value:
+                mapping[param] = (same_name or same_value)[0]
+
+        if mapping:
+            templates.append((entry, params, mapping))
+
+    return templates
+
+
+def extract_detail_fields(texts, name_key=None):
+    """상세 응답에서 DETAIL_FIELDS 값을 모읍니다. (응답에 과목명이 있으면 "name"으로 함께 반환)"""
+    fields = {}
+    for text in texts:
+        payload = parse_json(text)
+        if payload is None:
+            continue
+        for record in iter_json_records(payload, DETAIL_FIELDS):
+            for key in DETAIL_FIELDS:
+                if key not in fields and record.get(key) not in (None, ""):
+                    fields[key] = clean_text(record[key])
+            if name_key and "name" not in fields and record.get(name_key) not in (None, ""):
+                fields["name"] = clean_text(record[name_key])
+    return fields
+
+
+def fetch_details(driver, waiter, templates, rows, targets, name_key):
+    """상세 요청 템플릿에 targets 과목의 행 값을 채워 재요청하고, 과목별 상세 필드 목록을 반환합니다."""
+    requests = []
+    for i in targets:
+        for entry, params, mapping in templates:
+            course_params = dict(params)
+            course_params.update({param: str(rows[i].get(key, "")) for param, key in mapping.items()})
+            requests.append(with_params(entry, course_params))
+
+    with waiter.step("상세 응답 재요청"):
+        texts = replay_requests(driver, requests)
+
+    return [
+        extract_detail_fields(texts[n * len(templates):(n + 1) * len(templates)], name_key)
+        for n in range(len(targets))
+    ]
+
+
+def detail_matches(fields, name):
+    """상세 응답이 요청한 과목의 것인지 (응답에 과목명이 있으면 화면 과목명과 비교)"""
+    return "deptKorNm" in fields and ("name" not in fields or same_text(fields["name"], name))
+
+
+def verify_templates(driver, waiter, templates, rows, name_key, names, results, checks):
+    """
+    학습한 템플릿으로 화면에서 읽은 과목들을 다시 받아 화면 값과 같은지 확인합니다.
+    (pageNo=1 / rnum=1 처럼 값만 같은 파라미터를 잘못 연결한 경우 두 번째 과목에서 드러남)
+    """
+    for i, fields in zip(checks, fetch_details(driver, waiter, templates, rows, checks, name_key)):
+        dept_name, course = results[i]
+        if not detail_matches(fields, names[i]) or not same_text(fields["deptKorNm"], dept_name):
+            return False
+        if not same_text(fields.get("sbjtSmryCtnt", ""), course["description"]):
+            return False
+    return True
+
+
+def crawl_page_capture(driver, waiter, semester, state):
+    """
+    검색/페이지 이동 응답의 과목 목록과 상세 요청 템플릿으로 현재 페이지를 수집합니다.
+    응답 구조를 알아내지 못하면 None을 반환하고, 호출하는 쪽에서 화면 방식으로 수집합니다.
+    """
+    courses = driver.find_elements(By.CSS_SELECTOR, ".course-info-item")
+    if not courses:
+        return []
+
+    names = [course.find_element(By.CSS_SELECTOR, ".course-name strong").text.strip() for course in courses]
+
+    rows, name_key = find_result_rows(drain_responses(driver), names)
+    if rows is None:
+        print("[capture] 검색 결과 응답을 찾지 못함 → 화면 방식으로 수집")
+        return None
+
+    results = [None] * len(courses)
+
+    # 상세 요청 템플릿이 없으면 첫 과목만 화면으로 열어서 학습
+    if state.get("templates") is None:
+        drain_responses(driver)
+        results[0] = read_course_dom(driver, waiter, courses[0], semester)
+        templates = learn_detail_templates(drain_responses(driver), rows[0])
+
+        # 첫 과목(있으면 두 번째 과목도 화면으로 읽어서)을 템플릿으로 다시 받아 화면 값과 비교
+        if templates:
+            checks = [0, 1] if len(courses) > 1 else [0]
+            if len(checks) > 1:
+                results[1] = read_course_dom(driver, waiter, courses[1], semester)
+            if not verify_templates(driver, waiter, templates, rows, name_key, names, results, checks):
+                print("[capture] 상세 요청 템플릿 검증 실패")
+                templates = []
+
+        state["templates"] = templates
+        if not templates:
+            print("[capture] 상세 요청을 찾지 못함 → 이후 화면 방식으로 수집")
+            return [
+                result if result is not None else read_course_dom(driver, waiter, course, semester)
+                for result, course in zip(results, courses)
+            ]
+        print(f"[capture] 상세 요청 템플릿 {len(templates)}개 학습")
+
+    templates = state["templates"]
+    if not templates:
+        return None
+
+    targets = [i for i in range(len(courses)) if results[i] is None]
+
+    for i, fields in zip(targets, fetch_details(driver, waiter, templates, rows, targets, name_key)):
+        if not detail_matches(fields, names[i]):
+            # 응답이 비정상이거나 다른 과목의 응답이면 이 과목만 화면으로 수집
+            results[i] = read_course_dom(driver, waiter, courses[i], semester)
+            continue
+
+        grade = fields.get("openShyr", "").replace("학년", "").strip()
+        results[i] = (fields["deptKorNm"], {
+            "grade_semester": f'{grade}-{semester}',
+            "course_classification": fields.get("submattFgNm", ""),
+            "name": names[i],
+            "description": fields.get("sbjtSmryCtnt", "")
+        })
+
+    return results
+
+
+def run(mode=MODE):
     # 1. Chrome 실행
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service)
+    driver = create_chrome()
 
     driver.get(url)
-    wait = WebDriverWait(driver, 10)
+    waiter = PageWaiter(driver, 10)
+    capture_state = {}
+
+    # 현재 페이지에 주입하고, 이후 페이지 이동에도 자동으로 설치되도록 등록 (한 번만)
+    if mode == "capture":
+        install_response_capture(driver)
 
     # 2. 검색 조건 설정
     for semester in semesters:
-        data = {university_name: {}}
         JSON_FILE = f"data/raw/seoul_syllabus_{semester}_v2.json"
+        # 페이지 이동은 이어서 재개할 수 없으므로 매 실행마다 새로 기록
+        sink = RecordSink(JSON_FILE, resume=False)
 
         for college in colleges:
-            # 검색 조건 설정 버튼 클릭
-            btn_detail = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button.total-filter-btn")))
-            driver.execute_script("arguments[0].click();", btn_detail)
-            time.sleep(1)
-
-            # 이전학기 검색조건 버튼 클릭
-            if semester == semesters[0] and college == colleges[0]:
-                btn_prev = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button.view-last-semester-btn")))
-                driver.execute_script("arguments[0].click();", btn_prev)
-                time.sleep(1)
-
-                # 학사 선택
-                degree_select = Select(driver.find_element(By.ID, "hSrchCptnCorsFg"))
-                degree_select.select_by_visible_text("학사")
-                time.sleep(1)
-
-                # 교과 선택
-                driver.find_element(By.CSS_SELECTOR, "input[value='B']").click()  # 전필
-                driver.find_element(By.CSS_SELECTOR, "input[value='C']").click()  # 전선
-                time.sleep(1)
-
-            # 학기 선택
-            semester_select = Select(driver.find_element(By.ID, "hSrchOpenShtm"))
-            semester_select.select_by_visible_text(f"{semester}학기")
-            time.sleep(1)
-
-            # 단과대학 선택
-            college_select = Select(driver.find_element(By.ID, "hSrchOpenUpDeptCd"))
-            college_select.select_by_visible_text(college)
-            time.sleep(1)
-
-            # 검색 버튼 클릭
-            search_btn = driver.find_element(By.CSS_SELECTOR, ".filter-submit-btn")
-            driver.execute_script("arguments[0].click();", search_btn)
-            time.sleep(1)
+            first = semester == semesters[0] and college == colleges[0]
+            set_search_conditions(driver, waiter, semester, college, first)
 
             previous_page = None
 
@@ -73,77 +352,30 @@ def run():
                     break
 
                 # 현재 페이지 과목 목록
-                courses = driver.find_elements(By.CSS_SELECTOR, ".course-info-item")
-                
-                for course in courses:
-                    # 과목명
-                    course_name = course.find_element(By.CSS_SELECTOR, ".course-name strong").text.strip()
-
-                    # 과목 리스트 클릭
-                    detail_btn = course.find_element(By.CSS_SELECTOR, "a.course-info-detail")
-                    driver.execute_script("arguments[0].click();", detail_btn)
-                    time.sleep(1)
-
-                    # 학과명
-                    dept_name = driver.find_element(By.ID, "deptKorNm").text.strip()
-
-                    try:
-                        # 강의계획서 버튼 클릭 -> 수업 목표
-                        # tab_lecture_plan = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#tab3 button")))
-                        # driver.execute_script("arguments[0].click();", tab_lecture_plan)
-                        # description = wait.until(EC.presence_of_element_located((By.ID, "ltPurp"))).text.strip()
-
-                        # 학년
-                        grade = driver.find_element(By.ID, "openShyr").text.strip()
-                        grade = grade.replace("학년", "").strip()
-                        
-                        # 과목 분류
-                        course_classification = driver.find_element(By.ID, "submattFgNm").text.strip()
-                        
-                        # 교과목개요 버튼 클릭 -> 교과목개요(국문)
-                        tab_outline = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#tab2 button")))
-                        driver.execute_script("arguments[0].click();", tab_outline)
-                        description = wait.until(EC.presence_of_element_located((By.ID, "sbjtSmryCtnt"))).text.strip()
-                    except:
-                        description = ""
-
-                    # JSON 구조
-                    if college not in data[university_name]:
-                        data[university_name][college] = {}
-                    if dept_name not in data[university_name][college]:
-                        data[university_name][college][dept_name] = []
-
-                    data[university_name][college][dept_name].append({
-                        "grade_semester": f'{grade}-{semester}',
-                        "course_classification": course_classification,
-                        "name": course_name,
-                        "description": description
-                    })
-
-                    print(f'{grade}-{semester}')
-                    print(course_classification)
+                page_results = None
+                if mode == "capture":
+                    page_results = crawl_page_capture(driver, waiter, semester, capture_state)
+                if page_results is None:
+                    page_results = crawl_page_dom(driver, waiter, semester)
+
+                for dept_name, course in page_results:
+                    # JSON 구조 (대학 / 단과대학 / 학과)
+                    sink.add((university_name, college, dept_name), course)
+
+                    print(course["grade_semester"])
+                    print(course["course_classification"])
 
                 # 다음 페이지 클릭
-                next_page = driver.find_elements(By.CSS_SELECTOR, f'.cc-paging a.num[href*="fnGotoPage({current_page + 1})"]')
-                if next_page:
-                    driver.execute_script("arguments[0].click();", next_page[0])
-                else:
-                    next_arrow = driver.find_element(By.CSS_SELECTOR, ".cc-paging a.arrow.next")
-                    if "disabled" in next_arrow.get_attribute("class"):
-                        previous_page = current_page
-                        continue 
-                    else:
-                        driver.execute_script("arguments[0].click();", next_arrow)
-                
-                time.sleep(1)
+                if not go_next_page(driver, waiter, current_page):
+                    break
+
                 previous_page = current_page
-                    
+
         # 4. 학기별 JSON 저장
-        with open(JSON_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-            print('저장: ', JSON_FILE)
+        sink.finalize(indent=4)
 
+    waiter.report()
     driver.quit()
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    run()
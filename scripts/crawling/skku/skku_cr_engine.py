@@ -0,0 +1,264 @@
+"""
+성균관대학교 교육과정 크롤러 (offset 페이지 공통 엔진)
+
+학과 홈페이지의 교육과정 표는 서버에서 렌더링된 정적 HTML이고,
+과목 설명은 과목 행 바로 아래의 숨겨진 행에 이미 들어 있습니다.
+그래서 브라우저로 과목마다 클릭해서 펼치는 대신
+?pager.offset=N&lang=All 페이지를 HTTP로 받아 BeautifulSoup으로 파싱합니다.
+
+- SOURCES: 출력 파일별 학과 → URL 표
+- 학과들과 offset 페이지들을 동시에 요청 (OFFSET_WINDOW개씩 미리 요청하고 마지막 페이지에서 중단)
+- 학과 수집이 끝날 때마다 JSONL에 기록하고, 재실행 시 완료된 학과는 건너뜀
+
+환경변수
+- SKKU_SOURCES: 수집할 출력 묶음 (쉼표 구분, 기본값: 전체) 예) sw,ice
+- SKKU_CONCURRENCY: 동시 요청 수 (기본값: 8)
+"""
+
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+from bs4 import BeautifulSoup
+
+# scripts/crawling 공용 모듈 사용
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from http_client import get_client
+from record_sink import RecordSink
+
+UNIVERSITY = "성균관대학교"
+
+PAGE_SIZE = 30
+MAX_OFFSET = 10000
+OFFSET_WINDOW = 4
+CONCURRENCY = int(os.getenv("SKKU_CONCURRENCY", "8"))
+
+# ============================================
+# 학과 → URL 표
+#   college가 None이면 학과 목록을 대학 바로 아래에 둠 (예: "융합생명공학과": [...])
+#   layout: "offset" = 과목 행 + 설명 행 2줄 구조, "simple" = 설명 없는 단일 페이지 표
+# ============================================
+
+SOURCES = {
+    "biotech": {
+        "output": "skku_biotech_skb_courses_last.json",
+        "departments": [
+            ("생명공학대학", "식품생명공학과", "https://biotech.skku.edu/biotech/course/food_curriculum.do"),
+            ("생명공학대학", "바이오메카트로닉스학과", "https://biotech.skku.edu/biotech/course/bio_curriculum.do"),
+            (None, "융합생명공학과", "https://skb.skku.edu/gene/under/under_curriculum.do"),
+        ],
+    },
+    "cscience": {
+        "output": "skku_natural_science_courses_last.json",
+        "departments": [
+            ("자연과학대학", "생명과학과", "https://cscience.skku.edu/cscience/undergraduate/bio_curiculum.do"),
+            ("자연과학대학", "수학과", "https://cscience.skku.edu/cscience/undergraduate/math_curiculum.do"),
+            ("자연과학대학", "물리학과", "https://cscience.skku.edu/cscience/undergraduate/physics_curiculum.do"),
+            ("자연과학대학", "화학과", "https://cscience.skku.edu/cscience/undergraduate/chem_curiculum.do"),
+        ],
+    },
+    "enc": {
+        "output": "skku_enc_last.json",
+        "name_key": "subject",
+        "indent": 2,
+        "table": "table.skku-table.small.toggle",
+        "desc_separator": " ",
+        "departments": [
+            ("공과대학", "신소재공학부", "https://enc.skku.edu/enc/under_materials_curriculum.do"),
+            ("공과대학", "기계공학부", "https://enc.skku.edu/enc/under_mechanical_curriculum.do"),
+            ("공과대학", "건설환경공학부", "https://enc.skku.edu/enc/under_construction_curriculum.do"),
+            ("공과대학", "시스템경영공학과", "https://enc.skku.edu/enc/under_system_curriculum.do"),
+            ("공과대학", "건축학과(건축학계열)", "https://enc.skku.edu/enc/under_arch_curriculum.do"),
+            ("공과대학", "나노공학과", "https://enc.skku.edu/enc/under_nano_curriculum.do"),
+            ("공과대학", "양자정보공학과", "https://enc.skku.edu/enc/under_quantum_curriculum.do"),
+        ],
+    },
+    "ice": {
+        "output": "skku_ice_sce_courses_last.json",
+        "departments": [
+            ("정보통신대학", "전자전기공학부", "https://ice.skku.edu/ice/dept_eee_course.do"),
+            ("정보통신대학", "반도체시스템공학과", "https://ice.skku.edu/ice/dept_semi_course.do"),
+            ("정보통신대학", "소재부품융합공학과", "https://ice.skku.edu/ice/dept_mcce_course.do"),
+            (None, "반도체융합공학과", "https://sce.skku.edu/sce/dept_curriculum.do", "simple"),
+        ],
+    },
+    "sw": {
+        "output": "skku_sw_courses_last.json",
+        "departments": [
+            ("소프트웨어융합대학", "소프트웨어학과", "https://sw.skku.edu/sw/under_sw_curriculum.do"),
+            ("소프트웨어융합대학", "컴퓨터공학과", "https://sw.skku.edu/sw/under_computer_curriculum.do"),
+            ("소프트웨어융합대학", "글로벌융합학부", "https://sw.skku.edu/sw/under_global_curriculum.do"),
+            ("소프트웨어융합대학", "지능형소프트웨어학과", "https://sw.skku.edu/sw/under_intelli_curriculum.do"),
+        ],
+    },
+}
+
+
+# ============================================
+# 파싱
+# ============================================
+
+def is_subject_row(row) -> bool:
+    tds = row.find_all("td", recursive=False)
+    return len(tds) >= 2 and tds[1].find("a") is not None
+
+
+def parse_offset_page(html, source) -> List[Dict]:
+    """
+    과목 행(2번째 칸에 링크) 다음의 설명 행을 함께 읽습니다.
+    이수학년은 7번째 칸, 설명 행이 없으면 빈 문자열
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    tables = soup.select(source.get("table", "table"))
+    rows = [row for table in tables for row in table.select("tbody > tr")]
+
+    name_key = source.get("name_key", "name")
+    separator = source.get("desc_separator", "\n")
+    subjects = []
+
+    for i, row in enumerate(rows):
+        if not is_subject_row(row):
+            continue
+
+        tds = row.find_all("td", recursive=False)
+        name = tds[1].find("a").get_text(strip=True)
+        grade_year = tds[6].get_text(strip=True) if len(tds) > 6 else ""
+
+        desc = ""
+        if i + 1 < len(rows) and not is_subject_row(rows[i + 1]):
+            desc_td = rows[i + 1].find("td")
+            if desc_td:
+                desc = desc_td.get_text(separator, strip=True)
+
+        if name_key == "subject":
+            subjects.append({"subject": name, "grade_year": grade_year, "description": desc})
+        else:
+            subjects.append({"grade_year": grade_year, "name": name, "description": desc})
+
+    return subjects
+
+
+def parse_simple_page(html, source) -> List[Dict]:
+    """설명 없이 과목 행만 있는 표 (SCE)"""
+    soup = BeautifulSoup(html, "html.parser")
+    subjects = []
+
+    for row in soup.select("table tbody tr"):
+        tds = row.find_all("td")
+        if len(tds) < 7:
+            continue
+
+        subjects.append({
+            "grade_year": tds[6].get_text(strip=True),
+            "name": tds[1].get_text(strip=True),
+            "description": ""
+        })
+
+    return subjects
+
+
+# ============================================
+# 요청
+# ============================================
+
+def fetch_page(url, offset=None) -> str:
+    params = None if offset is None else {"pager.offset": offset, "lang": "All"}
+    res = get_client().get(url, params=params, timeout=15)
+    res.raise_for_status()
+    return res.text
+
+
+async def crawl_department(loop, executor, semaphore, source, dept_name, url, layout="offset"):
+    async def fetch(offset=None):
+        async with semaphore:
+            return await loop.run_in_executor(executor, fetch_page, url, offset)
+
+    if layout == "simple":
+        subjects = parse_simple_page(await fetch(), source)
+        print(f"[✓] {dept_name}: {len(subjects)}개")
+        return subjects
+
+    name_key = source.get("name_key", "name")
+    all_subjects = []
+    previous_titles = None
+    offset = 0
+
+    while offset <= MAX_OFFSET:
+        # 다음 OFFSET_WINDOW개 페이지를 미리 동시에 요청하고, 순서대로 확인하다가 마지막 페이지에서 중단
+        window = [offset + k * PAGE_SIZE for k in range(OFFSET_WINDOW)]
+        pages = await asyncio.gather(*(fetch(o) for o in window))
+
+        for page_offset, html in zip(window, pages):
+            subjects = parse_offset_page(html, source)
+            titles = [s[name_key] for s in subjects]
+
+            # 과목이 없거나 이전 페이지와 같으면 마지막 페이지
+            if not subjects or titles == previous_titles:
+                print(f"[✓] {dept_name}: {len(all_subjects)}개 (offset {page_offset}에서 종료)")
+                return all_subjects
+
+            previous_titles = titles
+            all_subjects.extend(subjects)
+
+        offset = window[-1] + PAGE_SIZE
+
+    print(f"→ {dept_name}: offset 비정상 증가, 강제 종료")
+    return all_subjects
+
+
+def dept_path(college, dept_name):
+    # college가 None이면 학과 목록을 대학 바로 아래에 둠
+    return (UNIVERSITY, dept_name) if college is None else (UNIVERSITY, college, dept_name)
+
+
+async def crawl_sources_async(source_names, concurrency=CONCURRENCY):
+    """선택한 출력 묶음의 모든 학과를 동시에 수집해서 출력 파일별로 저장하고 {출력 이름: 결과 JSON} 을 반환합니다."""
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    sinks = {name: RecordSink(SOURCES[name]["output"]) for name in source_names}
+
+    async def crawl_and_record(sink, source, college, dept_name, url, *layout):
+        unit = "/".join(dept_path(college, dept_name))
+        if sink.is_done(unit):
+            print(f"[✓] {dept_name}: 이전 실행에서 완료됨")
+            return
+        subjects = await crawl_department(loop, executor, semaphore, source, dept_name, url, *layout)
+        sink.add_many(dept_path(college, dept_name), subjects, unit=unit)
+        sink.mark_done(unit)
+
+    jobs = []
+    for source_name in source_names:
+        source, sink = SOURCES[source_name], sinks[source_name]
+        for college, dept_name, url, *layout in source["departments"]:
+            # 과목이 없는 학과도 빈 목록으로 남김
+            sink.ensure(dept_path(college, dept_name))
+            jobs.append(crawl_and_record(sink, source, college, dept_name, url, *layout))
+
+    try:
+        await asyncio.gather(*jobs)
+    finally:
+        executor.shutdown(wait=False)
+
+    results = {}
+    for source_name in source_names:
+        source = SOURCES[source_name]
+        unit_order = ["/".join(dept_path(college, dept_name)) for college, dept_name, *_ in source["departments"]]
+        results[source_name] = sinks[source_name].finalize(indent=source.get("indent", 4), unit_order=unit_order)
+
+    return results
+
+
+def run():
+    source_names = [name.strip() for name in os.getenv("SKKU_SOURCES", ",".join(SOURCES)).split(",") if name.strip()]
+    asyncio.run(crawl_sources_async(source_names))
+
+    print("\n🎉 성균관대학교 교육과정 크롤링 완료!")
+
+
+if __name__ == "__main__":
+    run()
@@ -1,9 +1,14 @@
-import requests
 from urllib.parse import quote
 import json
 import os
+import math
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
+from http_client import get_client
+from crawl_journal import CrawlJournal, journal_path_for
+
 load_dotenv()
 SERVICE_API_KEY = os.getenv("SERVICE_API_KEY")
 
@@ -23,59 +28,153 @@ deg_crse = quote("학사")                                # 학위과정
 scsbjt_status = quote("기존")                           # 학과상태
 schl_se = quote("대학교")                               # 학교구분
 
+NUM_OF_ROWS = 500
+# 2페이지 이후 동시 요청 수
+CONCURRENCY = int(os.getenv("UNIV_API_CONCURRENCY", "8"))
+
 total_data = []
 
-def fetch_all_pages():
-    page = 1
-
-    while True:
-        # HTTP URL 사용
-        URL = (
-            f"{univ_api_url}"
-            f"?serviceKey={encoded_service_key}"
-            f"&pageNo={page}"
-            f"&numOfRows=500"
-            f"&type=json"
-            f"&YR={yr}"
-            f"&LSSN_TERM={lssn_term}"
-            f"&DEG_CRSE_CRS_NM={deg_crse}"
-            f"&SCSBJT_STTS_NM={scsbjt_status}"
-            f"&SCHL_SE_NM={schl_se}"
-        )
-
-        # API 호출
-        response = requests.get(URL, timeout=15)
+def is_valid_response(response):
+    """data.go.kr는 인증키 오류 / 할당량 초과도 200으로 응답하므로 resultCode까지 확인 (오류 응답은 캐시하지 않음)"""
+    try:
+        data = response.json()
+    except ValueError:
+        return False
+    header = data.get("response", {}).get("header", {})
+    return header.get("resultCode") in ("00", "0") and "body" in data["response"]
+
+def fetch_page(page):
+    """한 페이지를 요청해서 (totalCount, items)를 반환합니다."""
+    # HTTP URL 사용
+    URL = (
+        f"{univ_api_url}"
+        f"?serviceKey={encoded_service_key}"
+        f"&pageNo={page}"
+        f"&numOfRows={NUM_OF_ROWS}"
+        f"&type=json"
+        f"&YR={yr}"
+        f"&LSSN_TERM={lssn_term}"
+        f"&DEG_CRSE_CRS_NM={deg_crse}"
+        f"&SCSBJT_STTS_NM={scsbjt_status}"
+        f"&SCHL_SE_NM={schl_se}"
+    )
+
+    # API 호출
+    response = get_client().get(URL, timeout=15, validate=is_valid_response)
+    try:
+        data = response.json()
+    except ValueError:
+        print("[ERROR] JSON 파싱 실패")
+        print(response.text)
+        raise RuntimeError(f"페이지 {page} 응답을 JSON으로 파싱하지 못했습니다.")
+
+    if not is_valid_response(response):
+        header = data.get("response", {}).get("header", {})
+        raise RuntimeError(f"페이지 {page} API 오류: {header.get('resultCode')} {header.get('resultMsg')}")
+
+    # items 가져오기
+    body = data.get("response", {}).get("body", {})
+    items_wrapper = body.get("items", {})
+    items = items_wrapper.get("item", []) if isinstance(items_wrapper, dict) else items_wrapper
+
+    total_count = int(body.get("totalCount") or 0)
+
+    print(f"[INFO] 페이지 {page} 아이템 수: {len(items)}")
+
+    return total_count, items
+
+
+async def iter_pages(journal, concurrency=CONCURRENCY):
+    """
+    1페이지에서 totalCount를 읽고, 나머지 페이지를 동시에 요청합니다.
+    저널에 기록된 페이지는 다시 요청하지 않고 저널에서 꺼내며,
+    도착 순서와 관계없이 페이지 번호 순서대로 (page, items)를 yield 합니다.
+    """
+    loop = asyncio.get_running_loop()
+
+    def fetch_and_record(page):
+        total_count, page_items = fetch_page(page)
+        journal.append(page, {"totalCount": total_count, "items": page_items})
+        return total_count, page_items
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        if 1 in journal:
+            total_count, items = journal.get(1)["totalCount"], journal.get(1)["items"]
+        else:
+            total_count, items = await loop.run_in_executor(executor, fetch_and_record, 1)
+        last_page = max(1, math.ceil(total_count / NUM_OF_ROWS))
+        print(f"[INFO] totalCount: {total_count} → 총 {last_page} 페이지")
+        yield 1, items
+
+        # 이전 실행에서 완료된 페이지는 저널에서 바로 사용
+        pending_pages = {
+            page: journal.get(page)["items"]
+            for page in range(2, last_page + 1)
+            if page in journal
+        }
+        if pending_pages:
+            print(f"[INFO] 저널에서 {len(pending_pages)}개 페이지 복원")
+
+        async def fetch(page):
+            _, page_items = await loop.run_in_executor(executor, fetch_and_record, page)
+            return page, page_items
+
+        tasks = [
+            asyncio.create_task(fetch(page))
+            for page in range(2, last_page + 1)
+            if page not in pending_pages
+        ]
+
+        # 먼저 도착한 뒤쪽 페이지는 앞 페이지가 올 때까지 보관
+        next_page = 2
         try:
-            data = response.json()
-        except ValueError:
-            print("[ERROR] JSON 파싱 실패")
-            print(response.text)
-            exit()
+            while next_page in pending_pages:
+                yield next_page, pending_pages.pop(next_page)
+                next_page += 1
 
-        # items 가져오기
-        body = data.get("response", {}).get("body", {})
-        items_wrapper = body.get("items", {})
-        items = items_wrapper.get("item", []) if isinstance(items_wrapper, dict) else items_wrapper
+            for task in asyncio.as_completed(tasks):
+                page, page_items = await task
+                pending_pages[page] = page_items
 
-        print(f"[INFO] 총 아이템 수: {len(items)}")
+                while next_page in pending_pages:
+                    yield next_page, pending_pages.pop(next_page)
+                    next_page += 1
+        finally:
+            for task in tasks:
+                task.cancel()
 
-        # 더이상 데이터가 없으면 종료
-        if not items:
-            print(f"[INFO] 페이지 {page}에서 item 0개")
-            break
 
-        total_data.extend(items)
-        page += 1
+def fetch_all_pages(journal, concurrency=CONCURRENCY):
+    async def collect():
+        async for _, items in iter_pages(journal, concurrency):
+            total_data.extend(items)
 
+    asyncio.run(collect())
     return total_data
 
-# JSON 저장
-def save_json(filename="data/raw/univ_data_detail.json"):
-    univ_data = fetch_all_pages()
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(univ_data, f, ensure_ascii=False, indent=2)
-
-    print(f"JSON 저장 완료: {filename}")
+# JSON 저장 (페이지가 도착하는 대로 임시 파일에 이어서 기록하고, 배열을 닫은 뒤 교체)
+def save_json(filename="data/raw/univ_data_detail.json", concurrency=CONCURRENCY):
+    tmp_filename = filename + ".tmp"
+
+    async def stream(journal):
+        count = 0
+        with open(tmp_filename, "w", encoding="utf-8") as f:
+            f.write("[")
+            async for page, items in iter_pages(journal, concurrency):
+                for item in items:
+                    item_json = json.dumps(item, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+                    f.write(("," if count else "") + "\n  " + item_json)
+                    count += 1
+                f.flush()
+            f.write("\n]" if count else "]")
+        return count
+
+    with CrawlJournal(journal_path_for(filename)) as journal:
+        count = asyncio.run(stream(journal))
+        # 중간에 실패하면 기존 파일은 그대로 두고 저널로 이어서 받음
+        os.replace(tmp_filename, filename)
+        journal.discard()
+    print(f"JSON 저장 완료: {filename} ({count}개)")
 
 if __name__ == "__main__":
-    save_json()
\ No newline at end of file
+    save_json()
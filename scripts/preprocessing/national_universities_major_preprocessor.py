@@ -1,6 +1,12 @@
-import json
 import pandas as pd
-import glob, os
+import glob, os, sys
+from pathlib import Path
+
+# preprocess 공용 모듈 사용
+sys.path.append(str(Path(__file__).resolve().parents[2] / "preprocess"))
+from course_record import Course
+from course_stream import iter_json_items
+from json_io import write_json
 
 '''
 기존 JSON 구조
@@ -42,6 +48,9 @@ import glob, os
 file_path = 'data/raw/national_universities/*.json'
 all_files = glob.glob(file_path)
 
+# 저장 형식: pretty(기본, 들여쓰기 4) / compact / zstd (json_io.py)
+OUTPUT_FORMAT = os.getenv("PREPROCESS_OUTPUT_FORMAT", "pretty")
+
 # 파일 저장명 맵핑
 NAME = {
     "강원대학교":"gangwon",
@@ -54,51 +63,49 @@ NAME = {
     "충북대학교":"chungbook",
 }
 
-data = {}
+# 전처리 함수 (원본 파일을 통째로 읽지 않고 학과 단위로 스트리밍)
+def preprocess_file(file):
+  university_data = {}
+
+  for keys, dept_data in iter_json_items(file, 2):
+      if not keys:
+          continue
+      college = sys.intern(keys[0])
+      if college not in university_data:
+          university_data[college] = {}
+      # 학과가 없는 단과대학
+      if len(keys) < 2:
+          continue
+
+      dept_name = sys.intern(keys[1])
+      if dept_name not in university_data[college]:
+          university_data[college][dept_name] = []
+
+          for subject_name, syllabus_list in dept_data.items():
+              if syllabus_list:
+                syllabus_detail = syllabus_list[0]
+
+                grade = str(syllabus_detail.get("학년", ""))
+                semester = str(syllabus_detail.get("학기", ""))
+                course_classification = str(syllabus_detail.get("과목구분", ""))
+                description = str(syllabus_detail.get("학습목표", ""))
+
+                university_data[college][dept_name].append(Course(
+                    grade_semester=f'{grade}-{semester}',
+                    course_classification=course_classification,
+                    name=subject_name,
+                    description=description,
+                ))
+  return university_data
 
-# 전처리 함수                            
 def preprocess_data():
   for file in all_files:
-    # 파일 로드
     university_name = os.path.basename(file).split('.')[0]
-  
-    with open(file, 'r', encoding='utf-8') as f:
-        content = json.load(f)
-        
-    if university_name not in data:
-        data[university_name] = {}
-
-    for college, college_data in content.items():
-        if college not in data[university_name]:
-            data[university_name][college] = {}
-
-        for dept_name, dept_data in college_data.items():
-            if dept_name not in data[university_name][college]:
-                data[university_name][college][dept_name] = []
-
-                for subject_name, syllabus_list in dept_data.items():
-                    if syllabus_list:
-                      syllabus_detail = syllabus_list[0]
-
-                      grade = str(syllabus_detail.get("학년", ""))
-                      semester = str(syllabus_detail.get("학기", ""))
-                      course_classification = str(syllabus_detail.get("과목구분", ""))
-                      description = str(syllabus_detail.get("학습목표", ""))
-                  
-                      data[university_name][college][dept_name].append({
-                          "grade_semester": f'{grade}-{semester}',
-                          "course_classification": course_classification,
-                          "name": subject_name,
-                          "description": description
-                      })
-  return data
-
-# 학교마다 JSON 저장
-def run():
-    processed_data = preprocess_data()
-    print(processed_data)
+    yield university_name, preprocess_file(file)
 
-    for university_ko_name, university_data in processed_data.items():
+# 학교마다 JSON 저장 (한 학교씩 처리하고 저장)
+def run():
+    for university_ko_name, university_data in preprocess_data():
         university_en_name = NAME.get(university_ko_name, 'unknown')
         JSON_FILE = f"./data/preprocessed/{university_en_name}_syllabus.json"
 
@@ -106,9 +113,8 @@ def run():
           university_ko_name: university_data
         }
 
-        with open(JSON_FILE, "w", encoding="utf-8") as f:
-            json.dump(final_data_to_save, f, ensure_ascii=False, indent=4)
-            print('저장: ', JSON_FILE)
+        saved_path = write_json(final_data_to_save, JSON_FILE, OUTPUT_FORMAT, indent=4)
+        print('저장: ', saved_path)
 
 if __name__ == "__main__":
     run()
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# preprocess 모듈은 스크립트 폴더에서 바로 import 하는 구조라 경로를 추가
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "preprocess"))
@@ -0,0 +1,31 @@
+import pytest
+
+from course_record import Course
+from course_table import COLUMNS, export_course_table, read_course_table
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.mark.parametrize("table_format", ["parquet", "arrow"])
+def test_semesters_round_trip(tmp_path, table_format):
+    all_data = {
+        "한양대학교": {
+            "공과대학": {
+                "컴퓨터소프트웨어학부": [
+                    Course("자료구조", "2-1", "전공필수", "리스트, 트리", semesters=("2-1", "2-2")),
+                    {"grade_semester": "3-1", "course_classification": "전공선택", "name": "운영체제", "description": ""},
+                ],
+            },
+        },
+    }
+
+    path = export_course_table(all_data, tmp_path / "courses", table_format)
+    table = read_course_table(path)
+
+    assert table.column_names == COLUMNS
+    assert table.schema.field("semesters").type == pa.list_(pa.string())
+    assert table.column("semesters").to_pylist() == [["2-1", "2-2"], None]
+    assert read_course_table(path, ["name", "semesters"]).to_pylist() == [
+        {"name": "자료구조", "semesters": ["2-1", "2-2"]},
+        {"name": "운영체제", "semesters": None},
+    ]
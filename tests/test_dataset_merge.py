@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from dataset_merge import merge_university, source_files
+from json_io import write_json as write_output
+from merge_cache import MergeManifest
+
+
+def write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def test_merge_sungkyunkwan_subject_key(tmp_path):
+    # skku_cr_engine SOURCES["enc"] 출력: 과목명이 subject 키
+    write_json(tmp_path / "sungkyunkwan" / "skku_enc.json", {
+        "성균관대학교": {
+            "정보통신대학": {
+                "전자전기공학부": [
+                    {"subject": "회로이론", "grade_year": "2", "description": "기초 회로"},
+                ],
+            },
+        },
+    })
+
+    tree, hits = merge_university(tmp_path, "sungkyunkwan")
+
+    [course] = tree["성균관대학교"]["정보통신대학"]["전자전기공학부"]
+    assert course.to_dict() == {
+        "grade_semester": "2",
+        "course_classification": "",
+        "name": "회로이론",
+        "description": "기초 회로",
+    }
+    assert hits["rename:subject->name"] == 1
+
+
+def test_merge_reads_zstd_only_sources(tmp_path):
+    pytest.importorskip("zstandard")
+    write_output({
+        "부산대학교": {"공과대학": {"기계공학부": [{"grade_semester": "1-1", "name": "정역학"}]}},
+    }, tmp_path / "busan" / "busan_syllabus.json", "zstd")
+    write_output([{"grade_semester": "2-1", "category": "전공필수", "name": "자료구조"}],
+                 tmp_path / "hongik" / "hongik_컴퓨터공학.json", "zstd")
+
+    busan, _ = merge_university(tmp_path, "busan")
+    hongik, _ = merge_university(tmp_path, "hongik")
+
+    assert [c.name for c in busan["부산대학교"]["공과대학"]["기계공학부"]] == ["정역학"]
+    [course] = hongik["홍익대학교"]["공과대학"]["컴퓨터공학"]
+    assert course.course_classification == "전공필수"
+
+    # 캐시 fingerprint도 병합이 읽는 .zst 파일을 기준으로 계산
+    manifest = MergeManifest(tmp_path / "cache", "test")
+    files = manifest.fingerprint("busan", source_files(tmp_path, "busan"))
+    assert list(files) == ["busan_syllabus.json.zst"]
+
+
+def test_unchanged_rerun_reuses_previous_output(tmp_path, monkeypatch, capsys):
+    import dataset_merge
+
+    write_json(tmp_path / "busan" / "busan_syllabus.json", {
+        "부산대학교": {"공과대학": {"기계공학부": [{"grade_semester": "1-1", "name": "정역학"}]}},
+    })
+    output_path = tmp_path / "merged.json"
+    dataset_merge.merge_all_universities(tmp_path, output_path, table_format=None, workers=1)
+    mtime = output_path.stat().st_mtime_ns
+
+    # 입력이 그대로면 shard 디코딩 / 출력 저장 없이 끝나야 함
+    def fail(*args, **kwargs):
+        raise AssertionError("이전 출력을 재사용해야 합니다.")
+
+    monkeypatch.setattr(dataset_merge, "decode_tree", fail)
+    monkeypatch.setattr(dataset_merge, "write_json", fail)
+    dataset_merge.merge_all_universities(tmp_path, output_path, table_format=None, workers=1)
+    assert output_path.stat().st_mtime_ns == mtime
+    assert "이전 병합 결과를 그대로 사용" in capsys.readouterr().out
+
+    # 출력 파일이 없어지면 다시 만듦
+    monkeypatch.undo()
+    output_path.unlink()
+    dataset_merge.merge_all_universities(tmp_path, output_path, table_format=None, workers=1)
+    assert json.loads(output_path.read_text(encoding="utf-8"))["부산대학교"]["공과대학"]["기계공학부"][0]["name"] == "정역학"
@@ -0,0 +1,22 @@
+import pytest
+
+from department_index import DepartmentIndex, normalize_department
+
+
+@pytest.mark.parametrize("stem", ["인공지능", "소프트웨어", "컴퓨터공학", "경영학"])
+def test_suffix_variants_share_key(stem):
+    keys = {normalize_department(stem + suffix) for suffix in ("학과", "학부", "전공")}
+    assert len(keys) == 1
+
+
+def test_short_names_keep_their_stem():
+    assert normalize_department("수학과") == normalize_department("수학전공") == "수학"
+
+
+def test_lookup_joins_variants():
+    index = DepartmentIndex.build([
+        ("A대학교", "공과대학", "인공지능학과"),
+        ("B대학교", "공과대학", "인공지능전공"),
+        ("C대학교", "IT대학", "컴퓨터학부(인공지능학부)"),
+    ])
+    assert index.universities("인공지능학부") == ["A대학교", "B대학교", "C대학교"]
@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+from json_io import department_samples, find_json_files, load_json, save_dictionary, train_dictionary, write_json
+
+pytest.importorskip("zstandard")
+
+
+def make_tree(seed):
+    return {
+        "대학교": {
+            "공과대학": {
+                f"{seed}학과{i}": [
+                    {"grade_semester": f"{i % 4 + 1}-1", "name": f"과목{i}-{j}", "description": f"{seed} 과목 설명 {i} {j} 입니다."}
+                    for j in range(5)
+                ]
+                for i in range(200)
+            },
+        },
+    }
+
+
+def test_zstd_dictionary_is_overwritten(tmp_path):
+    for seed in ("전자", "기계"):
+        tree = make_tree(seed)
+        dictionary = train_dictionary(department_samples(tree))
+        save_dictionary(dictionary, tmp_path)
+        path = write_json(tree, tmp_path / "merged.json", "zstd", dictionary=dictionary)
+
+        assert [p.name for p in tmp_path.glob("*.zdict")] == ["courses.zdict"]
+        assert load_json(path) == tree
+
+
+def test_find_json_files_loads_one_file_per_stem(tmp_path):
+    tree = {"대학교": {"공과대학": {"기계공학과": [{"name": "동역학"}]}}}
+    for name in ("a_syllabus.json", "b_syllabus.json"):
+        os.utime(write_json(tree, tmp_path / name, "compact"), (1000, 1000))
+    # a는 압축 파일이 더 최근, b는 수정 시각이 같음
+    os.utime(write_json(tree, tmp_path / "a_syllabus.json", "zstd"), (2000, 2000))
+    os.utime(write_json(tree, tmp_path / "b_syllabus.json", "zstd"), (1000, 1000))
+    (tmp_path / "c_syllabus.json.tmp").write_text("[")
+
+    files = find_json_files(tmp_path, "*_syllabus*.json*")
+
+    assert [p.name for p in files] == ["a_syllabus.json.zst", "b_syllabus.json"]